@@ -0,0 +1,55 @@
+import time
+from benchmarks.synthetic import generate_transfers, load_schema
+from catcodec.BatchDecoder import BatchDecoder
+from catcodec.SchemaDecoder import SchemaDecoder
+
+FIELD_NAMES = ['signer', 'fee', 'deadline', 'recipient', 'mosaics']
+
+
+def decode_rows(decoder, transfers):
+    # one dict per transaction, which is then reduced to the columns of interest
+    columns = {'fee': [], 'deadline': [], 'signer': [], 'recipient': [], 'amounts': [], 'parents': []}
+    for index, transfer in enumerate(transfers):
+        values = decoder.decode('TransferTransaction', transfer)
+        for name in ['fee', 'deadline', 'signer', 'recipient']:
+            columns[name].append(values[name])
+
+        for mosaic in values['mosaics']:
+            columns['amounts'].append(mosaic['amount'])
+            columns['parents'].append(index)
+
+    return columns
+
+
+def measure(name, decode, transfers):
+    elapsed_times = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        decode(transfers)
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    elapsed_time = min(elapsed_times)
+    print('{0:>14}: {1:8.2f}ms ({2:9.0f} tx/s)'.format(name, elapsed_time * 1000, len(transfers) / elapsed_time))
+
+
+def main():
+    transfers = generate_transfers(100000)
+    type_descriptors = load_schema('transfer/transfer')
+    decoder = SchemaDecoder(type_descriptors)
+    batch_decoder = BatchDecoder(type_descriptors, 'TransferTransaction', FIELD_NAMES)
+    print('decoding {0} of {1} transfers'.format(', '.join(FIELD_NAMES), len(transfers)))
+
+    # sanity: both decoders must produce identical columns
+    rows = decode_rows(decoder, transfers)
+    columns = batch_decoder.decode(transfers)
+    assert rows['fee'] == columns['fee'].tolist()
+    assert rows['recipient'] == [bytes(recipient) for recipient in columns['recipient']]
+    assert rows['amounts'] == columns['mosaics']['amount'].tolist()
+    assert rows['parents'] == columns['mosaics_parents'].tolist()
+
+    measure('row decode', lambda transfers: decode_rows(decoder, transfers), transfers)
+    measure('columnar', batch_decoder.decode, transfers)
+
+
+if __name__ == '__main__':
+    main()
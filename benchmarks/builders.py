@@ -0,0 +1,40 @@
+import os
+import time
+from benchmarks.synthetic import generate_transaction_schema_lines
+from catparser.CatsParser import CatsParser
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.cpp_builder.HintCache import Hints
+
+
+def parse_synthetic_schema(num_transactions):
+    parser = CatsParser(None)
+    for line in generate_transaction_schema_lines(num_transactions):
+        parser.process_line(line)
+
+    return parser.type_descriptors()
+
+
+def generate(schema, hints, jobs):
+    return list(BuilderGenerator(schema, {'copyright': '', 'hints': hints, 'jobs': jobs}))
+
+
+def main():
+    num_transactions = 400
+    schema = parse_synthetic_schema(num_transactions)
+    hints = Hints({'Synthetic{0}Transaction'.format(index): {'plugin': 'synthetic'} for index in range(num_transactions)})
+    print('generating builders for {0} synthetic transactions (cpus: {1})'.format(num_transactions, os.cpu_count()))
+
+    expected_descriptors = None
+    for jobs in [1, 2, 4, 8]:
+        start_time = time.perf_counter()
+        descriptors = generate(schema, hints, jobs)
+        elapsed_time = time.perf_counter() - start_time
+        print('{0:>12}: {1:8.2f}ms ({2} files)'.format('{0} jobs'.format(jobs), elapsed_time * 1000, len(descriptors)))
+
+        # sanity: parallel generation must produce identical files in identical order
+        expected_descriptors = expected_descriptors or descriptors
+        assert expected_descriptors == descriptors
+
+
+if __name__ == '__main__':
+    main()
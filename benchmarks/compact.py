@@ -0,0 +1,63 @@
+import gc
+import os
+import tracemalloc
+from benchmarks.synthetic import generate_schema_lines
+from catparser.CatsParser import CatsParser
+from catparser.CompactDescriptor import DescriptorInterner, compact_type_descriptors
+from catparser.MultiFileParser import MultiFileParser
+
+SCHEMA_NAMES = [
+    'accountlink/account_link', 'lock_hash/hash_lock', 'lock_secret/secret_lock', 'lock_secret/secret_proof', 'mosaic/mosaic_definition',
+    'mosaic/mosaic_supply_change', 'multisig/modify_multisig_account', 'namespace/address_alias', 'namespace/mosaic_alias',
+    'namespace/register_namespace', 'property/address_property', 'property/mosaic_property', 'property/transaction_type_property',
+    'transfer/transfer'
+]
+
+
+def parse_real_schemas():
+    # each schema is parsed by a separate uncached parser, like a long-running process generating all schemas
+    all_type_descriptors = []
+    for schema_name in SCHEMA_NAMES:
+        file_parser = MultiFileParser()
+        file_parser.set_include_path('schemas')
+        file_parser.parse(os.path.join('schemas', '{0}.cats'.format(schema_name)))
+        all_type_descriptors.append(file_parser.cats_parser.type_descriptors())
+
+    return all_type_descriptors
+
+
+def parse_synthetic_schema():
+    parser = CatsParser(None)
+    for line in generate_schema_lines(400):
+        parser.process_line(line)
+
+    return [parser.type_descriptors()]
+
+
+def measure_retained_memory(parse, compact):
+    gc.collect()
+    tracemalloc.start()
+    all_type_descriptors = parse()
+    if compact:
+        interner = DescriptorInterner()
+        all_type_descriptors = [compact_type_descriptors(type_descriptors, interner) for type_descriptors in all_type_descriptors]
+        del interner
+
+    gc.collect()
+    retained_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del all_type_descriptors
+    return retained_size
+
+
+def main():
+    for name, parse in [('real schemas', parse_real_schemas), ('synthetic schema', parse_synthetic_schema)]:
+        dict_size = measure_retained_memory(parse, False)
+        compact_size = measure_retained_memory(parse, True)
+        print('{0:>16}: dicts {1:9.1f}KiB, compact {2:9.1f}KiB ({3:.1%})'.format(
+            name, dict_size / 1024, compact_size / 1024, compact_size / dict_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import struct
+import time
+from benchmarks.synthetic import generate_transfers, load_schema
+from catcodec.SchemaDecoder import SchemaDecoder
+from generators.py_codec.ModuleGenerator import ModuleGenerator
+
+HEADER = struct.Struct('<I64s32sHHQQ25sHB')
+MOSAIC = struct.Struct('<QQ')
+
+
+def decode_transfer_by_hand(buffer):
+    # equivalent of the hand-written decoders used by services
+    names = ('size', 'signature', 'signer', 'version', 'type', 'fee', 'deadline', 'recipient', 'messageSize', 'mosaicsCount')
+    values = dict(zip(names, HEADER.unpack_from(buffer, 0)))
+    offset = HEADER.size
+    values['message'] = bytes(buffer[offset:offset + values['messageSize']])
+    offset += values['messageSize']
+
+    values['mosaics'] = []
+    for _ in range(values['mosaicsCount']):
+        mosaic_id, amount = MOSAIC.unpack_from(buffer, offset)
+        values['mosaics'].append({'mosaicId': mosaic_id, 'amount': amount})
+        offset += MOSAIC.size
+
+    return values
+
+
+def load_generated_decoder(type_descriptors, type_name):
+    # equivalent of importing the module emitted by the py_codec generator
+    module_globals = {}
+    exec('\n'.join(ModuleGenerator(type_descriptors, {}).generate()), module_globals)  # pylint: disable=exec-used
+    decode_from = module_globals['DECODERS'][type_name]
+    return lambda buffer: decode_from(buffer)[0]
+
+
+def measure(name, decode, transfers):
+    num_bytes = sum(len(transfer) for transfer in transfers)
+    elapsed_time = min(_time(decode, transfers) for _ in range(5))
+    print('{0:>20}: {1:8.2f}ms ({2:9.0f} tx/s, {3:6.1f} MB/s)'.format(
+        name, elapsed_time * 1000, len(transfers) / elapsed_time, num_bytes / elapsed_time / 1e6))
+
+
+def _time(decode, transfers):
+    start_time = time.perf_counter()
+    for transfer in transfers:
+        decode(transfer)
+
+    return time.perf_counter() - start_time
+
+
+def main():
+    transfers = generate_transfers(20000)
+    type_descriptors = load_schema('transfer/transfer')
+    decoder = SchemaDecoder(type_descriptors)
+    decode_generated = load_generated_decoder(type_descriptors, 'TransferTransaction')
+    print('corpus of {0} transfers ({1} bytes)'.format(len(transfers), sum(len(transfer) for transfer in transfers)))
+
+    # sanity: all decoders must produce identical values
+    assert all(decode_transfer_by_hand(transfer) == decoder.decode('TransferTransaction', transfer) for transfer in transfers)
+    assert all(decode_transfer_by_hand(transfer) == decode_generated(transfer) for transfer in transfers)
+
+    measure('hand-written', decode_transfer_by_hand, transfers)
+    measure('SchemaDecoder', lambda transfer: decoder.decode('TransferTransaction', transfer), transfers)
+    measure('py_codec', decode_generated, transfers)
+
+
+if __name__ == '__main__':
+    main()
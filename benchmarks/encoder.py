@@ -0,0 +1,67 @@
+import time
+from benchmarks.decoder import HEADER, MOSAIC
+from benchmarks.synthetic import generate_transfers, load_schema
+from catcodec.SchemaDecoder import SchemaDecoder
+from catcodec.SchemaEncoder import SchemaEncoder
+from generators.py_codec.ModuleGenerator import ModuleGenerator
+
+LARGE_MOSAICS = [{'mosaicId': index, 'amount': index} for index in range(250)]
+
+
+def encode_transfer_by_hand(values):
+    # equivalent of the hand-written encoders used by services, which concatenate packed pieces
+    names = ('size', 'signature', 'signer', 'version', 'type', 'fee', 'deadline', 'recipient')
+    buffer = HEADER.pack(*[values[name] for name in names], len(values['message']), len(values['mosaics']))
+    buffer += values['message']
+    for mosaic in values['mosaics']:
+        buffer += MOSAIC.pack(mosaic['mosaicId'], mosaic['amount'])
+
+    return buffer
+
+
+def load_generated_encoder(type_descriptors, type_name):
+    # equivalent of importing the module emitted by the py_codec generator
+    module_globals = {}
+    exec('\n'.join(ModuleGenerator(type_descriptors, {}).generate()), module_globals)  # pylint: disable=exec-used
+    return module_globals['ENCODERS'][type_name]
+
+
+def measure(name, encode, transfers_values):
+    elapsed_time = min(_time(encode, transfers_values) for _ in range(5))
+    print('{0:>20}: {1:8.2f}ms ({2:9.0f} tx/s)'.format(name, elapsed_time * 1000, len(transfers_values) / elapsed_time))
+
+
+def _time(encode, transfers_values):
+    start_time = time.perf_counter()
+    for values in transfers_values:
+        encode(values)
+
+    return time.perf_counter() - start_time
+
+
+def main():
+    type_descriptors = load_schema('transfer/transfer')
+    decoder = SchemaDecoder(type_descriptors)
+    encoder = SchemaEncoder(type_descriptors)
+    encode_generated = load_generated_encoder(type_descriptors, 'TransferTransaction')
+
+    transfers_values = [decoder.decode('TransferTransaction', transfer) for transfer in generate_transfers(20000)]
+    large_transfers_values = [
+        {**values, 'size': values['size'] + MOSAIC.size * (250 - len(values['mosaics'])), 'mosaics': LARGE_MOSAICS}
+        for values in transfers_values[:2000]
+    ]
+
+    for name, corpus in [('transfers', transfers_values), ('transfers with 250 mosaics', large_transfers_values)]:
+        print('corpus of {0} {1}'.format(len(corpus), name))
+
+        # sanity: all encoders must produce identical transfers
+        assert all(encode_transfer_by_hand(values) == encode_generated(values) for values in corpus)
+        assert all(encode_transfer_by_hand(values) == encoder.encode('TransferTransaction', values) for values in corpus)
+
+        measure('hand-written', encode_transfer_by_hand, corpus)
+        measure('py_codec', encode_generated, corpus)
+        measure('SchemaEncoder', lambda values: encoder.encode('TransferTransaction', values), corpus)
+
+
+if __name__ == '__main__':
+    main()
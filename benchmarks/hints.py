@@ -0,0 +1,54 @@
+import time
+import yaml
+from benchmarks.synthetic import load_schema
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.cpp_builder.HeaderGenerator import HeaderGenerator
+from generators.cpp_builder.HintCache import HintCache, HintLoader
+from generators.cpp_builder.ImplementationGenerator import ImplementationGenerator
+
+SCHEMA_NAMES = [
+    'accountlink/account_link', 'lock_hash/hash_lock', 'lock_secret/secret_lock', 'lock_secret/secret_proof', 'mosaic/mosaic_definition',
+    'mosaic/mosaic_supply_change', 'multisig/modify_multisig_account', 'namespace/address_alias', 'namespace/mosaic_alias',
+    'namespace/register_namespace', 'property/address_property', 'property/mosaic_property', 'property/transaction_type_property',
+    'transfer/transfer'
+]
+
+
+def generate_with_hints_per_generator(schemas, loader):
+    # equivalent of loading all hint files in every header and implementation generator
+    num_files = 0
+    for schema in schemas:
+        for name in schema:
+            if 'Transaction' != name and name.endswith('Transaction') and not name.startswith('Embedded'):
+                for generator_class in [HeaderGenerator, ImplementationGenerator]:
+                    generator_class(schema, {'copyright': '', 'hints': HintCache(loader=loader).get()}, name).generate()
+                    num_files += 1
+
+    return num_files
+
+
+def generate_with_shared_hints(schemas):
+    return sum(len(list(BuilderGenerator(schema, {'copyright': ''}))) for schema in schemas)
+
+
+def measure(name, generate):
+    elapsed_times = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        num_files = generate()
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    print('{0:>36}: {1:8.2f}ms ({2} files)'.format(name, min(elapsed_times) * 1000, num_files))
+
+
+def main():
+    schemas = [load_schema(schema_name) for schema_name in SCHEMA_NAMES]
+    print('generating builders for {0} schemas'.format(len(schemas)))
+
+    measure('hints per generator (SafeLoader)', lambda: generate_with_hints_per_generator(schemas, yaml.SafeLoader))
+    measure('hints per generator ({0})'.format(HintLoader.__name__), lambda: generate_with_hints_per_generator(schemas, HintLoader))
+    measure('shared hints', lambda: generate_with_shared_hints(schemas))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# pylint: disable=too-few-public-methods
+import timeit
+from benchmarks.synthetic import generate_schema_lines
+from catparser.AliasParser import AliasParserFactory
+from catparser.CatsParser import CatsParser
+from catparser.EnumParser import EnumParserFactory
+from catparser.ImportParser import ImportParserFactory
+from catparser.StructParser import StructParserFactory
+
+
+class LinearScanCatsParser(CatsParser):
+    """CATS parser that dispatches lines by scanning all factories, matching each line twice"""
+    def __init__(self, import_resolver):
+        super().__init__(import_resolver)
+        self.type_parser_factories = [AliasParserFactory(), EnumParserFactory(), ImportParserFactory(), StructParserFactory()]
+        self.sub_factories_owner = None
+        self.sub_factories = None
+
+    def _dispatch(self, line_stripped):
+        if not self.active_parser:
+            active_factories = self.type_parser_factories
+        else:
+            # composite parsers used to create their sub-factories upon construction
+            if self.sub_factories_owner is not self.active_parser:
+                self.sub_factories = [type(factory)() for factory in self.active_parser.factories()]
+                self.sub_factories_owner = self.active_parser
+
+            active_factories = self.sub_factories
+
+        factory = next(factory for factory in active_factories if factory.is_match(line_stripped))
+        parser = factory.create()
+        return (parser, parser.process_line(line_stripped))
+
+
+def parse_all(parser_type, lines):
+    parser = parser_type(None)
+    for line in lines:
+        parser.process_line(line)
+
+    return parser.type_descriptors()
+
+
+def main():
+    lines = generate_schema_lines(400)
+    print('synthetic schema with {0} lines'.format(len(lines)))
+
+    # sanity: both parsers must produce identical descriptors
+    assert parse_all(LinearScanCatsParser, lines) == parse_all(CatsParser, lines)
+
+    for parser_type in [LinearScanCatsParser, CatsParser]:
+        elapsed_time = min(timeit.repeat(lambda parser_type=parser_type: parse_all(parser_type, lines), number=1, repeat=5))
+        print('{0:>20}: {1:8.2f}ms ({2:.2f}us/line)'.format(parser_type.__name__, elapsed_time * 1000, elapsed_time * 1e6 / len(lines)))
+
+
+if __name__ == '__main__':
+    main()
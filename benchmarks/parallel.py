@@ -0,0 +1,47 @@
+import os
+import tempfile
+import time
+from benchmarks.synthetic import write_schema_tree
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParallelParser import ParallelParser
+from catparser.ParseCache import ParseCache
+from catparser.SchemaResolver import FileSystemResolver
+
+
+def parse_sequential(directory, filenames):
+    cache = ParseCache()
+    resolver = FileSystemResolver(directory)
+    all_type_descriptors = []
+    for filename in filenames:
+        file_parser = MultiFileParser(cache, resolver)
+        file_parser.parse(filename)
+        all_type_descriptors.append(file_parser.cats_parser.type_descriptors())
+
+    return all_type_descriptors
+
+
+def parse_parallel(directory, filenames, max_workers):
+    return ParallelParser(FileSystemResolver(directory), None, max_workers).parse(filenames)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = write_schema_tree(directory, 16, 60)
+        num_lines = sum(1 for filename in os.listdir(directory) for _ in open(os.path.join(directory, filename)))
+        print('synthetic schema tree with {0} files and {1} lines (cpus: {2})'.format(len(filenames) + 1, num_lines, os.cpu_count()))
+
+        start_time = time.perf_counter()
+        expected_type_descriptors = parse_sequential(directory, filenames)
+        print('{0:>12}: {1:8.2f}ms'.format('sequential', (time.perf_counter() - start_time) * 1000))
+
+        for max_workers in [1, 2, 4, 8]:
+            start_time = time.perf_counter()
+            all_type_descriptors = parse_parallel(directory, filenames, max_workers)
+            print('{0:>12}: {1:8.2f}ms'.format('{0} workers'.format(max_workers), (time.perf_counter() - start_time) * 1000))
+
+            # sanity: parallel parse must produce identical descriptors
+            assert expected_type_descriptors == all_type_descriptors
+
+
+if __name__ == '__main__':
+    main()
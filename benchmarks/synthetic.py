@@ -0,0 +1,104 @@
+import os
+import random
+import struct
+from catparser.MultiFileParser import MultiFileParser
+
+
+def generate_schema_lines(num_types, num_members=10):
+    """Generates lines of a valid synthetic schema with approximately num_types * (3 * num_members + 6) lines"""
+    lines = ['using Amount = uint64', 'using Key = binary_fixed(32)', '']
+    for type_index in range(num_types):
+        lines += [
+            '# enumeration of synthetic kinds {0}'.format(type_index),
+            'enum Kind{0} : uint8'.format(type_index)
+        ]
+        for member_index in range(num_members):
+            lines += ['\t# kind value {0}'.format(member_index), '\tvalue{0} = 0x{0:02X}'.format(member_index), '']
+
+        lines += [
+            '# binary layout for synthetic struct {0}'.format(type_index),
+            'struct Synthetic{0}'.format(type_index),
+            '\tconst uint8 version = 1',
+            '\tkind = Kind{0}'.format(type_index),
+            '\tvaluesCount = uint8'
+        ]
+        for member_index in range(num_members):
+            member_line = '\tamount{0} = Amount if kind equals value{0}' if member_index % 2 else '\tkey{0} = Key'
+            lines += ['\t# synthetic member {0}'.format(member_index), member_line.format(member_index), '']
+
+        lines += ['\tvalues = array(Amount, valuesCount)', '']
+
+    return lines
+
+
+def generate_transaction_schema_lines(num_transactions):
+    """Generates lines of a valid synthetic schema with num_transactions transactions, which can be passed to builder generators"""
+    lines = ['using Amount = uint64', 'using Key = binary_fixed(32)', '']
+    for transaction_index in range(num_transactions):
+        lines += [
+            '# binary layout for synthetic transaction {0}'.format(transaction_index),
+            'struct Synthetic{0}TransactionBody'.format(transaction_index),
+            '\t# recipient of synthetic transaction',
+            '\trecipient = Key',
+            '\t# amount of synthetic transaction',
+            '\tamount = Amount',
+            '\tvaluesCount = uint8',
+            '\t# values attached to synthetic transaction',
+            '\tvalues = array(Amount, valuesCount)',
+            '',
+            'struct Synthetic{0}Transaction'.format(transaction_index),
+            '\tinline Synthetic{0}TransactionBody'.format(transaction_index),
+            ''
+        ]
+
+    return lines
+
+
+def write_schema_tree(directory, num_leaves, num_types, num_members=10):
+    """Writes a synthetic schema tree composed of a shared root file and num_leaves files importing it"""
+    os.makedirs(directory, exist_ok=True)
+
+    filenames = []
+    with open(os.path.join(directory, 'shared.cats'), 'w') as output_file:
+        output_file.write('\n'.join(generate_schema_lines(num_types, num_members)))
+
+    for leaf_index in range(num_leaves):
+        filename = os.path.join(directory, 'leaf{0}.cats'.format(leaf_index))
+        leaf_lines = generate_schema_lines(num_types, num_members)[3:]
+        leaf_lines = [line.replace('Synthetic', 'Leaf{0}Synthetic'.format(leaf_index)).replace('Kind', 'Leaf{0}Kind'.format(leaf_index))
+                      for line in leaf_lines]
+        with open(filename, 'w') as output_file:
+            output_file.write('\n'.join(['import "shared.cats"', ''] + leaf_lines))
+
+        filenames.append(filename)
+
+    return filenames
+
+
+def load_schema(schema_name, include_path='schemas'):
+    """Parses the schema with the specified name relative to include_path"""
+    file_parser = MultiFileParser()
+    file_parser.set_include_path(include_path)
+    file_parser.parse(os.path.join(include_path, '{0}.cats'.format(schema_name)))
+    return file_parser.cats_parser.type_descriptors()
+
+
+def _random_bytes(rng, size):
+    return rng.getrandbits(8 * size).to_bytes(size, 'little') if size else b''
+
+
+def generate_transfers(count, seed=0):
+    """Generates serialized transfer transactions with random messages and mosaics"""
+    rng = random.Random(seed)
+    transfers = []
+    for _ in range(count):
+        message = _random_bytes(rng, rng.randint(0, 64))
+        mosaics = [(rng.getrandbits(64), rng.getrandbits(32)) for _ in range(rng.randint(0, 4))]
+
+        body = bytes([0x90]) + _random_bytes(rng, 24) + struct.pack('<HB', len(message), len(mosaics)) + message
+        body += b''.join(struct.pack('<QQ', mosaic_id, amount) for mosaic_id, amount in mosaics)
+
+        header = _random_bytes(rng, 64 + 32) + struct.pack('<HHQQ', 0x9003, 0x4154, rng.getrandbits(16), rng.getrandbits(40))
+        transfers.append(struct.pack('<I', 4 + len(header) + len(body)) + header + body)
+
+    return transfers
@@ -0,0 +1,69 @@
+import gc
+import time
+import tracemalloc
+from benchmarks.synthetic import generate_transfers, load_schema
+from catcodec.SchemaDecoder import SchemaDecoder
+from catcodec.SchemaView import SchemaView
+
+
+def read_decoded_fields(decoder, transfer):
+    values = decoder.decode('TransferTransaction', transfer)
+    return (values, values['signer'], values['type'], values['fee'])
+
+
+def read_viewed_fields(schema_view, transfer):
+    view = schema_view.view('TransferTransaction', transfer)
+    return (view, view.signer, view.type, view.fee)
+
+
+def measure_allocations(read, transfers):
+    # objects referenced by the results are the allocations a consumer holds onto for each message
+    gc.collect()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    results = [read(transfer) for transfer in transfers]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    statistics = snapshot_after.compare_to(snapshot_before, 'filename')
+    num_blocks = sum(statistic.count_diff for statistic in statistics)
+    num_bytes = sum(statistic.size_diff for statistic in statistics)
+    del results
+    return (num_blocks / len(transfers), num_bytes / len(transfers))
+
+
+def measure_time(read, transfers):
+    elapsed_times = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        for transfer in transfers:
+            read(transfer)
+
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    return min(elapsed_times)
+
+
+def main():
+    transfers = generate_transfers(20000)
+    type_descriptors = load_schema('transfer/transfer')
+    decoder = SchemaDecoder(type_descriptors)
+    schema_view = SchemaView(type_descriptors)
+    print('reading signer, type and fee of {0} transfers'.format(len(transfers)))
+
+    # sanity: both approaches must read identical values
+    assert all(
+        read_decoded_fields(decoder, transfer)[1:] == read_viewed_fields(schema_view, transfer)[1:] for transfer in transfers)
+
+    for name, read in [
+            ('full decode', lambda transfer: read_decoded_fields(decoder, transfer)),
+            ('lazy view', lambda transfer: read_viewed_fields(schema_view, transfer))
+    ]:
+        num_blocks, num_bytes = measure_allocations(read, transfers)
+        elapsed_time = measure_time(read, transfers)
+        print('{0:>12}: {1:5.1f} allocations ({2:6.1f} bytes) per message, {3:8.2f}ms ({4:9.0f} tx/s)'.format(
+            name, num_blocks, num_bytes, elapsed_time * 1000, len(transfers) / elapsed_time))
+
+
+if __name__ == '__main__':
+    main()
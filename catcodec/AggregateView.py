@@ -0,0 +1,89 @@
+# pylint: disable=too-few-public-methods
+from .DecodeException import DecodeException
+from .EntityDispatcher import EntityDispatcher
+from .FrameReader import SIZE_PREFIX, check_frame_size
+from .SchemaView import ArrayView, ElementReader
+
+
+class EmbeddedTransactionsView:
+    """Lazy sequence of the embedded transactions in a byte region, which are framed by their size prefixes"""
+    __slots__ = ('aggregate_view', 'buffer')
+
+    def __init__(self, aggregate_view, buffer):
+        self.aggregate_view = aggregate_view
+        self.buffer = buffer
+
+    def __iter__(self):
+        """Yields a view of each embedded transaction over its frame without copying it"""
+        buffer = self.buffer
+        offset = 0
+        while offset < len(buffer):
+            if offset + SIZE_PREFIX.size > len(buffer):
+                raise DecodeException('embedded transaction size prefix at offset {0} exceeds transactions region'.format(offset))
+
+            size = SIZE_PREFIX.unpack_from(buffer, offset)[0]
+            check_frame_size(size, len(buffer) - offset, offset)
+
+            frame = buffer[offset:offset + size]
+            yield self.aggregate_view.get_embedded_view_class(frame)(frame)
+            offset += size
+
+
+class AggregateTransactionView:
+    """Lazy view of an aggregate transaction and of the embedded transactions and cosignatures it contains"""
+    __slots__ = ('header', 'transactions', 'cosignatures')
+
+    def __init__(self, header, transactions, cosignatures):
+        # header is a view of the aggregate struct, which provides all other fields
+        self.header = header
+        self.transactions = transactions
+        self.cosignatures = cosignatures
+
+
+class AggregateView:
+    """Factory of lazy aggregate transaction views, which dispatch embedded transactions to their embedded layouts"""
+    def __init__(
+            self,
+            schema_view,
+            aggregate_type_name='AggregateTransaction',
+            cosignature_type_name='Cosignature',
+            entity_dispatcher=None):
+        self.schema_view = schema_view
+        self.aggregate_type_name = aggregate_type_name
+
+        # cosignatures are described by a byte array field, which is sized by an expression that is not evaluated
+        aggregate_view_class = schema_view.get_view_class(aggregate_type_name)
+        if 'byte' != aggregate_view_class.struct_layout.get_field('cosignatures').type_name:
+            raise DecodeException('cosignatures of aggregate type "{0}" must be a byte array'.format(aggregate_type_name))
+
+        self.cosignatures_accessor = aggregate_view_class.field_accessors['cosignatures']
+        cosignature_view_class = schema_view.get_view_class(cosignature_type_name)
+        self.cosignature_reader = ElementReader(cosignature_view_class, cosignature_view_class.struct_layout.size)
+        if self.cosignature_reader.size is None:
+            raise DecodeException('cosignature type "{0}" must have a fixed size'.format(cosignature_type_name))
+
+        self.entity_dispatcher = entity_dispatcher or EntityDispatcher(schema_view.type_descriptors, schema_view.schema_layout)
+
+    def get_embedded_view_class(self, frame):
+        """Gets the view class of the embedded transaction in the specified frame based on its entity type and version"""
+        return self.schema_view.get_view_class(self.entity_dispatcher.get_type_name(frame, is_embedded=True))
+
+    def view(self, buffer, offset=0):
+        """Creates a view of an aggregate transaction starting at offset without copying the buffer"""
+        header = self.schema_view.view(self.aggregate_type_name, buffer, offset)
+        transactions = header.transactions
+
+        # cosignatures fill the remainder of the aggregate up to its size
+        cosignatures_start = self.cosignatures_accessor.start(header)
+        cosignatures_end = offset + header.size
+        if cosignatures_end > len(header.view_buffer) or cosignatures_end < cosignatures_start:
+            raise DecodeException('aggregate size {0} at offset {1} is invalid for buffer with size {2}'.format(
+                header.size, offset, len(header.view_buffer)))
+
+        num_cosignatures, remainder = divmod(cosignatures_end - cosignatures_start, self.cosignature_reader.size)
+        if remainder:
+            raise DecodeException('cosignatures region of {0} bytes is not a multiple of cosignature size {1}'.format(
+                cosignatures_end - cosignatures_start, self.cosignature_reader.size))
+
+        cosignatures = ArrayView(header.view_buffer, cosignatures_start, num_cosignatures, self.cosignature_reader)
+        return AggregateTransactionView(header, EmbeddedTransactionsView(self, transactions), cosignatures)
@@ -0,0 +1,106 @@
+import asyncio
+from .FrameException import FrameException
+from .FrameReader import DEFAULT_MAX_FRAME_SIZE, SIZE_PREFIX, check_frame_size
+
+# get_running_loop is only available in python 3.7+, where get_event_loop is deprecated inside coroutines
+get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def decode_frames(decode, frames):
+    """Decodes a batch of frames, which is the unit of work passed to executors"""
+    return [decode(frame) for frame in frames]
+
+
+class AsyncFrameReader:
+    """Reads size prefixed entity frames from an asyncio stream reader as they arrive"""
+    def __init__(self, reader, max_frame_size=DEFAULT_MAX_FRAME_SIZE):
+        self.reader = reader
+        self.max_frame_size = max_frame_size
+
+        # stream offset of the next frame
+        self.offset = 0
+
+    async def read_frame(self):
+        """Reads the next frame into a buffer preallocated from its size prefix or returns None at the end of the stream"""
+        try:
+            prefix = await self.reader.readexactly(SIZE_PREFIX.size)
+        except asyncio.IncompleteReadError as ex:
+            if not ex.partial:
+                return None
+
+            raise FrameException('frame is truncated ({0} of {1} bytes available)'.format(len(ex.partial), SIZE_PREFIX.size), self.offset)
+
+        size = SIZE_PREFIX.unpack(prefix)[0]
+        check_frame_size(size, self.max_frame_size, self.offset)
+
+        frame = bytearray(size)
+        frame[:SIZE_PREFIX.size] = prefix
+        view = memoryview(frame)
+        num_bytes = SIZE_PREFIX.size
+        while num_bytes < size:
+            chunk = await self.reader.read(size - num_bytes)
+            if not chunk:
+                raise FrameException('frame is truncated ({0} of {1} bytes available)'.format(num_bytes, size), self.offset)
+
+            view[num_bytes:num_bytes + len(chunk)] = chunk
+            num_bytes += len(chunk)
+
+        self.offset += size
+        return frame
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        frame = await self.read_frame()
+        if frame is None:
+            raise StopAsyncIteration
+
+        return frame
+
+    async def read_batches(self, queue, batch_size=64):
+        """
+        Reads frames into batches of up to batch_size frames that are put into queue, followed by None at the end of the stream.
+        A batch is put as soon as the queue is empty, so frames are only held back while consumers are busy.
+        When a bounded queue is full, no more frames are read, which lets the stream reader pause its transport.
+        Read errors are put into the queue (and raised) so that consumers stop waiting for batches.
+        """
+        batch = []
+        try:
+            async for frame in self:
+                batch.append(frame)
+                if len(batch) >= batch_size or queue.empty():
+                    await queue.put(batch)
+                    batch = []
+        except FrameException as ex:
+            await queue.put(ex)
+            raise
+
+        if batch:
+            await queue.put(batch)
+
+        await queue.put(None)
+
+    async def decode_batches(self, decode, executor=None, batch_size=64, max_queued_batches=4):
+        """Decodes batches of frames with decode in executor (or the default executor) and yields the decoded batches in order"""
+        queue = asyncio.Queue(max_queued_batches)
+        producer = asyncio.ensure_future(self.read_batches(queue, batch_size))
+        loop = get_running_loop()
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+
+                if isinstance(batch, Exception):
+                    raise batch
+
+                yield await loop.run_in_executor(executor, decode_frames, decode, batch)
+        finally:
+            if not producer.done():
+                producer.cancel()
+
+            # the producer failure (if any) is raised from the queue instead
+            await asyncio.wait([producer])
+            if not producer.cancelled():
+                producer.exception()
@@ -0,0 +1,140 @@
+from catparser.CatsParseException import CatsParseException
+from catparser.SchemaLayout import SchemaLayout
+from .DecodeException import DecodeException
+from .DtypeBuilder import DtypeBuilder, np
+from .codecutils import get_condition_value, require_field_counts
+
+
+class BatchDecoder:
+    """Decodes batches of structs into columns, with one NumPy array per field instead of one object per struct"""
+    def __init__(self, type_descriptors, type_name, field_names=None, schema_layout=None):
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.dtype_builder = DtypeBuilder(type_descriptors, self.schema_layout)
+        self.struct_layout = self.schema_layout.get_struct_layout(type_name)
+        require_field_counts(self.struct_layout, 'decoded in batch')
+        self.field_names = list(field_names or [field.name for field in self.struct_layout.fields])
+
+        # only fields up to the last requested field need to be visited, because later fields never affect earlier offsets
+        field_indexes = [self.struct_layout.fields.index(self.struct_layout.get_field(name)) for name in self.field_names]
+        self.fields = self.struct_layout.fields[:max(field_indexes) + 1] if field_indexes else ()
+
+        self.condition_values = {
+            field.name: get_condition_value(type_descriptors, self.struct_layout, field) for field in self.fields if field.condition
+        }
+
+        # count and condition fields are decoded even when they are not requested
+        self.decoded_names = set(self.field_names)
+        for field in self.fields:
+            if field.condition:
+                self.decoded_names.add(field.condition)
+
+            if 'array' == field.kind and isinstance(field.count, str):
+                self.decoded_names.add(field.count)
+
+    def decode(self, buffers):
+        """Decodes a list of buffers, each containing a single struct"""
+        offsets = np.zeros(len(buffers), dtype=np.int64)
+        np.cumsum([len(buffer) for buffer in buffers[:-1]], out=offsets[1:])
+        return self.decode_buffer(b''.join(buffers), offsets)
+
+    def decode_buffer(self, buffer, offsets):
+        """
+        Decodes structs starting at offsets in a single buffer, where each struct ends at the next offset (or the end of the buffer).
+        Returns a dict mapping each requested field name to an array with one element per struct.
+        Arrays are flattened across structs into values, '<name>_offsets' (bounds of the values of each struct)
+        and '<name>_parents' (index of the struct containing each value).
+        Conditional fields are decoded for all structs with '<name>_present' indicating whether their condition is met.
+        """
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        starts = np.asarray(offsets, dtype=np.int64)
+        limits = np.append(starts[1:], len(data)) if len(starts) else starts
+
+        values = {}
+        ends = {}
+        columns = {}
+        for field in self.fields:
+            # offsets of fields following a variable size field are calculated from the ends of that field in each struct
+            field_starts = (starts if field.base is None else ends[field.base]) + field.offset
+            present = self._get_present(field, values)
+
+            # columns are only added for requested fields, so that each column is explicitly associated with its field
+            is_requested = field.name in self.field_names
+
+            if 'array' == field.kind and not field.is_fixed:
+                if None is field.element.size:
+                    raise CatsParseException('array "{0}" in "{1}" of variable size elements cannot be decoded in batch'.format(
+                        field.name, self.struct_layout.name))
+
+                counts = _get_counts(field, len(field_starts), present, values)
+                ends[field.name] = field_starts + counts * field.element.size
+                _require_size(field, ends[field.name], limits)
+
+                field_columns = self._decode_array_field(data, field, field_starts, counts)
+                if field.name in self.decoded_names:
+                    values[field.name] = field_columns[field.name]
+
+                if is_requested:
+                    columns.update(field_columns)
+
+                continue
+
+            if not field.is_fixed:
+                raise CatsParseException('variable size field "{0}" in "{1}" cannot be decoded in batch'.format(
+                    field.name, self.struct_layout.name))
+
+            _require_size(field, field_starts + field.size, limits)
+            if is_requested and None is not present:
+                columns['{0}_present'.format(field.name)] = present
+
+            if field.name in self.decoded_names:
+                values[field.name] = _gather(data, field_starts, np.dtype(self.dtype_builder.get_field_format(field)))
+
+            if is_requested:
+                columns[field.name] = values[field.name]
+
+        return columns
+
+    def _get_present(self, field, values):
+        if not field.condition:
+            return None
+
+        return self.condition_values[field.name] == values[field.condition]
+
+    def _decode_array_field(self, data, field, field_starts, counts):
+        element = field.element
+
+        # values of all structs are gathered with a single vectorized index
+        array_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=array_offsets[1:])
+        parents = np.repeat(np.arange(len(counts)), counts)
+        element_starts = field_starts[parents] + (np.arange(array_offsets[-1]) - array_offsets[parents]) * element.size
+        element_dtype = np.dtype(self.dtype_builder.get_element_format(element))
+
+        field_columns = {
+            field.name: _gather(data, element_starts, element_dtype),
+            '{0}_offsets'.format(field.name): array_offsets,
+            '{0}_parents'.format(field.name): parents
+        }
+        return field_columns
+
+
+def _get_counts(field, num_structs, present, values):
+    counts = values[field.count].astype(np.int64) if isinstance(field.count, str) else np.full(num_structs, field.count)
+    if None is not present:
+        counts = np.where(present, counts, 0)
+
+    return counts
+
+
+def _gather(data, starts, dtype):
+    # the bytes of each value are gathered into a contiguous matrix and reinterpreted with a single field structured dtype
+    indexes = starts[:, np.newaxis] + np.arange(dtype.itemsize)
+    return data[indexes].view(np.dtype([('value', dtype)]))[:, 0]['value']
+
+
+def _require_size(field, field_ends, limits):
+    overflows = np.flatnonzero(field_ends > limits)
+    if len(overflows):
+        index = overflows[0]
+        raise DecodeException('"{0}" of struct {1} ends at offset {2} beyond struct end {3}'.format(
+            field.name, index, field_ends[index], limits[index]))
@@ -0,0 +1,2 @@
+class DecodeException(Exception):
+    """Exception raised when binary data cannot be decoded"""
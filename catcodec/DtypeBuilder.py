@@ -0,0 +1,73 @@
+from catparser.CatsParseException import CatsParseException
+from catparser.SchemaLayout import SchemaLayout
+from .DecodeException import DecodeException
+from .codecutils import SCALAR_FORMATS
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency that is only needed for array exports
+    np = None
+
+
+class DtypeBuilder:
+    """Builds packed little endian NumPy structured dtypes from fixed size structs"""
+    def __init__(self, type_descriptors, schema_layout=None, bytes_kind='V'):
+        if np is None:
+            raise ImportError('DtypeBuilder requires numpy')
+
+        if bytes_kind not in ('V', 'S'):
+            raise ValueError('bytes_kind must be "V" (raw bytes) or "S" (NUL padded byte strings)')
+
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.bytes_kind = bytes_kind
+        self.dtypes = {}
+
+    def get_dtype(self, type_name):
+        """Gets the (memoized) dtype of the specified fixed size struct"""
+        if type_name not in self.dtypes:
+            self.dtypes[type_name] = self._build_dtype(self.schema_layout.get_struct_layout(type_name))
+
+        return self.dtypes[type_name]
+
+    def decode_array(self, type_name, buffer, count, offset=0):
+        """Decodes count consecutive structs starting at offset into a structured array sharing memory with the buffer"""
+        dtype = self.get_dtype(type_name)
+        if offset + count * dtype.itemsize > len(buffer):
+            raise DecodeException('unable to decode {0} "{1}" at offset {2} from buffer with size {3}'.format(
+                count, type_name, offset, len(buffer)))
+
+        return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+
+    def _build_dtype(self, struct_layout):
+        if not struct_layout.is_fixed:
+            raise CatsParseException('"{0}" does not have a fixed size'.format(struct_layout.name))
+
+        # explicit offsets keep the dtype packed and allow union alternatives to overlap
+        return np.dtype({
+            'names': [field.name for field in struct_layout.fields],
+            'formats': [self.get_field_format(field) for field in struct_layout.fields],
+            'offsets': [field.offset for field in struct_layout.fields],
+            'itemsize': struct_layout.size
+        })
+
+    def get_field_format(self, field):
+        """Gets the dtype format of a fixed size field layout"""
+        element = field.element
+        if 'array' != field.kind:
+            return self.get_element_format(element)
+
+        if 'byte' == element.type_name:
+            return '{0}{1}'.format(self.bytes_kind, field.count)
+
+        return np.dtype((self.get_element_format(element), (field.count,)))
+
+    def get_element_format(self, element):
+        """Gets the dtype format of a fixed size element layout"""
+        if 'struct' == element.kind:
+            return self.get_dtype(element.type_name)
+
+        # aliases and enums are reduced to integers, while other sizes (such as binary_fixed types) are byte strings
+        if element.size not in SCALAR_FORMATS:
+            return '{0}{1}'.format(self.bytes_kind, element.size)
+
+        return '<{0}{1}'.format('i' if 'signed' == element.signedness else 'u', element.size)
@@ -0,0 +1,2 @@
+class EncodeException(Exception):
+    """Exception raised when values cannot be encoded"""
@@ -0,0 +1,61 @@
+# pylint: disable=too-few-public-methods
+import struct
+from catparser.EntityRegistry import EntityRegistry
+from catparser.SchemaLayout import SchemaLayout
+from .DecodeException import DecodeException
+from .codecutils import scalar_format
+
+
+class FieldReader:
+    """Reads an integer field at its precomputed offset in a struct header"""
+    def __init__(self, struct_layout, name):
+        field = struct_layout.get_field(name)
+        self.offset = struct_layout.offset_of(name)
+        self.unpack_from = struct.Struct('<' + scalar_format(field.size, field.element.signedness)).unpack_from
+
+    def read(self, buffer, offset):
+        """Reads the field of the struct starting at offset"""
+        return self.unpack_from(buffer, offset + self.offset)[0]
+
+
+class EntityDispatcher:
+    """Routes entities in buffers to the structs registered for their entity type and version"""
+    def __init__(self, type_descriptors, schema_layout=None, entity_registry=None):
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.entity_registry = entity_registry or EntityRegistry(type_descriptors)
+
+        # version constants are matched against the low bytes of version fields
+        self.version_mask = (1 << (8 * self.entity_registry.version_size)) - 1
+
+        # entity type and version are read at their offsets in the (embedded) transaction header
+        self.header_readers = {}
+        for is_embedded, header_type_name in [(False, 'Transaction'), (True, 'EmbeddedTransaction')]:
+            if header_type_name in type_descriptors:
+                struct_layout = self.schema_layout.get_struct_layout(header_type_name)
+                self.header_readers[is_embedded] = (
+                    struct_layout.fixed_prefix_size,
+                    FieldReader(struct_layout, 'type'),
+                    FieldReader(struct_layout, 'version'))
+
+    def get_entity_types(self, buffer, offset=0, is_embedded=False):
+        """Gets the structs registered for the entity starting at offset"""
+        if is_embedded not in self.header_readers:
+            raise DecodeException('schema does not define {0}transaction header'.format('embedded ' if is_embedded else ''))
+
+        header_size, type_reader, version_reader = self.header_readers[is_embedded]
+        if offset + header_size > len(buffer):
+            raise DecodeException('unable to read entity header at offset {0} from buffer with size {1}'.format(offset, len(buffer)))
+
+        entity_type = type_reader.read(buffer, offset)
+        version = version_reader.read(buffer, offset) & self.version_mask
+        entity_types = self.entity_registry.find(entity_type, version)
+        if not entity_types or (is_embedded and not entity_types.embedded_name):
+            raise DecodeException('no {0}entity is registered for entity type 0x{1:04X} and version {2}'.format(
+                'embedded ' if is_embedded else '', entity_type, version))
+
+        return entity_types
+
+    def get_type_name(self, buffer, offset=0, is_embedded=False):
+        """Gets the name of the struct of the entity starting at offset"""
+        entity_types = self.get_entity_types(buffer, offset, is_embedded)
+        return entity_types.embedded_name if is_embedded else entity_types.name
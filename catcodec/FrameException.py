@@ -0,0 +1,8 @@
+from .DecodeException import DecodeException
+
+
+class FrameException(DecodeException):
+    """Exception raised when a size prefixed frame is truncated or has an invalid size"""
+    def __init__(self, message, offset):
+        super().__init__('{0} at offset {1}'.format(message, offset))
+        self.offset = offset
@@ -0,0 +1,79 @@
+# pylint: disable=too-few-public-methods
+import struct
+from .FrameException import FrameException
+
+# every entity starts with SizePrefixedEntity::size (schemas/entity.cats), which includes the size of the prefix itself
+SIZE_PREFIX = struct.Struct('<I')
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MAX_FRAME_SIZE = 1 << 26
+
+
+def check_frame_size(size, max_frame_size, offset):
+    """Raises if the size read from the prefix of the frame starting at offset is invalid"""
+    if size < SIZE_PREFIX.size:
+        raise FrameException('frame size {0} is smaller than its size prefix'.format(size), offset)
+
+    if size > max_frame_size:
+        raise FrameException('frame size {0} exceeds max frame size {1}'.format(size, max_frame_size), offset)
+
+
+class FrameReader:
+    """Splits a binary stream into size prefixed entity frames, which are read in large chunks into a reusable buffer"""
+    def __init__(self, stream, chunk_size=DEFAULT_CHUNK_SIZE, max_frame_size=DEFAULT_MAX_FRAME_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_frame_size = max_frame_size
+
+        # stream offset of the last frame
+        self.frame_offset = None
+
+    def __iter__(self):
+        """
+        Yields each frame as a memoryview into the reusable buffer without copying it.
+        Each frame is only valid until the next frame is requested, so frames that need to be kept must be copied.
+        """
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        buffer_offset = 0  # stream offset of the start of the buffer
+        start = 0
+        end = 0
+        while True:
+            # yield all complete frames in the buffer
+            required_size = SIZE_PREFIX.size
+            while end - start >= SIZE_PREFIX.size:
+                size = SIZE_PREFIX.unpack_from(buffer, start)[0]
+                check_frame_size(size, self.max_frame_size, buffer_offset + start)
+                if end - start < size:
+                    required_size = size
+                    break
+
+                self.frame_offset = buffer_offset + start
+                yield view[start:start + size]
+                start += size
+
+            # move the partial frame to the start of the buffer, which is grown when the frame does not fit
+            remaining_size = end - start
+            if len(buffer) < required_size:
+                buffer, view = _grow(view, start, end, max(required_size, 2 * len(buffer)))
+            elif start:
+                buffer[:remaining_size] = buffer[start:end]
+
+            buffer_offset += start
+            start = 0
+            end = remaining_size
+
+            num_bytes_read = self.stream.readinto(view[end:])
+            if not num_bytes_read:
+                if end:
+                    raise FrameException('frame is truncated ({0} of {1} bytes available)'.format(end, required_size), buffer_offset)
+
+                return
+
+            end += num_bytes_read
+
+
+def _grow(view, start, end, size):
+    buffer = bytearray(size)
+    buffer[:end - start] = view[start:end]
+    return (buffer, memoryview(buffer))
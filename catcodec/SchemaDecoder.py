@@ -0,0 +1,188 @@
+# pylint: disable=too-few-public-methods
+import operator
+import struct
+from catparser.SchemaLayout import SchemaLayout
+from .DecodeException import DecodeException
+from .codecutils import field_format, get_condition_value, group_packable_fields, is_packable, require_field_counts, scalar_format
+
+
+class StructDecoder:
+    """Decoder of a single struct, which executes a decode plan compiled once from the struct layout"""
+    def __init__(self, schema_decoder, struct_layout):
+        self.name = struct_layout.name
+        self.steps = []
+        require_field_counts(struct_layout, 'decoded')
+
+        # structs composed only of packable fields are decoded with a single precompiled struct format
+        self.names = None
+        self.packer = None
+        if all(is_packable(field) for field in struct_layout.fields):
+            self.names = tuple(field.name for field in struct_layout.fields)
+            self.packer = struct.Struct('<' + ''.join(field_format(field) for field in struct_layout.fields))
+            self._decode = self._decode_packed_from
+            return
+
+        self._decode = self._decode_steps_from
+
+        # otherwise consecutive packable fields are decoded together with a single precompiled struct format
+        for is_packed, group in group_packable_fields(struct_layout.fields):
+            if is_packed:
+                self.steps.append(_compile_packed_fields(group))
+            elif group[0].condition:
+                self.steps.append(_compile_conditional_fields(schema_decoder, struct_layout, group))
+            else:
+                self.steps.append(_compile_field(schema_decoder, group[0]))
+
+    def decode_from(self, buffer, offset):
+        """Decodes a struct starting at offset and returns its field values and the offset following it"""
+        return self._decode(buffer, offset)
+
+    def _decode_steps_from(self, buffer, offset):
+        values = {}
+        for step in self.steps:
+            offset = step(buffer, offset, values)
+
+        return (values, offset)
+
+    def _decode_packed_from(self, buffer, offset):
+        return (dict(zip(self.names, self.packer.unpack_from(buffer, offset))), offset + self.packer.size)
+
+
+class SchemaDecoder:
+    """Decoder of binary data described by parsed type descriptors"""
+    def __init__(self, type_descriptors, schema_layout=None):
+        self.type_descriptors = type_descriptors
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.struct_decoders = {}
+
+    def get_struct_decoder(self, type_name):
+        """Gets the (memoized) decoder of the specified struct"""
+        if type_name not in self.struct_decoders:
+            self.struct_decoders[type_name] = StructDecoder(self, self.schema_layout.get_struct_layout(type_name))
+
+        return self.struct_decoders[type_name]
+
+    def decode_from(self, type_name, buffer, offset=0):
+        """Decodes a struct starting at offset and returns its field values and the offset following it"""
+        struct_decoder = self.get_struct_decoder(type_name)
+        try:
+            return struct_decoder.decode_from(memoryview(buffer), offset)
+        except struct.error as ex:
+            raise DecodeException('unable to decode "{0}" at offset {1}'.format(type_name, offset), ex)
+
+    def decode(self, type_name, buffer):
+        """Decodes a struct that must span the whole buffer"""
+        values, offset = self.decode_from(type_name, buffer)
+        if len(buffer) != offset:
+            raise DecodeException('"{0}" ends at offset {1} but buffer has size {2}'.format(type_name, offset, len(buffer)))
+
+        return values
+
+
+def _compile_packed_fields(fields):
+    names = tuple(field.name for field in fields)
+    packer = struct.Struct('<' + ''.join(field_format(field) for field in fields))
+    unpack_from = packer.unpack_from
+    size = packer.size
+
+    def decode_packed_fields(buffer, offset, values):
+        values.update(zip(names, unpack_from(buffer, offset)))
+        return offset + size
+
+    return decode_packed_fields
+
+
+def _compile_conditional_fields(schema_decoder, struct_layout, fields):
+    alternatives = [
+        (field.condition, get_condition_value(schema_decoder.type_descriptors, struct_layout, field), _compile_field(schema_decoder, field))
+        for field in fields
+    ]
+    size = max(field.size for field in fields) if all(field.is_fixed for field in fields) else None
+
+    def decode_conditional_fields(buffer, offset, values):
+        # all alternatives of a union occupy the same bytes, but only the field matching the condition is present
+        end_offset = offset
+        for condition, condition_value, decode_field in alternatives:
+            if condition_value == values[condition]:
+                end_offset = decode_field(buffer, offset, values)
+
+        return offset + size if size is not None else end_offset
+
+    return decode_conditional_fields
+
+
+def _compile_field(schema_decoder, field):
+    if 'struct' == field.kind:
+        return _compile_struct_field(schema_decoder, field)
+
+    if 'array' == field.kind:
+        return _compile_array_field(schema_decoder, field)
+
+    return _compile_packed_fields([field])
+
+
+def _compile_struct_field(schema_decoder, field):
+    name = field.name
+    struct_decoder = schema_decoder.get_struct_decoder(field.type_name)
+
+    def decode_struct_field(buffer, offset, values):
+        values[name], offset = struct_decoder.decode_from(buffer, offset)
+        return offset
+
+    return decode_struct_field
+
+
+def _compile_array_field(schema_decoder, field):
+    name = field.name
+    count = field.count
+    is_counted = isinstance(count, str)
+    element = field.element
+    if 'byte' == element.type_name:
+        def decode_bytes_field(buffer, offset, values):
+            end_offset = _require_size(buffer, offset, values[count] if is_counted else count)
+            values[name] = bytes(buffer[offset:end_offset])
+            return end_offset
+
+        return decode_bytes_field
+
+    struct_decoder = schema_decoder.get_struct_decoder(element.type_name) if 'struct' == element.kind else None
+    if struct_decoder and not struct_decoder.packer:
+        def decode_structs_field(buffer, offset, values):
+            elements = []
+            for _ in range(values[count] if is_counted else count):
+                element_values, offset = struct_decoder.decode_from(buffer, offset)
+                elements.append(element_values)
+
+            values[name] = elements
+            return offset
+
+        return decode_structs_field
+
+    # arrays of packed structs and of scalars are decoded by unpacking all elements with a single precompiled struct format
+    if struct_decoder:
+        element_names = struct_decoder.names
+        element_packer = struct_decoder.packer
+
+        def convert(element_values):
+            return dict(zip(element_names, element_values))
+    else:
+        element_packer = struct.Struct('<' + scalar_format(element.size, element.signedness))
+        convert = operator.itemgetter(0)
+
+    element_size = element_packer.size
+    iter_unpack = element_packer.iter_unpack
+
+    def decode_packed_array_field(buffer, offset, values):
+        end_offset = _require_size(buffer, offset, (values[count] if is_counted else count) * element_size)
+        values[name] = [convert(element_values) for element_values in iter_unpack(buffer[offset:end_offset])]
+        return end_offset
+
+    return decode_packed_array_field
+
+
+def _require_size(buffer, offset, size):
+    end_offset = offset + size
+    if end_offset > len(buffer):
+        raise DecodeException('unable to decode {0} bytes at offset {1} from buffer with size {2}'.format(size, offset, len(buffer)))
+
+    return end_offset
@@ -0,0 +1,366 @@
+# pylint: disable=too-few-public-methods
+import itertools
+import operator
+import struct
+from catparser.SchemaLayout import SchemaLayout
+from .EncodeException import EncodeException
+from .codecutils import field_format, get_condition_value, group_packable_fields, is_packable, scalar_format
+
+# name of the size prefix of entities (schemas/entity.cats), which is filled in with the encoded size
+SIZE_PREFIXED_ENTITY_NAME = 'SizePrefixedEntity'
+
+
+class StructEncoder:
+    """Encoder of a single struct, which executes an encode plan compiled once from the struct layout"""
+    def __init__(self, schema_encoder, struct_layout):
+        self.name = struct_layout.name
+        self.fixed_size = struct_layout.fixed_size
+        self.steps = []
+        self.array_sizes = []
+        self.measures = []
+
+        # count fields are filled in from the sizes of their arrays, and the entity size from the encoded size
+        self.size_field_name = 'size' if schema_encoder.is_size_prefixed(struct_layout.name) else None
+        computed_getters = {
+            count_name: _compile_count_getter(struct_layout, count_name, array_names)
+            for count_name, array_names in struct_layout.count_fields.items()
+        }
+        if self.size_field_name:
+            computed_getters[self.size_field_name] = (_get_size, None)
+
+        # structs composed only of packable fields are encoded with a single precompiled struct format
+        self.names = None
+        self.packer_format = None
+        if all(is_packable(field) for field in struct_layout.fields):
+            self.names = tuple(field.name for field in struct_layout.fields)
+            self.packer_format = ''.join(field_format(field) for field in struct_layout.fields)
+
+        # consecutive packable fields are encoded together with a single precompiled struct format
+        for is_packed, group in group_packable_fields(struct_layout.fields):
+            if is_packed:
+                self.steps.append(_compile_packed_fields(group, computed_getters))
+                continue
+
+            if group[0].condition:
+                self.steps.append(_compile_conditional_fields(schema_encoder, struct_layout, group, computed_getters))
+            else:
+                self.steps.append(_compile_field(schema_encoder, group[0], computed_getters))
+
+            for field in group:
+                if field.is_fixed:
+                    continue
+
+                # unconditional arrays of fixed size elements are measured without calling a compiled measure
+                if not field.condition and 'array' == field.kind and field.element.size is not None:
+                    self.array_sizes.append((field.name, field.element.size))
+                else:
+                    self.measures.append(_compile_measure(schema_encoder, struct_layout, field))
+
+    def calculate_size(self, values):
+        """Calculates the exact encoded size of the specified values"""
+        size = self.fixed_size
+        for name, element_size in self.array_sizes:
+            size += len(values[name]) * element_size
+
+        for measure in self.measures:
+            size += measure(values)
+
+        return size
+
+    def encode_parts(self, parts, values, size=None):
+        """Appends the packed parts of the specified values to parts"""
+        if size is None and self.size_field_name:
+            size = self.calculate_size(values)
+
+        for step in self.steps:
+            step(parts, values, size)
+
+
+class SchemaEncoder:
+    """Encoder of values described by parsed type descriptors, which joins the packed parts of all structs into a single buffer"""
+    def __init__(self, type_descriptors, schema_layout=None):
+        self.type_descriptors = type_descriptors
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.struct_encoders = {}
+
+    def is_size_prefixed(self, type_name):
+        """Returns true if the specified struct (directly or indirectly) inlines the entity size prefix"""
+        for member_descriptor in self.type_descriptors[type_name]['layout']:
+            if 'inline' != member_descriptor.get('disposition'):
+                continue
+
+            if SIZE_PREFIXED_ENTITY_NAME == member_descriptor['type'] or self.is_size_prefixed(member_descriptor['type']):
+                return True
+
+        return False
+
+    def get_struct_encoder(self, type_name):
+        """Gets the (memoized) encoder of the specified struct"""
+        struct_encoder = self.struct_encoders.get(type_name)
+        if not struct_encoder:
+            struct_encoder = StructEncoder(self, self.schema_layout.get_struct_layout(type_name))
+            self.struct_encoders[type_name] = struct_encoder
+
+        return struct_encoder
+
+    def calculate_size(self, type_name, values):
+        """Calculates the exact encoded size of a struct"""
+        try:
+            return self.get_struct_encoder(type_name).calculate_size(values)
+        except KeyError as ex:
+            raise EncodeException('unable to calculate size of "{0}", missing value {1}'.format(type_name, ex))
+
+    def encode(self, type_name, values):
+        """Encodes a struct into a new buffer"""
+        parts = []
+        try:
+            (self.struct_encoders.get(type_name) or self.get_struct_encoder(type_name)).encode_parts(parts, values)
+        except (KeyError, struct.error) as ex:
+            raise _translate_error(type_name, ex)
+
+        return bytearray().join(parts)
+
+    def encode_into(self, type_name, buffer, offset, values):
+        """Encodes a struct into an existing buffer starting at offset and returns the offset following it"""
+        encoded = self.encode(type_name, values)
+        end_offset = offset + len(encoded)
+
+        # slice assignment would silently grow the buffer instead of failing like packing beyond its end
+        if end_offset > len(buffer):
+            raise EncodeException('"{0}" ends at offset {1} beyond buffer with size {2}'.format(type_name, end_offset, len(buffer)))
+
+        buffer[offset:end_offset] = encoded
+        return end_offset
+
+
+def _translate_error(type_name, ex):
+    if isinstance(ex, KeyError):
+        return EncodeException('unable to encode "{0}", missing value {1}'.format(type_name, ex))
+
+    return EncodeException('unable to encode "{0}"'.format(type_name), ex)
+
+
+def _get_size(_values, size):
+    return size
+
+
+def _get_sizes(_values, size):
+    return (size,)
+
+
+def _get_no_arguments(_values, _size):
+    return ()
+
+
+def _compile_packed_fields(fields, computed_getters):
+    pack = struct.Struct('<' + ''.join(field_format(field) for field in fields)).pack
+    if not any(field.name in computed_getters for field in fields):
+        get_arguments = _compile_arguments_getter([field.name for field in fields])
+
+        def encode_packed_fields(parts, values, _size):
+            parts.append(pack(*get_arguments(values)))
+
+        return encode_packed_fields
+
+    # computed fields are packed together with the other fields of the run, so values are never copied
+    segments = []
+    for is_computed, group in itertools.groupby(fields, lambda field: field.name in computed_getters):
+        group = list(group)
+        if is_computed:
+            segments.append((None, _compile_computed_getter(group, computed_getters)))
+        else:
+            segments.append((_compile_arguments_getter([field.name for field in group]), None))
+
+    if 1 >= sum(1 for get_arguments, _ in segments if get_arguments):
+        return _compile_surrounded_packed_fields(pack, segments)
+
+    def encode_computed_packed_fields(parts, values, entity_size):
+        arguments = []
+        for get_arguments, get_computed_arguments in segments:
+            arguments += get_arguments(values) if get_arguments else get_computed_arguments(values, entity_size)
+
+        parts.append(pack(*arguments))
+
+    return encode_computed_packed_fields
+
+
+def _compile_surrounded_packed_fields(pack, segments):
+    # runs with computed fields only preceding and following the other fields (like size and counts) are packed in a single call
+    get_leading_arguments = segments[0][1] or _get_no_arguments
+    get_trailing_arguments = segments[-1][1] if 1 < len(segments) and segments[-1][1] else _get_no_arguments
+    get_arguments = next((get_arguments for get_arguments, _ in segments if get_arguments), lambda values: ())
+
+    def encode_surrounded_packed_fields(parts, values, entity_size):
+        parts.append(pack(
+            *get_leading_arguments(values, entity_size),
+            *get_arguments(values),
+            *get_trailing_arguments(values, entity_size)))
+
+    return encode_surrounded_packed_fields
+
+
+def _compile_computed_getter(fields, computed_getters):
+    # consecutive counts of single unconditional arrays are calculated together from the array sizes
+    getters, array_names = zip(*(computed_getters[field.name] for field in fields))
+    if (_get_size,) == getters:
+        return _get_sizes
+
+    if all(array_names):
+        get_arrays = _compile_arguments_getter(array_names)
+        return lambda values, _size: map(len, get_arrays(values))
+
+    return lambda values, size: [get_value(values, size) for get_value in getters]
+
+
+def _compile_conditional_fields(schema_encoder, struct_layout, fields, computed_getters):
+    # unused union bytes following the alternative matching the condition are zeroed
+    size = max(field.size for field in fields) if all(field.is_fixed for field in fields) else None
+    alternatives = [
+        (
+            field.condition,
+            get_condition_value(schema_encoder.type_descriptors, struct_layout, field),
+            _compile_field(schema_encoder, field, computed_getters),
+            bytes(size - field.size) if size is not None else b''
+        )
+        for field in fields
+    ]
+    padding = bytes(size or 0)
+
+    def encode_conditional_fields(parts, values, entity_size):
+        for condition, condition_value, encode_field, alternative_padding in alternatives:
+            if condition_value == values[condition]:
+                encode_field(parts, values, entity_size)
+                parts.append(alternative_padding)
+                return
+
+        parts.append(padding)
+
+    return encode_conditional_fields
+
+
+def _compile_field(schema_encoder, field, computed_getters):
+    if 'struct' == field.kind:
+        return _compile_struct_field(schema_encoder, field)
+
+    if 'array' == field.kind:
+        return _compile_array_field(schema_encoder, field)
+
+    return _compile_packed_fields([field], computed_getters)
+
+
+def _compile_struct_field(schema_encoder, field):
+    name = field.name
+    struct_encoder = schema_encoder.get_struct_encoder(field.type_name)
+
+    def encode_struct_field(parts, values, _size):
+        struct_encoder.encode_parts(parts, values[name])
+
+    return encode_struct_field
+
+
+def _compile_array_field(schema_encoder, field):
+    name = field.name
+    fixed_count = field.count if isinstance(field.count, int) else None
+    element = field.element
+    if 'byte' == element.type_name:
+        def encode_bytes_field(parts, values, _size):
+            value = values[name]
+            if fixed_count is not None:
+                _require_count(name, fixed_count, value)
+
+            parts.append(value)
+
+        return encode_bytes_field
+
+    struct_encoder = schema_encoder.get_struct_encoder(element.type_name) if 'struct' == element.kind else None
+    if struct_encoder and not struct_encoder.packer_format:
+        def encode_structs_field(parts, values, _size):
+            elements = values[name]
+            if fixed_count is not None:
+                _require_count(name, fixed_count, elements)
+
+            for element_values in elements:
+                struct_encoder.encode_parts(parts, element_values)
+
+        return encode_structs_field
+
+    # arrays of packed structs and of scalars are encoded by packing all elements with a single struct format, which is memoized per count
+    element_format = struct_encoder.packer_format if struct_encoder else scalar_format(element.size, element.signedness)
+    get_arguments = _compile_arguments_getter(struct_encoder.names) if struct_encoder else None
+    array_packers = {}
+
+    def encode_packed_array_field(parts, values, _size):
+        elements = values[name]
+        if fixed_count is not None:
+            _require_count(name, fixed_count, elements)
+
+        if not elements:
+            return
+
+        num_elements = len(elements)
+        pack = array_packers.get(num_elements)
+        if not pack:
+            pack = struct.Struct('<' + element_format * num_elements).pack
+            array_packers[num_elements] = pack
+
+        parts.append(pack(*(itertools.chain.from_iterable(map(get_arguments, elements)) if get_arguments else elements)))
+
+    return encode_packed_array_field
+
+
+def _compile_arguments_getter(names):
+    if 1 == len(names):
+        name = names[0]
+        return lambda values: (values[name],)
+
+    return operator.itemgetter(*names)
+
+
+def _compile_measure(schema_encoder, struct_layout, field):
+    measure = _compile_unconditional_measure(schema_encoder, field)
+    if not field.condition:
+        return measure
+
+    condition = field.condition
+    condition_value = get_condition_value(schema_encoder.type_descriptors, struct_layout, field)
+    return lambda values: measure(values) if condition_value == values[condition] else 0
+
+
+def _compile_unconditional_measure(schema_encoder, field):
+    name = field.name
+    if 'struct' == field.kind:
+        struct_encoder = schema_encoder.get_struct_encoder(field.type_name)
+        return lambda values: struct_encoder.calculate_size(values[name])
+
+    element_size = field.element.size
+    if element_size is not None:
+        return lambda values: len(values[name]) * element_size
+
+    # arrays of variable size structs are measured element by element
+    struct_encoder = schema_encoder.get_struct_encoder(field.type_name)
+    return lambda values: sum(struct_encoder.calculate_size(element) for element in values[name])
+
+
+def _compile_count_getter(struct_layout, count_name, array_names):
+    # returns the getter of the count together with the name of its array when the count is simply the size of a single unconditional array
+    if 1 == len(array_names):
+        array_name = array_names[0]
+        if not struct_layout.get_field(array_name).condition:
+            return (lambda values, _size: len(values[array_name]), array_name)
+
+        return (lambda values, _size: len(values[array_name]) if array_name in values else 0, None)
+
+    def get_count(values, _size):
+        # arrays sharing a count field must have the same size, and the count of absent conditional arrays is zero
+        counts = set(len(values[array_name]) for array_name in array_names if array_name in values)
+        if len(counts) > 1:
+            raise EncodeException('arrays {0} sized by "{1}" have different sizes {2}'.format(array_names, count_name, sorted(counts)))
+
+        return counts.pop() if counts else 0
+
+    return (get_count, None)
+
+
+def _require_count(name, count, elements):
+    if count != len(elements):
+        raise EncodeException('"{0}" must have {1} elements but has {2}'.format(name, count, len(elements)))
@@ -0,0 +1,250 @@
+# pylint: disable=too-few-public-methods
+from collections import namedtuple
+import struct
+from catparser.SchemaLayout import SchemaLayout, SizeExpression, group_unions
+from .DecodeException import DecodeException
+from .codecutils import SCALAR_FORMATS, get_condition_value, scalar_format
+
+# reads array elements from a buffer at an offset, where size is None when the size of each element depends on its content
+ElementReader = namedtuple('ElementReader', ['read', 'size'])
+
+
+class StructView:
+    """Lazy view of a struct in a buffer, which decodes each field only when it is accessed"""
+    # names of view attributes contain underscores, so they never collide with (camel case) field properties
+    __slots__ = ('view_buffer', 'view_offset', 'field_ends')
+
+    # set by SchemaView on each generated subclass
+    struct_layout = None
+    field_accessors = {}
+    tail_size = 0
+
+    def __init__(self, buffer, offset=0):
+        if offset + self.struct_layout.fixed_prefix_size > len(buffer):
+            raise DecodeException('unable to view "{0}" at offset {1} in buffer with size {2}'.format(
+                self.struct_layout.name, offset, len(buffer)))
+
+        self.view_buffer = buffer
+        self.view_offset = offset
+        self.field_ends = None
+
+    def view_size(self):
+        """Gets the size of the viewed struct"""
+        if self.struct_layout.is_fixed:
+            return self.struct_layout.size
+
+        return self.field_end(self.struct_layout.variable_fields[-1].name) + self.tail_size - self.view_offset
+
+    def field_end(self, name):
+        """Gets the (memoized) offset following the variable size field with the specified name"""
+        if self.field_ends is None:
+            self.field_ends = {}
+        elif name in self.field_ends:
+            return self.field_ends[name]
+
+        field_accessor = self.field_accessors[name]
+        start = field_accessor.start(self)
+        end = start + field_accessor.measure(self, start)
+        _require_size(self.view_buffer, name, start, end)
+
+        self.field_ends[name] = end
+        return end
+
+    def __repr__(self):
+        return '{0}(offset={1})'.format(type(self).__name__, self.view_offset)
+
+
+class ArrayView:
+    """Lazy view of the elements of an array in a buffer"""
+    __slots__ = ('buffer', 'offset', 'count', 'read_element', 'element_size')
+
+    def __init__(self, buffer, offset, count, element_reader):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+        self.read_element, self.element_size = element_reader
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError('array index out of range')
+
+        index %= self.count
+        if self.element_size is not None:
+            return self.read_element(self.buffer, self.offset + index * self.element_size)
+
+        return next(element for element_index, element in enumerate(self) if index == element_index)
+
+    def __iter__(self):
+        offset = self.offset
+        for _ in range(self.count):
+            element = self.read_element(self.buffer, offset)
+            offset += self.element_size if self.element_size is not None else element.view_size()
+            yield element
+
+
+class FieldAccessor:
+    """Reads a single field of viewed structs using its precomputed offset"""
+    def __init__(self, schema_view, struct_layout, field):
+        self.name = field.name
+        self.field = field
+        self.is_present = _compile_condition(schema_view.type_descriptors, struct_layout, field)
+        self.read_element = _compile_element_reader(schema_view, field.element) if 'array' != field.kind else None
+        self.read = _compile_reader(schema_view, field, self.read_element)
+        self.measure = _compile_measure(schema_view, field, self.is_present)
+
+        # the offset of a field that does not follow a variable size field is known without reading the buffer
+        field_offset = field.offset
+        if field.base is None:
+            self.start = lambda view: view.view_offset + field_offset
+        else:
+            base = field.base
+            self.start = lambda view: view.field_end(base) + field_offset
+
+    def get(self, view):
+        """Gets the value of the field in the specified view or None if the field is not present"""
+        if not self.is_present(view):
+            return None
+
+        start = self.start(view)
+        if self.field.is_fixed:
+            _require_size(view.view_buffer, self.name, start, start + self.field.size)
+        else:
+            view.field_end(self.name)
+
+        return self.read(view, start)
+
+    def create_getter(self):
+        """Creates the property getter of the field, which is specialized for unconditional fields in the fixed prefix of a struct"""
+        field = self.field
+        if field.condition or field.base is not None or 'array' == field.kind:
+            return self.get
+
+        # the fixed prefix of a struct is validated when its view is created, so no bounds checks are needed
+        read_element = self.read_element
+        field_offset = field.offset
+        return lambda view: read_element(view.view_buffer, view.view_offset + field_offset)
+
+
+class SchemaView:
+    """Factory of lazy struct views over binary data described by parsed type descriptors"""
+    def __init__(self, type_descriptors, schema_layout=None):
+        self.type_descriptors = type_descriptors
+        self.schema_layout = schema_layout or SchemaLayout(type_descriptors)
+        self.view_classes = {}
+
+    def get_view_class(self, type_name):
+        """Gets the (memoized) view class of the specified struct"""
+        if type_name not in self.view_classes:
+            struct_layout = self.schema_layout.get_struct_layout(type_name)
+            view_class = type('{0}View'.format(type_name), (StructView,), {'__slots__': (), 'struct_layout': struct_layout})
+            self.view_classes[type_name] = view_class
+            _initialize_view_class(self, view_class, struct_layout)
+
+        return self.view_classes[type_name]
+
+    def view(self, type_name, buffer, offset=0):
+        """Creates a view of a struct starting at offset without copying the buffer"""
+        return self.get_view_class(type_name)(memoryview(buffer), offset)
+
+
+def _initialize_view_class(schema_view, view_class, struct_layout):
+    view_class.field_accessors = {}
+    for field in struct_layout.fields:
+        field_accessor = FieldAccessor(schema_view, struct_layout, field)
+        view_class.field_accessors[field.name] = field_accessor
+        setattr(view_class, field.name, property(field_accessor.create_getter()))
+
+    # size of the fixed size fields following the last variable size field
+    tail_size = 0
+    for group in group_unions(struct_layout.fields):
+        tail_size = tail_size + max(field.size for field in group) if group[0].is_fixed else 0
+
+    view_class.tail_size = tail_size
+
+
+def _compile_condition(type_descriptors, struct_layout, field):
+    if not field.condition:
+        return lambda view: True
+
+    condition = field.condition
+    condition_value = get_condition_value(type_descriptors, struct_layout, field)
+    return lambda view: condition_value == getattr(view, condition)
+
+
+def _compile_reader(schema_view, field, read_element):
+    if 'array' != field.kind:
+        return lambda view, start: read_element(view.view_buffer, start)
+
+    get_count = _compile_count(field)
+    element = field.element
+    if 'byte' == element.type_name:
+        return lambda view, start: view.view_buffer[start:start + get_count(view)]
+
+    element_reader = ElementReader(_compile_element_reader(schema_view, element), element.size)
+    return lambda view, start: ArrayView(view.view_buffer, start, get_count(view), element_reader)
+
+
+def _compile_element_reader(schema_view, element):
+    if 'struct' == element.kind:
+        return schema_view.get_view_class(element.type_name)
+
+    # byte strings (such as binary_fixed types) are returned as zero-copy slices of the buffer
+    size = element.size
+    if size not in SCALAR_FORMATS:
+        return lambda buffer, offset: buffer[offset:offset + size]
+
+    unpack_from = struct.Struct('<' + scalar_format(size, element.signedness)).unpack_from
+    return lambda buffer, offset: unpack_from(buffer, offset)[0]
+
+
+def _compile_measure(schema_view, field, is_present):
+    if field.is_fixed:
+        size = field.size
+        return lambda view, start: size if is_present(view) else 0
+
+    if 'struct' == field.kind:
+        view_class = schema_view.get_view_class(field.type_name)
+        return lambda view, start: view_class(view.view_buffer, start).view_size() if is_present(view) else 0
+
+    get_count = _compile_count(field)
+    element_size = field.element.size
+    if element_size is not None:
+        return lambda view, start: get_count(view) * element_size if is_present(view) else 0
+
+    # arrays of variable size structs can only be measured by walking all elements
+    view_class = schema_view.get_view_class(field.type_name)
+
+    def measure_elements(view, start):
+        if not is_present(view):
+            return 0
+
+        offset = start
+        for _ in range(get_count(view)):
+            offset += view_class(view.view_buffer, offset).view_size()
+
+        return offset - start
+
+    return measure_elements
+
+
+def _compile_count(field):
+    count = field.count
+    if isinstance(count, int):
+        return lambda view: count
+
+    if isinstance(count, SizeExpression):
+        # fields preceding the array can still be viewed, so the expression is only rejected when the array is accessed
+        def raise_unsupported_count(view):
+            raise DecodeException('"{0}" is sized by expression "{1}", which cannot be viewed'.format(field.name, field.descriptor['size']))
+
+        return raise_unsupported_count
+
+    return lambda view: getattr(view, count)
+
+
+def _require_size(buffer, name, start, end):
+    if end > len(buffer):
+        raise DecodeException('unable to view "{0}" at offset {1} in buffer with size {2}'.format(name, start, len(buffer)))
@@ -0,0 +1,65 @@
+from catparser.CatsParseException import CatsParseException
+from catparser.SchemaLayout import SizeExpression, group_unions
+
+SCALAR_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def scalar_format(size, signedness):
+    """Gets the little endian struct format of a builtin, which is a byte string for sizes other than 1, 2, 4 and 8"""
+    if size not in SCALAR_FORMATS:
+        return '{0}s'.format(size)
+
+    return SCALAR_FORMATS[size].lower() if 'signed' == signedness else SCALAR_FORMATS[size]
+
+
+def is_packable(field):
+    """Returns true if the specified field layout can be decoded as part of a run of fixed size fields with a single struct format"""
+    if field.condition:
+        return False
+
+    if 'array' == field.kind:
+        return 'byte' == field.element.type_name and isinstance(field.count, int)
+
+    return field.kind in ('byte', 'enum')
+
+
+def group_packable_fields(fields):
+    """Groups field layouts into (is_packed, fields) tuples, where runs of consecutive packable fields share a single struct format"""
+    packable_fields = []
+    for group in group_unions(fields):
+        if 1 == len(group) and is_packable(group[0]):
+            packable_fields.append(group[0])
+            continue
+
+        if packable_fields:
+            yield (True, packable_fields)
+            packable_fields = []
+
+        yield (False, group)
+
+    if packable_fields:
+        yield (True, packable_fields)
+
+
+def require_field_counts(struct_layout, action):
+    """Raises if an array of a struct layout is sized by an expression, which cannot be evaluated to perform action"""
+    for field in struct_layout.fields:
+        if isinstance(field.count, SizeExpression):
+            raise CatsParseException('array "{0}" in "{1}" is sized by expression "{2}", which cannot be {3}'.format(
+                field.name, struct_layout.name, field.descriptor['size'], action))
+
+
+def field_format(field):
+    """Gets the struct format of a packable field layout"""
+    if 'array' == field.kind:
+        return '{0}s'.format(field.count)
+
+    return scalar_format(field.size, field.element.signedness)
+
+
+def get_condition_value(type_descriptors, struct_layout, field):
+    """Gets the numeric enum value that the condition field of a conditional field layout must have for the field to be present"""
+    condition_type_name = struct_layout.get_field(field.condition).type_name
+    enum_value_descriptor = next(
+        value for value in type_descriptors[condition_type_name]['values'] if field.condition_value == value['name'])
+    return enum_value_descriptor['value']
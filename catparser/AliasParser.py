@@ -1,16 +1,11 @@
 # pylint: disable=too-few-public-methods
-from .RegexParserFactory import RegexParserFactory
+from .RegexParserFactory import RegexParser, RegexParserFactory
 from .parserutils import parse_builtin, require_user_type_name
 
 
-class AliasParser:
+class AliasParser(RegexParser):
     """Parser for `using` statements"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
-
+    def process_match(self, match):
         # aliases are only supported for builtin types
         return (
             require_user_type_name(match.group(1)),
@@ -1,11 +1,37 @@
+import time
 from collections import OrderedDict
-from .AliasParser import AliasParserFactory
+from .AliasParser import AliasParser, AliasParserFactory
 from .CatsParseException import CatsParseException
 from .CommentParser import CommentParser
-from .EnumParser import EnumParserFactory
-from .ImportParser import ImportParserFactory
+from .EnumParser import EnumParser, EnumParserFactory, EnumValueParser
+from .ImportParser import ImportParser, ImportParserFactory
+from .RegexDispatcher import RegexDispatcher
+from .SchemaLayout import SchemaLayout
 from .ScopeManager import ScopeManager
-from .StructParser import StructParserFactory
+from .StructParser import \
+    StructArrayMemberParser, StructConstParser, StructInlineParser, StructParser, StructParserFactory, StructScalarMemberParser
+
+TYPE_DISPATCHER = RegexDispatcher([
+    AliasParserFactory(),
+    EnumParserFactory(),
+    ImportParserFactory(),
+    StructParserFactory()
+])
+
+# kinds of lines reported to listeners, keyed by the type of the parser that processed the line
+LINE_KINDS = {
+    type(None): 'blank',
+    CommentParser: 'comment',
+    AliasParser: 'alias',
+    EnumParser: 'enum',
+    EnumValueParser: 'enum value',
+    ImportParser: 'import',
+    StructParser: 'struct',
+    StructConstParser: 'struct member',
+    StructInlineParser: 'struct member',
+    StructArrayMemberParser: 'struct member',
+    StructScalarMemberParser: 'struct member'
+}
 
 
 class CatsParser(ScopeManager):
@@ -15,82 +41,122 @@ class CatsParser(ScopeManager):
         self.import_resolver = import_resolver
 
         self.aspect_parser = CommentParser()
-        self.type_parser_factories = [
-            AliasParserFactory(),
-            EnumParserFactory(),
-            ImportParserFactory(),
-            StructParserFactory()
-        ]
 
         self.wip_type_descriptors = OrderedDict()
         self.active_parser = None
 
+        # indexes of the member names of all parsed struct and enum types
+        self.struct_field_names = {}
+        self.enum_value_names = {}
+
+        # layouts are linked on demand and discarded whenever a type is added
+        self.layout = None
+
+        self.listener = None
+
+    def set_listener(self, listener):
+        """Sets a listener notified about processed lines and performed validations or None to disable notifications"""
+        self.listener = listener
+
+    def _validate(self, validate, *args):
+        # validation is only timed when there is a listener
+        if not self.listener:
+            validate(*args)
+            return
+
+        start_time = time.perf_counter()
+        try:
+            validate(*args)
+        finally:
+            self.listener.validation_performed(time.perf_counter() - start_time)
+
+    def pop_scope(self):
+        """Pops the input scope after closing any type left open in it"""
+        self._close_type()
+        super().pop_scope()
+
     def process_line(self, line):
         """Processes the next line of input"""
         try:
-            self._process_line(line)
+            if not self.listener:
+                self._process_line(line)
+                return
+
+            start_time = time.perf_counter()
+            line_parser = self._process_line(line)
+            self.listener.line_processed(LINE_KINDS[type(line_parser)], time.perf_counter() - start_time)
         except Exception as ex:
             raise CatsParseException('\n'.join(self.scope()), ex)
 
     def _process_line(self, line):
+        # returns the parser that processed the line, which is None for blank lines
         self.increment_line_number()
 
         # check if current line is a cross cutting concern
         line_stripped = line.strip()
         if self.aspect_parser.try_process_line(line_stripped):
-            return
+            return self.aspect_parser
 
         # something else, so attach current aspect state to it
         partial_descriptor = self.aspect_parser.commit()
 
         # ignore blank lines
         if not line_stripped:
-            return
+            return None
 
         # close a type iff an unindented non-empty line is found
         if self.active_parser and not line.startswith('\t'):
             self._close_type()
 
-        active_factories = self.type_parser_factories if not self.active_parser else self.active_parser.factories()
-
-        factory = next(factory for factory in active_factories if factory.is_match(line_stripped))
-        parser = factory.create()
-        parse_result = parser.process_line(line_stripped)
+        parser, parse_result = self._dispatch(line_stripped)
 
         # create a new scope if the current symbol is a composite
         if not parse_result:
             self.active_parser = parser
             self.active_parser.partial_descriptor = partial_descriptor
-            return
+            return parser
 
         if self.active_parser:
             if 'type' in parse_result:
-                self._require_known_type(parse_result['type'])
-
-                # perform extra validation on some property links for better error detection/messages
-                if 'sort_key' in parse_result:
-                    # sort key processing will only occur if linked field type already exists
-                    self._require_type_with_field(parse_result['type'], parse_result['sort_key'])
-
-                if 'condition' in parse_result:
-                    # when condition is being post processed here, it is known that the linked condition field is part of
-                    # the struct and the linked condition type already exists
-
-                    # look up condition type descriptor by searching active parser descriptor layout
-                    condition_field_name = parse_result['condition']
-                    condition_type_descriptor = next(
-                        descriptor for descriptor in self.active_parser.type_descriptor['layout']
-                        if descriptor['name'] == condition_field_name
-                    )
-
-                    self._require_enum_type_with_value(condition_type_descriptor['type'], parse_result['condition_value'])
+                self._validate(self._validate_member, parse_result, self.active_parser.get_property)
 
             self.active_parser.append({**parse_result, **partial_descriptor})
+            if 'inline' == parse_result.get('disposition'):
+                self.active_parser.add_inlined_properties(self._get_struct_properties(parse_result['type']))
         elif hasattr(parse_result, 'import_file'):
             self.import_resolver(parse_result.import_file)
         else:
             self._set_type_descriptor(parse_result[0], {**parse_result[1], **partial_descriptor})
 
+        return parser
+
+    def _validate_member(self, parse_result, get_property):
+        self._require_known_type(parse_result['type'])
+
+        # perform extra validation on some property links for better error detection/messages
+        if 'sort_key' in parse_result:
+            # sort key processing will only occur if linked field type already exists
+            self._require_type_with_field(parse_result['type'], parse_result['sort_key'])
+
+        if 'condition' in parse_result:
+            # when condition is being post processed here, it is known that the linked condition field is part of
+            # the struct and the linked condition type already exists
+
+            # look up condition type descriptor in containing struct
+            condition_type_descriptor = get_property(parse_result['condition'])
+
+            self._require_enum_type_with_value(condition_type_descriptor['type'], parse_result['condition_value'])
+
+    def _dispatch(self, line_stripped):
+        # classify the line and capture its groups with a single match
+        dispatcher = TYPE_DISPATCHER if not self.active_parser else self.active_parser.dispatcher
+        factory, match = dispatcher.match(line_stripped)
+        if not factory:
+            raise CatsParseException('unable to parse line "{0}"'.format(line_stripped))
+
+        parser = factory.create()
+        return (parser, parser.process_match(match))
+
     def _close_type(self):
         if not self.active_parser:
             return
@@ -106,25 +172,75 @@ class CatsParser(ScopeManager):
         return type_name
 
     def _require_type_with_field(self, type_name, field_name):
-        type_descriptor = self.wip_type_descriptors[type_name]
-        if not any(field_name == field['name'] for field in type_descriptor['layout']):
+        if field_name not in self.struct_field_names.get(type_name, ()):
             raise CatsParseException('"{0}" does not have field "{1}"'.format(type_name, field_name))
 
     def _require_enum_type_with_value(self, type_name, value_name):
-        enum_type_descriptor = self.wip_type_descriptors[type_name]
-        if 'values' not in enum_type_descriptor:
+        if type_name not in self.enum_value_names:
             raise CatsParseException('linked type "{0}" must be an enum type'.format(type_name))
 
-        if not any(value_name == value['name'] for value in enum_type_descriptor['values']):
+        if value_name not in self.enum_value_names[type_name]:
             raise CatsParseException('linked enum type "{0}" does not contain value "{1}"'.format(type_name, value_name))
 
-    def _set_type_descriptor(self, type_name, type_descriptor):
+    def _get_struct_properties(self, type_name):
+        # named properties of a struct including the properties of its (transitively) inlined structs
+        for property_type_descriptor in self.wip_type_descriptors[type_name].get('layout', ()):
+            if 'inline' == property_type_descriptor.get('disposition'):
+                yield from self._get_struct_properties(property_type_descriptor['type'])
+            elif 'name' in property_type_descriptor:
+                yield property_type_descriptor
+
+    def _validate_linked_types(self, type_descriptor):
+        # replayed types were validated against the types visible when they were parsed, which can differ from the visible types now
+        properties = {}
+        for member in type_descriptor.get('layout', ()):
+            if 'inline' == member.get('disposition'):
+                self._require_known_type(member['type'])
+                for inlined in self._get_struct_properties(member['type']):
+                    properties.setdefault(inlined['name'], inlined)
+            elif 'name' in member:
+                properties.setdefault(member['name'], member)
+
+        def get_property(property_name):
+            if property_name not in properties:
+                raise CatsParseException('no definition for linked property "{0}"'.format(property_name))
+
+            return properties[property_name]
+
+        for member in type_descriptor.get('layout', ()):
+            if 'type' in member and 'inline' != member.get('disposition'):
+                self._validate(self._validate_member, member, get_property)
+
+    def _require_unknown_type(self, type_name):
         if type_name in self.wip_type_descriptors:
             raise CatsParseException('duplicate definition for type "{0}"'.format(type_name))
 
+    def _set_type_descriptor(self, type_name, type_descriptor):
+        self._validate(self._require_unknown_type, type_name)
         self.wip_type_descriptors[type_name] = type_descriptor
+        self.layout = None
+        if 'layout' in type_descriptor:
+            self.struct_field_names[type_name] = {field['name'] for field in type_descriptor['layout'] if 'name' in field}
+        elif 'values' in type_descriptor:
+            self.enum_value_names[type_name] = {value['name'] for value in type_descriptor['values']}
+
+    def add_type_descriptor(self, type_name, type_descriptor):
+        """Adds a previously parsed type descriptor after validating the types it links"""
+        try:
+            self._validate_linked_types(type_descriptor)
+            self._set_type_descriptor(type_name, type_descriptor)
+        except Exception as ex:
+            raise CatsParseException('\n'.join(self.scope()), ex)
 
     def type_descriptors(self):
         """Returns all parsed type descriptors"""
         self._close_type()
         return self.wip_type_descriptors
+
+    def schema_layout(self):
+        """Returns the linked layouts of all parsed structs"""
+        type_descriptors = self.type_descriptors()
+        if not self.layout:
+            self.layout = SchemaLayout(type_descriptors)
+
+        return self.layout
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+class CompactDescriptor(Mapping):
+    """Immutable slots-based type descriptor with a dict-compatible read interface"""
+    __slots__ = ()
+    KEYS = ()
+    SLOT_NAMES = {}
+
+    def __init__(self, descriptor):
+        for key, value in descriptor.items():
+            if key not in self.SLOT_NAMES:
+                raise KeyError('{0} does not support key "{1}"'.format(type(self).__name__, key))
+
+            object.__setattr__(self, self.SLOT_NAMES[key], value)
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls.SLOT_NAMES = {key: '_' + key for key in cls.KEYS}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.SLOT_NAMES[key])
+        except AttributeError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return (key for key in self.KEYS if hasattr(self, self.SLOT_NAMES[key]))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def to_dict(self):
+        """Converts this descriptor (and all nested descriptors) into plain dicts"""
+        return {key: [value.to_dict() for value in self[key]] if isinstance(self[key], tuple) else self[key] for key in self}
+
+
+class MemberDescriptor(CompactDescriptor):
+    """Compact descriptor for a struct member"""
+    KEYS = ('name', 'type', 'size', 'signedness', 'disposition', 'value', 'condition', 'condition_value', 'sort_key', 'comments')
+    __slots__ = tuple('_' + key for key in KEYS)
+
+
+class StructDescriptor(CompactDescriptor):
+    """Compact descriptor for a struct type"""
+    KEYS = ('type', 'layout', 'comments')
+    __slots__ = tuple('_' + key for key in KEYS)
+
+
+class EnumValueDescriptor(CompactDescriptor):
+    """Compact descriptor for an enum value"""
+    KEYS = ('name', 'value', 'comments')
+    __slots__ = tuple('_' + key for key in KEYS)
+
+
+class EnumDescriptor(CompactDescriptor):
+    """Compact descriptor for an enum type"""
+    KEYS = ('type', 'size', 'signedness', 'values', 'comments')
+    __slots__ = tuple('_' + key for key in KEYS)
+
+
+class BuiltinDescriptor(CompactDescriptor):
+    """Compact descriptor for a builtin (alias) type"""
+    KEYS = ('type', 'size', 'signedness', 'comments')
+    __slots__ = tuple('_' + key for key in KEYS)
+
+
+class DescriptorInterner:
+    """Creates compact descriptors, sharing a single instance across all equal descriptors"""
+    def __init__(self):
+        self.descriptors = {}
+        self.strings = {}
+
+    def intern_string(self, value):
+        """Returns the shared string equal to value"""
+        # a local table is used instead of sys.intern, which would grow the process-wide interned string table
+        return self.strings.setdefault(value, value)
+
+    def intern(self, descriptor_type, descriptor):
+        """Returns the shared compact descriptor equal to descriptor"""
+        descriptor = {key: self.intern_string(value) if isinstance(value, str) else value for key, value in descriptor.items()}
+        descriptor_key = (descriptor_type,) + tuple(sorted(descriptor.items()))
+        if descriptor_key not in self.descriptors:
+            self.descriptors[descriptor_key] = descriptor_type(descriptor)
+
+        return self.descriptors[descriptor_key]
+
+    def compact(self, type_descriptor):
+        """Converts a type descriptor into a compact descriptor"""
+        if 'struct' == type_descriptor['type']:
+            layout = tuple(self.intern(MemberDescriptor, field) for field in type_descriptor['layout'])
+            return StructDescriptor({**type_descriptor, 'layout': layout, 'comments': self.intern_string(type_descriptor['comments'])})
+
+        if 'enum' == type_descriptor['type']:
+            values = tuple(self.intern(EnumValueDescriptor, value) for value in type_descriptor['values'])
+            return EnumDescriptor({**type_descriptor, 'values': values, 'comments': self.intern_string(type_descriptor['comments'])})
+
+        return self.intern(BuiltinDescriptor, type_descriptor)
+
+
+def compact_type_descriptors(type_descriptors, interner=None):
+    """Converts all parsed type descriptors into compact descriptors"""
+    interner = interner or DescriptorInterner()
+    return OrderedDict((type_name, interner.compact(type_descriptor)) for type_name, type_descriptor in type_descriptors.items())
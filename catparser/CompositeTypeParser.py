@@ -1,14 +1,22 @@
-class CompositeTypeParser:
+from abc import abstractmethod
+from .RegexParserFactory import RegexParser
+
+
+class CompositeTypeParser(RegexParser):
     """Base for composite type parsers"""
-    def __init__(self, regex, factories):
-        self.regex = regex
-        self.sub_factories = factories
+    def __init__(self, regex, dispatcher):
+        super().__init__(regex)
+        self.dispatcher = dispatcher
         self.type_name = None
         self.type_descriptor = None
 
+    @abstractmethod
+    def process_match(self, match):
+        """Processes a match for the header line of this composite type, which opens a scope for its sub-parsers"""
+
     def factories(self):
         """Gets sub-parsers for this composite type parser"""
-        return self.sub_factories
+        return self.dispatcher.factories
 
     def commit(self):
         """Returns the composite type tuple"""
@@ -0,0 +1,69 @@
+# pylint: disable=too-few-public-methods
+from .CatsParseException import CatsParseException
+
+EMBEDDED_PREFIX = 'Embedded'
+
+
+class EntityTypes:
+    """Names of the structs registered for an entity type and version"""
+    __slots__ = ('entity_type', 'version', 'name', 'embedded_name')
+
+    def __init__(self, entity_type, version, name, embedded_name):
+        self.entity_type = entity_type
+        self.version = version
+        self.name = name
+
+        # name of the embedded counterpart, which is None when the entity cannot be embedded
+        self.embedded_name = embedded_name
+
+    def __repr__(self):
+        return 'EntityTypes(0x{0:04X}, {1}, {2}, {3})'.format(self.entity_type, self.version, self.name, self.embedded_name)
+
+
+class EntityRegistry:
+    """Registry of the structs of all entities keyed by the entityType and version constants they declare"""
+    def __init__(self, type_descriptors):
+        self.entities = {}
+        self.version_size = 0
+        for type_name, type_descriptor in type_descriptors.items():
+            if 'struct' != type_descriptor['type'] or type_name.startswith(EMBEDDED_PREFIX):
+                continue
+
+            constants = {
+                member_descriptor['name']: member_descriptor
+                for member_descriptor in type_descriptor['layout'] if 'const' == member_descriptor.get('disposition')
+            }
+            if 'entityType' not in constants:
+                continue
+
+            if 'version' not in constants:
+                raise CatsParseException('entity "{0}" must declare a version constant'.format(type_name))
+
+            embedded_name = EMBEDDED_PREFIX + type_name
+            entity_types = EntityTypes(
+                constants['entityType']['value'],
+                constants['version']['value'],
+                type_name,
+                embedded_name if embedded_name in type_descriptors else None)
+            self._add(entity_types)
+
+            # versions are compared with the low bytes of version fields, which have the size of the widest version constant
+            self.version_size = max(self.version_size, constants['version'].get('size', 1))
+
+    def _add(self, entity_types):
+        key = (entity_types.entity_type, entity_types.version)
+        if key in self.entities:
+            raise CatsParseException('"{0}" and "{1}" both have entity type 0x{2:04X} and version {3}'.format(
+                self.entities[key].name, entity_types.name, entity_types.entity_type, entity_types.version))
+
+        self.entities[key] = entity_types
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities.values())
+
+    def find(self, entity_type, version):
+        """Finds the structs registered for the specified entity type and version or returns None if there are none"""
+        return self.entities.get((entity_type, version))
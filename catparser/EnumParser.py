@@ -1,17 +1,18 @@
 # pylint: disable=too-few-public-methods
 from .CatsParseException import CatsParseException
 from .CompositeTypeParser import CompositeTypeParser
-from .RegexParserFactory import RegexParserFactory
+from .RegexDispatcher import RegexDispatcher
+from .RegexParserFactory import RegexParser, RegexParserFactory
 from .parserutils import parse_dec_or_hex, parse_builtin, require_property_name, require_user_type_name, require_primitive
 
 
 class EnumParser(CompositeTypeParser):
     """Parser for `enum` statements"""
     def __init__(self, regex):
-        super().__init__(regex, [EnumValueParserFactory()])
+        super().__init__(regex, ENUM_VALUE_DISPATCHER)
+        self.value_names = set()
 
-    def process_line(self, line):
-        match = self.regex.match(line)
+    def process_match(self, match):
         self.type_name = require_user_type_name(match.group(1))
 
         base_type = require_primitive(match.group(2))
@@ -26,10 +27,11 @@ class EnumParser(CompositeTypeParser):
     def append(self, property_value_descriptor):
         self._require_unknown_property(property_value_descriptor['name'])
 
+        self.value_names.add(property_value_descriptor['name'])
         self.type_descriptor['values'].append(property_value_descriptor)
 
     def _require_unknown_property(self, property_name):
-        if any(property_name == property_type_descriptor['name'] for property_type_descriptor in self.type_descriptor['values']):
+        if property_name in self.value_names:
             raise CatsParseException('duplicate definition for enum value "{0}"'.format(property_name))
 
 
@@ -39,13 +41,9 @@ class EnumParserFactory(RegexParserFactory):
         super().__init__(r'enum (\S+) : (u?int\d+)', EnumParser)
 
 
-class EnumValueParser:
+class EnumValueParser(RegexParser):
     """Parser for enum values"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
+    def process_match(self, match):
         return {'name': require_property_name(match.group(1)), 'value': parse_dec_or_hex(match.group(2))}
 
 
@@ -53,3 +51,6 @@ class EnumValueParserFactory(RegexParserFactory):
     """Factory for creating enum value parsers"""
     def __init__(self):
         super().__init__(r'(\S+) = (\S+)', EnumValueParser)
+
+
+ENUM_VALUE_DISPATCHER = RegexDispatcher([EnumValueParserFactory()])
@@ -1,5 +1,5 @@
 # pylint: disable=too-few-public-methods
-from .RegexParserFactory import RegexParserFactory
+from .RegexParserFactory import RegexParser, RegexParserFactory
 
 
 class ImportResult:
@@ -11,13 +11,9 @@ class ImportResult:
         return isinstance(rhs, ImportResult) and self.import_file == rhs.import_file
 
 
-class ImportParser:
+class ImportParser(RegexParser):
     """Parser for `import` statements"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
+    def process_match(self, match):
         return ImportResult(match.group(1))
 
 
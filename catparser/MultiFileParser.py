@@ -0,0 +1,127 @@
+import itertools
+import time
+from .CatsParseException import CatsParseException
+from .CatsParser import CatsParser
+from .ParseCache import ParseCache, ParseRecord, scan_imports
+from .SchemaResolver import FileSystemResolver
+from .SchemaSource import SchemaSource
+
+
+class MultiFileParser:
+    """CATS parser that resolves imports in global namespace"""
+    def __init__(self, cache=None, resolver=None, listener=None):
+        self.cats_parser = CatsParser(self._process_import_file)
+        self.cats_parser.set_listener(listener)
+        self.resolver = resolver
+        self.cache = cache
+        self.listener = listener
+
+        self.source_keys = {}
+        self.pending_keys = set()
+        self.recorders = []
+
+        # names of all files imported by the current schema mapped to true once they have been parsed
+        self.imported_names = {}
+
+    def set_include_path(self, include_path):
+        self.resolver = FileSystemResolver(include_path)
+
+    def parse(self, schema):
+        """Parses a schema source or a schema file on disk"""
+        self._process_source(SchemaSource.from_file(schema) if isinstance(schema, str) else schema)
+
+    def _process_import_file(self, filename):
+        if self.recorders:
+            self._flush_recorder()
+            self.recorders[-1][0].add_import(filename)
+
+        self._replay_import_file(filename)
+
+        if self.recorders:
+            self.recorders[-1][1] = len(self.cats_parser.wip_type_descriptors)
+
+    def _replay_import_file(self, filename):
+        # types defined by a replayed import are recorded by the file importing it, so they must not be recorded again
+        source = self._resolve(filename)
+        is_parsed = self.imported_names.get(source.name)
+        if False is is_parsed:
+            raise CatsParseException('circular import detected for "{0}"'.format(source.name))
+
+        # each file is only imported once per schema, so files can import the types they use even when their importers do too
+        if not is_parsed:
+            self._process_source(source)
+
+    def _resolve(self, filename):
+        if not self.listener:
+            return self.resolver.resolve(filename)
+
+        start_time = time.perf_counter()
+        source = self.resolver.resolve(filename)
+        self.listener.import_resolved(filename, time.perf_counter() - start_time)
+        return source
+
+    def _process_source(self, source):
+        self.imported_names[source.name] = False
+        if not self.listener:
+            self._parse_source(source)
+        else:
+            self.listener.begin_file(source.name)
+            start_time = time.perf_counter()
+            is_cached = self._parse_source(source)
+            self.listener.end_file(source.name, time.perf_counter() - start_time, is_cached)
+
+        self.imported_names[source.name] = True
+
+    def _parse_source(self, source):
+        # returns true if the source was replayed from the cache
+        if not self.cache:
+            self._parse_lines(source.name, source.lines())
+            return False
+
+        key = self._get_key(source)
+        record = self.cache.get(key)
+        if record is not None:
+            self.cats_parser.push_scope(source.name)
+            record.replay(self.cats_parser, self._replay_import_file)
+            self.cats_parser.pop_scope()
+            return True
+
+        # record all types defined directly in this file while it is being parsed
+        self.recorders.append([ParseRecord(), len(self.cats_parser.wip_type_descriptors)])
+        self._parse_lines(source.name, source.lines())
+        self._flush_recorder()
+        self.cache.put(key, self.recorders.pop()[0])
+        return False
+
+    def _parse_lines(self, name, lines):
+        self.cats_parser.push_scope(name)
+
+        for line in lines:
+            self.cats_parser.process_line(line)
+
+        self.cats_parser.pop_scope()
+
+    def _flush_recorder(self):
+        recorder = self.recorders[-1]
+        type_descriptors = self.cats_parser.wip_type_descriptors
+        for type_name in itertools.islice(type_descriptors, recorder[1], None):
+            recorder[0].add_type_descriptor(type_name, type_descriptors[type_name])
+
+        recorder[1] = len(type_descriptors)
+
+    def _get_key(self, source):
+        if source.name in self.source_keys:
+            return self.source_keys[source.name]
+
+        if source.name in self.pending_keys:
+            raise CatsParseException('circular import detected for "{0}"'.format(source.name))
+
+        # key depends on the keys of all (transitively) imported files
+        content = source.text()
+        self.pending_keys.add(source.name)
+        import_keys = [self._get_key(self._resolve(import_file)) for import_file in scan_imports(content.splitlines())]
+        self.pending_keys.remove(source.name)
+
+        key = ParseCache.calculate_key(content, import_keys)
+        self.source_keys[source.name] = key
+        return key
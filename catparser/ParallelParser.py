@@ -0,0 +1,125 @@
+# pylint: disable=too-few-public-methods
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from .CatsParseException import CatsParseException
+from .MultiFileParser import MultiFileParser
+from .ParseCache import ParseCache, scan_imports
+from .SchemaSource import SchemaSource
+
+
+class ImportNode:
+    """Schema file in an import graph"""
+    def __init__(self, source, key, import_names):
+        self.source = source
+        self.key = key
+        self.import_names = import_names
+
+
+def _parse_record(resolver, source, key, records):
+    # imports are replayed from the records of all (transitive) imports, so only source itself is parsed
+    cache = ParseCache()
+    cache.records.update(records)
+    try:
+        MultiFileParser(cache, resolver).parse(source)
+    except CatsParseException:
+        # files can use types that are only visible to their importers, so failed files are parsed again by the importing roots
+        return None
+
+    return cache.records[key]
+
+
+class ParallelParser:
+    """Parses schema roots by parsing independent files in parallel worker processes"""
+    def __init__(self, resolver, cache=None, max_workers=None):
+        self.resolver = resolver
+        self.cache = cache if cache is not None else ParseCache()
+        self.max_workers = max_workers
+        self.import_graph = None
+        self.deferred_names = None
+
+    def parse(self, schemas):
+        """Parses multiple schema sources or schema files on disk and returns the type descriptors of each"""
+        sources = [SchemaSource.from_file(schema) if isinstance(schema, str) else schema for schema in schemas]
+
+        # materialize all sources so that they can be sent to worker processes and read more than once
+        sources = [SchemaSource.from_string(source.name, source.text()) for source in sources]
+
+        self.import_graph = {}
+        for source in sources:
+            self._add_import_node(source, set())
+
+        self.deferred_names = set()
+        self._parse_import_graph()
+
+        # merge by replaying the records of each root in order, which preserves ordering and duplicate detection
+        # deferred files are not cached, so they are parsed sequentially in the context of their importing roots
+        all_type_descriptors = []
+        for source in sources:
+            file_parser = MultiFileParser(self.cache, self.resolver)
+            file_parser.parse(source)
+            all_type_descriptors.append(file_parser.cats_parser.type_descriptors())
+
+        return all_type_descriptors
+
+    def _add_import_node(self, source, pending_names):
+        if source.name in self.import_graph:
+            return self.import_graph[source.name].key
+
+        if source.name in pending_names:
+            raise CatsParseException('circular import detected for "{0}"'.format(source.name))
+
+        content = source.text()
+        pending_names.add(source.name)
+        import_sources = [self.resolver.resolve(import_file) for import_file in scan_imports(content.splitlines())]
+        import_keys = [self._add_import_node(import_source, pending_names) for import_source in import_sources]
+        pending_names.remove(source.name)
+
+        key = ParseCache.calculate_key(content, import_keys)
+        self.import_graph[source.name] = ImportNode(source, key, [import_source.name for import_source in import_sources])
+        return key
+
+    def _get_transitive_import_names(self, name, import_names):
+        for import_name in self.import_graph[name].import_names:
+            if import_name not in import_names:
+                import_names.add(import_name)
+                self._get_transitive_import_names(import_name, import_names)
+
+        return import_names
+
+    def _is_parsed(self, name):
+        return self.import_graph[name].key in self.cache.records
+
+    def _is_done(self, name):
+        return name in self.deferred_names or self._is_parsed(name)
+
+    def _parse_import_graph(self):
+        pending_names = [name for name, node in self.import_graph.items() if self.cache.get(node.key) is None]
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            futures = {}
+            while pending_names or futures:
+                # a file can be parsed as soon as all of its imports have been parsed, and is deferred when any of them is deferred
+                ready_names = [name for name in pending_names if all(self._is_done(import_name) for import_name in
+                                                                     self.import_graph[name].import_names)]
+                for name in ready_names:
+                    pending_names.remove(name)
+                    node = self.import_graph[name]
+                    if any(import_name in self.deferred_names for import_name in node.import_names):
+                        self.deferred_names.add(name)
+                        continue
+
+                    records = {
+                        self.import_graph[import_name].key: self.cache.records[self.import_graph[import_name].key]
+                        for import_name in self._get_transitive_import_names(name, set())
+                    }
+                    futures[executor.submit(_parse_record, self.resolver, node.source, node.key, records)] = name
+
+                if not futures:
+                    continue
+
+                completed_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in completed_futures:
+                    name = futures.pop(future)
+                    record = future.result()
+                    if record is None:
+                        self.deferred_names.add(name)
+                    else:
+                        self.cache.put(self.import_graph[name].key, record)
@@ -0,0 +1,56 @@
+import hashlib
+import re
+from .PickleStore import PickleStore, calculate_sources_version
+
+# any change to the parser sources invalidates all cached records
+PARSER_VERSION = calculate_sources_version(__file__)
+IMPORT_REGEX = re.compile(r'^import "([\S ]+)"$')
+
+
+def scan_imports(lines):
+    """Returns the names of all files imported by the specified lines"""
+    imports = []
+    for line in lines:
+        # imports are only valid at top level, so indented lines can be skipped without matching
+        if line.startswith('import '):
+            match = IMPORT_REGEX.match(line.strip())
+            if match:
+                imports.append(match.group(1))
+
+    return imports
+
+
+class ParseRecord:
+    """Ordered sequence of imports and type definitions produced by parsing a single file"""
+    def __init__(self):
+        self.events = []
+
+    def add_import(self, import_file):
+        """Records an import statement"""
+        self.events.append(('import', import_file))
+
+    def add_type_descriptor(self, type_name, type_descriptor):
+        """Records a type definition"""
+        self.events.append(('type', type_name, type_descriptor))
+
+    def replay(self, cats_parser, import_resolver):
+        """Reapplies all recorded events to a parser"""
+        for event in self.events:
+            if 'import' == event[0]:
+                import_resolver(event[1])
+            else:
+                cats_parser.add_type_descriptor(event[1], event[2])
+
+
+class ParseCache(PickleStore):
+    """Cache of parse records keyed by file content, optionally persisted to disk"""
+    @staticmethod
+    def calculate_key(content, import_keys):
+        """Calculates the cache key for a file given its content and the keys of its imports"""
+        hasher = hashlib.sha256()
+        hasher.update(PARSER_VERSION.encode('ascii'))
+        hasher.update(content.encode('utf8'))
+        for import_key in import_keys:
+            hasher.update(import_key.encode('ascii'))
+
+        return hasher.hexdigest()
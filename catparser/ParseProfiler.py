@@ -0,0 +1,110 @@
+# pylint: disable=too-few-public-methods
+
+
+class ParseListener:
+    """Listener notified about parser progress, which ignores all notifications"""
+    def begin_file(self, name):
+        """Called before a file is parsed or replayed from the cache"""
+
+    def end_file(self, name, elapsed_time, is_cached):
+        """Called after a file (and all of its imports) is parsed or replayed from the cache"""
+
+    def line_processed(self, kind, elapsed_time):
+        """Called after a line of the specified kind is processed"""
+
+    def import_resolved(self, filename, elapsed_time):
+        """Called after an imported file is resolved"""
+
+    def validation_performed(self, elapsed_time):
+        """Called after a type link or duplicate definition validation is performed"""
+
+
+class ProfileStatistics:
+    """Accumulated count and time of a profiled operation"""
+    def __init__(self):
+        self.count = 0
+        self.time = 0
+
+    def add(self, elapsed_time):
+        """Adds an observation"""
+        self.count += 1
+        self.time += elapsed_time
+
+
+class FileStatistics(ProfileStatistics):
+    """Accumulated statistics of a profiled file"""
+    def __init__(self):
+        super().__init__()
+        self.num_lines = 0
+        self.num_cached = 0
+
+
+class ActiveFile:
+    """File that is currently being profiled"""
+    def __init__(self):
+        self.num_lines = 0
+        self.imports_time = 0
+
+        # time of the imports processed by the import line currently being processed
+        self.pending_import_time = 0
+
+
+class ParseProfiler(ParseListener):
+    """Listener that aggregates parser timings by file and by line kind"""
+    def __init__(self):
+        self.files = {}
+        self.line_kinds = {}
+        self.imports = ProfileStatistics()
+        self.validations = ProfileStatistics()
+
+        self.active_files = []
+
+    def begin_file(self, name):
+        self.active_files.append(ActiveFile())
+
+    def end_file(self, name, elapsed_time, is_cached):
+        # files are reported with their own time, which excludes the time of their imports
+        active_file = self.active_files.pop()
+        file_statistics = self.files.setdefault(name, FileStatistics())
+        file_statistics.add(elapsed_time - active_file.imports_time)
+        file_statistics.num_lines += active_file.num_lines
+        file_statistics.num_cached += int(is_cached)
+
+        if self.active_files:
+            self.active_files[-1].imports_time += elapsed_time
+            self.active_files[-1].pending_import_time += elapsed_time
+
+    def line_processed(self, kind, elapsed_time):
+        if self.active_files:
+            active_file = self.active_files[-1]
+            active_file.num_lines += 1
+
+            # exclude the time spent parsing the imported file from the time of the import line
+            if 'import' == kind:
+                elapsed_time -= active_file.pending_import_time
+                active_file.pending_import_time = 0
+
+        self.line_kinds.setdefault(kind, ProfileStatistics()).add(elapsed_time)
+
+    def import_resolved(self, filename, elapsed_time):
+        self.imports.add(elapsed_time)
+
+    def validation_performed(self, elapsed_time):
+        self.validations.add(elapsed_time)
+
+    def report(self):
+        """Formats all aggregated timings as lines of text"""
+        lines = ['{0:<60} {1:>6} {2:>8} {3:>6} {4:>10}'.format('file', 'parses', 'lines', 'cached', 'self ms')]
+        for name, file_statistics in sorted(self.files.items(), key=lambda item: -item[1].time):
+            lines.append('{0:<60} {1:>6} {2:>8} {3:>6} {4:>10.2f}'.format(
+                name, file_statistics.count, file_statistics.num_lines, file_statistics.num_cached, file_statistics.time * 1000))
+
+        lines += ['', '{0:<60} {1:>15} {2:>6} {3:>10}'.format('line kind', 'lines', '', 'ms')]
+        for kind, kind_statistics in sorted(self.line_kinds.items(), key=lambda item: -item[1].time):
+            lines.append('{0:<60} {1:>15} {2:>6} {3:>10.2f}'.format(kind, kind_statistics.count, '', kind_statistics.time * 1000))
+
+        lines += ['']
+        for name, statistics in [('import resolution', self.imports), ('validation', self.validations)]:
+            lines.append('{0:<60} {1:>15} {2:>6} {3:>10.2f}'.format(name, statistics.count, '', statistics.time * 1000))
+
+        return lines
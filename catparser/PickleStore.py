@@ -0,0 +1,65 @@
+import hashlib
+import os
+import pickle
+
+
+def calculate_sources_version(module_filename):
+    """Calculates a hash of all python sources in the package containing module_filename, which changes with any of them"""
+    hasher = hashlib.sha256()
+    package_directory = os.path.dirname(os.path.abspath(module_filename))
+    for filename in sorted(os.listdir(package_directory)):
+        if filename.endswith('.py'):
+            with open(os.path.join(package_directory, filename), 'rb') as source_file:
+                hasher.update(source_file.read())
+
+    return hasher.hexdigest()
+
+
+class PickleStore:
+    """Store of values keyed by content hashes, which is kept in memory and optionally persisted to disk as pickle files"""
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.records = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Gets the value associated with key or None if it is not stored"""
+        value = self.records.get(key)
+        if value is None and self.directory:
+            value = self._load(key)
+            if value is not None:
+                self.records[key] = value
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def put(self, key, value):
+        """Associates value with key"""
+        self.records[key] = value
+        if not self.directory:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write to a temporary file first so that concurrent readers never observe a partial value
+        value_path = self._value_path(key)
+        temporary_path = '{0}.{1}.tmp'.format(value_path, os.getpid())
+        with open(temporary_path, 'wb') as value_file:
+            pickle.dump(value, value_file, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_path, value_path)
+
+    def _load(self, key):
+        try:
+            with open(self._value_path(key), 'rb') as value_file:
+                return pickle.load(value_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _value_path(self, key):
+        return os.path.join(self.directory, '{0}.pickle'.format(key))
@@ -0,0 +1,42 @@
+# pylint: disable=too-few-public-methods
+import re
+
+
+class SubMatch:
+    """View of the groups captured by a single alternative of a combined regex match"""
+    __slots__ = ('match', 'offset')
+
+    def __init__(self, match, offset):
+        self.match = match
+        self.offset = offset
+
+    def group(self, index):
+        """Returns the subgroup of the alternative with the specified (one-based) index"""
+        return self.match.group(self.offset + index)
+
+
+class RegexDispatcher:
+    """Classifies a line among multiple parser factories with a single combined regex match"""
+    def __init__(self, factories):
+        self.factories = factories
+
+        # each factory pattern is wrapped in an outer group that is always the last group closed by a successful match,
+        # so match.lastindex identifies the matching factory
+        patterns = []
+        self.group_factories = {}
+        group_index = 1
+        for factory in factories:
+            patterns.append('({0})'.format(factory.pattern))
+            self.group_factories[group_index] = factory
+            group_index += 1 + factory.regex.groups
+
+        # alternatives are tried in order, so the first factory with a full line match is selected
+        self.regex = re.compile('^(?:{0})$'.format('|'.join(patterns)))
+
+    def match(self, line):
+        """Returns a (factory, match) tuple for the first factory matching line or (None, None) if there is no match"""
+        match = self.regex.match(line)
+        if not match:
+            return (None, None)
+
+        return (self.group_factories[match.lastindex], SubMatch(match, match.lastindex))
@@ -1,9 +1,25 @@
+from abc import ABC, abstractmethod
 import re
 
 
+class RegexParser(ABC):
+    """Base for parsers that extract information from a regex match"""
+    def __init__(self, regex):
+        self.regex = regex
+
+    def process_line(self, line):
+        """Processes a line that is a match for this parser's regex"""
+        return self.process_match(self.regex.match(line))
+
+    @abstractmethod
+    def process_match(self, match):
+        """Processes a match for this parser's regex"""
+
+
 class RegexParserFactory:
     """Base for top-level parser factories"""
     def __init__(self, regex, parser_type):
+        self.pattern = regex
         self.regex = re.compile('^{0}$'.format(regex))
         self.parser_type = parser_type
 
@@ -0,0 +1,232 @@
+# pylint: disable=too-few-public-methods
+from collections import namedtuple
+import itertools
+from .CatsParseException import CatsParseException
+from .parserutils import get_size_references
+
+# resolved binary layout of a type used by a field or by the elements of an array field
+ElementLayout = namedtuple('ElementLayout', ['type_name', 'kind', 'size', 'signedness', 'struct_layout'])
+ElementLayout.__new__.__defaults__ = (None, None)
+
+# count of an array sized by the difference of two fields (such as `size - payloadSize`), which generic codecs cannot read
+SizeExpression = namedtuple('SizeExpression', ['minuend', 'subtrahend'])
+
+
+class FieldLayout:
+    """Resolved binary layout of a single serialized struct field"""
+    __slots__ = ('name', 'kind', 'size', 'element', 'count', 'offset', 'base', 'descriptor')
+
+    def __init__(self, descriptor, element, offset, base):
+        self.name = descriptor['name']
+        self.element = element
+        self.count = None
+        self.descriptor = descriptor
+
+        # field starts offset bytes after the end of the variable size field named base (or the start of the struct)
+        self.offset = offset
+        self.base = base
+
+        if _is_array(descriptor):
+            self.kind = 'array'
+            self.count = _parse_count(descriptor['size'])
+            self.size = self.count * element.size if isinstance(self.count, int) and element.size is not None else None
+        else:
+            self.kind = element.kind
+            self.size = element.size
+
+    @property
+    def type_name(self):
+        """Gets the name of the (element) type"""
+        return self.element.type_name
+
+    @property
+    def condition(self):
+        """Gets the name of the field the presence of this field depends on or None if the field is unconditional"""
+        return self.descriptor.get('condition')
+
+    @property
+    def condition_value(self):
+        """Gets the enum value of the condition field for which this field is present"""
+        return self.descriptor.get('condition_value')
+
+    @property
+    def is_fixed(self):
+        """Returns true if the field has a fixed size"""
+        return self.size is not None
+
+    def __repr__(self):
+        return 'FieldLayout({0}, {1}, size={2}, offset={3}, base={4})'.format(self.name, self.kind, self.size, self.offset, self.base)
+
+
+class StructLayout:
+    """Resolved binary layout of a struct with all inline members flattened"""
+    def __init__(self, name, fields, constants):
+        self.name = name
+        self.fields = tuple(fields)
+        self.constants = constants
+
+        self.field_map = {}
+        self.count_fields = {}
+        for field in self.fields:
+            self.field_map.setdefault(field.name, field)
+            if 'array' == field.kind and isinstance(field.count, str):
+                self.count_fields.setdefault(field.count, []).append(field.name)
+
+        self.variable_fields = tuple(field for field in self.fields if not field.is_fixed)
+
+        # size of all fixed size fields and size of the fixed size fields preceding the first variable size field
+        self.fixed_size = sum(max(field.size for field in group) for group in group_unions(self.fields) if group[0].is_fixed)
+        self.fixed_prefix_size = self.variable_fields[0].offset if self.variable_fields else self.fixed_size
+
+    @property
+    def is_fixed(self):
+        """Returns true if the struct has a fixed size"""
+        return not self.variable_fields
+
+    @property
+    def size(self):
+        """Gets the size of the struct or None if it has a variable size"""
+        return None if self.variable_fields else self.fixed_size
+
+    def get_field(self, name):
+        """Gets the field with the specified name"""
+        if name not in self.field_map:
+            raise CatsParseException('"{0}" does not have field "{1}"'.format(self.name, name))
+
+        return self.field_map[name]
+
+    def offset_of(self, name):
+        """Gets the byte offset of the specified field, which must not follow a variable size field"""
+        field = self.get_field(name)
+        if field.base:
+            raise CatsParseException('offset of "{0}" in "{1}" depends on variable size field "{2}"'.format(name, self.name, field.base))
+
+        return field.offset
+
+
+class SchemaLayout:
+    """Links parsed type descriptors into struct layouts with precomputed offsets and sizes"""
+    def __init__(self, type_descriptors):
+        self.type_descriptors = type_descriptors
+        self.struct_layouts = {}
+        self.element_layouts = {}
+        self.pending_names = set()
+
+    def __getitem__(self, type_name):
+        return self.get_struct_layout(type_name)
+
+    def resolve_all(self):
+        """Resolves the layouts of all structs in the schema"""
+        return {
+            type_name: self.get_struct_layout(type_name)
+            for type_name, type_descriptor in self.type_descriptors.items() if 'struct' == type_descriptor['type']
+        }
+
+    def get_struct_layout(self, type_name):
+        """Gets the (memoized) layout of the specified struct"""
+        if type_name in self.struct_layouts:
+            return self.struct_layouts[type_name]
+
+        if type_name in self.pending_names:
+            raise CatsParseException('struct "{0}" recursively contains itself'.format(type_name))
+
+        type_descriptor = self._get_type_descriptor(type_name)
+        if 'struct' != type_descriptor['type']:
+            raise CatsParseException('linked type "{0}" must be a struct type'.format(type_name))
+
+        self.pending_names.add(type_name)
+        constants = {}
+        member_descriptors = self._flatten(type_descriptor, constants)
+        struct_layout = StructLayout(type_name, self._link(type_name, member_descriptors), constants)
+        self.pending_names.remove(type_name)
+
+        self.struct_layouts[type_name] = struct_layout
+        return struct_layout
+
+    def get_element_layout(self, type_name):
+        """Gets the (memoized) layout of the specified non-inline type"""
+        if type_name not in self.element_layouts:
+            self.element_layouts[type_name] = self._resolve_element(type_name)
+
+        return self.element_layouts[type_name]
+
+    def _get_type_descriptor(self, type_name):
+        if type_name not in self.type_descriptors:
+            raise CatsParseException('no definition for linked type "{0}"'.format(type_name))
+
+        return self.type_descriptors[type_name]
+
+    def _resolve_element(self, type_name):
+        if 'byte' == type_name:
+            return ElementLayout(type_name, 'byte', 1, 'unsigned')
+
+        type_descriptor = self._get_type_descriptor(type_name)
+        if 'struct' == type_descriptor['type']:
+            struct_layout = self.get_struct_layout(type_name)
+            return ElementLayout(type_name, 'struct', struct_layout.size, struct_layout=struct_layout)
+
+        # aliases are reduced to builtin byte types by the parser
+        kind = 'enum' if 'enum' == type_descriptor['type'] else 'byte'
+        return ElementLayout(type_name, kind, type_descriptor['size'], type_descriptor['signedness'])
+
+    def _flatten(self, type_descriptor, constants):
+        member_descriptors = []
+        for member_descriptor in type_descriptor['layout']:
+            disposition = member_descriptor.get('disposition')
+            if 'const' == disposition:
+                # constants are not serialized, and outer constants take precedence over inlined constants
+                constants.setdefault(member_descriptor['name'], member_descriptor)
+            elif 'inline' == disposition:
+                member_descriptors += self._flatten(self._get_type_descriptor(member_descriptor['type']), constants)
+            else:
+                member_descriptors.append(member_descriptor)
+
+        return member_descriptors
+
+    def _link(self, type_name, member_descriptors):
+        fields = []
+        offset = 0
+        base = None
+        for group in group_unions(member_descriptors):
+            group_fields = [FieldLayout(descriptor, self._resolve_member_element(descriptor), offset, base) for descriptor in group]
+            if all(field.is_fixed for field in group_fields):
+                # conditional fields sharing a condition are alternatives that occupy the same bytes
+                offset += max(field.size for field in group_fields)
+            elif 1 == len(group_fields):
+                offset = 0
+                base = group_fields[0].name
+            else:
+                raise CatsParseException('conditional field "{0}" in "{1}" must have a fixed size'.format(group_fields[0].name, type_name))
+
+            fields += group_fields
+
+        return fields
+
+    def _resolve_member_element(self, member_descriptor):
+        if 'byte' == member_descriptor['type'] and not _is_array(member_descriptor):
+            return ElementLayout('byte', 'byte', member_descriptor['size'], member_descriptor['signedness'])
+
+        return self.get_element_layout(member_descriptor['type'])
+
+
+def _parse_count(size):
+    size_references = get_size_references(size)
+    return SizeExpression(*size_references) if 2 == len(size_references) else size
+
+
+def _is_array(member_descriptor):
+    # builtin scalars are the only non-array members with a size and always have a signedness
+    return 'size' in member_descriptor and 'signedness' not in member_descriptor
+
+
+def group_unions(fields):
+    """Groups consecutive conditional fields sharing a condition field, which occupy the same bytes"""
+    groups = []
+    for condition, group in itertools.groupby(fields, key=_get_condition):
+        groups += [list(group)] if condition else [[field] for field in group]
+
+    return groups
+
+
+def _get_condition(field):
+    return field.condition if isinstance(field, FieldLayout) else field.get('condition')
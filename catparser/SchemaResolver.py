@@ -0,0 +1,44 @@
+# pylint: disable=too-few-public-methods
+import os
+from .CatsParseException import CatsParseException
+from .SchemaSource import SchemaSource
+
+
+class FileSystemResolver:
+    """Resolves imports relative to an include directory, caching the text of each file"""
+    def __init__(self, include_path):
+        self.include_path = include_path
+        self.texts = {}
+
+    def resolve(self, import_file):
+        """Returns the source for an imported file"""
+        filename = os.path.join(self.include_path, import_file)
+        if filename not in self.texts:
+            with open(filename) as input_file:
+                self.texts[filename] = input_file.read()
+
+        return SchemaSource.from_string(filename, self.texts[filename])
+
+    def invalidate(self, filename=None):
+        """Discards the cached text of a file (or all files when no filename is specified)"""
+        if filename is None:
+            self.texts.clear()
+        else:
+            self.texts.pop(filename, None)
+
+
+class MappingResolver:
+    """Resolves imports from a mapping of filenames to text or bytes"""
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.texts = {}
+
+    def resolve(self, import_file):
+        """Returns the source for an imported file"""
+        if import_file not in self.texts:
+            if import_file not in self.mapping:
+                raise CatsParseException('unable to resolve import "{0}"'.format(import_file))
+
+            self.texts[import_file] = SchemaSource.from_string(import_file, self.mapping[import_file]).text()
+
+        return SchemaSource.from_string(import_file, self.texts[import_file])
@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+import io
+
+
+def _decode(line):
+    return line.decode('utf8') if isinstance(line, (bytes, bytearray)) else line
+
+
+class SchemaSource(ABC):
+    """Named schema content that can be consumed lazily line by line"""
+    def __init__(self, name):
+        self.name = name
+
+    @abstractmethod
+    def lines(self):
+        """Returns an iterator over all lines"""
+
+    @abstractmethod
+    def text(self):
+        """Returns the entire content"""
+
+    @staticmethod
+    def from_file(filename):
+        """Creates a source around a file on disk"""
+        return FileSchemaSource(filename)
+
+    @staticmethod
+    def from_string(name, text):
+        """Creates a source around in-memory text or bytes"""
+        return StringSchemaSource(name, _decode(text))
+
+    @staticmethod
+    def from_stream(name, stream):
+        """Creates a source around a text or binary file-like object"""
+        return StreamSchemaSource(name, stream)
+
+
+class FileSchemaSource(SchemaSource):
+    """Schema source around a file on disk"""
+    def lines(self):
+        with open(self.name) as input_file:
+            for line in input_file:
+                yield line
+
+    def text(self):
+        with open(self.name) as input_file:
+            return input_file.read()
+
+
+class StringSchemaSource(SchemaSource):
+    """Schema source around in-memory text"""
+    def __init__(self, name, text):
+        super().__init__(name)
+        self.content = text
+
+    def lines(self):
+        return iter(io.StringIO(self.content))
+
+    def text(self):
+        return self.content
+
+
+class StreamSchemaSource(SchemaSource):
+    """Schema source around a file-like object, which can only be consumed once"""
+    def __init__(self, name, stream):
+        super().__init__(name)
+        self.stream = stream
+        self.content = None
+
+    def lines(self):
+        if self.content is not None:
+            return iter(io.StringIO(self.content))
+
+        return (_decode(line) for line in self.stream)
+
+    def text(self):
+        if self.content is None:
+            self.content = _decode(self.stream.read())
+
+        return self.content
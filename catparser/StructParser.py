@@ -1,9 +1,10 @@
 # pylint: disable=too-few-public-methods
 from .CatsParseException import CatsParseException
 from .CompositeTypeParser import CompositeTypeParser
-from .RegexParserFactory import RegexParserFactory
+from .RegexDispatcher import RegexDispatcher
+from .RegexParserFactory import RegexParser, RegexParserFactory
 from .parserutils import \
-    is_builtin, is_dec_or_hex, is_primitive, \
+    get_size_references, is_builtin, is_dec_or_hex, is_primitive, \
     parse_builtin, parse_dec_or_hex, require_property_name, require_user_type_name
 
 
@@ -12,21 +13,20 @@ from .parserutils import \
 class StructParser(CompositeTypeParser):
     """Parser for `struct` statements"""
     def __init__(self, regex):
-        super().__init__(regex, [
-            StructConstParserFactory(),
-            StructInlineParserFactory(),
-            StructArrayMemberParserFactory(),
-            StructScalarMemberParserFactory()
-        ])
-
-    def process_line(self, line):
-        match = self.regex.match(line)
+        super().__init__(regex, STRUCT_MEMBER_DISPATCHER)
+
+        # indexes of layout, which allow all property checks to be performed in constant time
+        self.named_properties = {}
+        self.property_uids = set()
+
+    def process_match(self, match):
         self.type_name = require_user_type_name(match.group(1))
         self.type_descriptor = {'type': 'struct', 'layout': []}
 
     def append(self, property_type_descriptor):
         if 'size' in property_type_descriptor:
-            self._require_known_property(property_type_descriptor['size'])
+            for size_reference in get_size_references(property_type_descriptor['size']):
+                self._require_known_property(size_reference)
 
         if 'condition' in property_type_descriptor:
             self._require_known_property(property_type_descriptor['condition'], False)
@@ -34,21 +34,31 @@ class StructParser(CompositeTypeParser):
         descriptor_uid = self._get_descriptor_uid(property_type_descriptor)
         if descriptor_uid[0]:
             self._require_unknown_property(descriptor_uid)
+            self.property_uids.add(descriptor_uid)
+            self.named_properties.setdefault(descriptor_uid[0], property_type_descriptor)
 
         self.type_descriptor['layout'].append(property_type_descriptor)
 
+    def add_inlined_properties(self, property_type_descriptors):
+        """Makes the named properties of an inlined struct available to size and condition references"""
+        for property_type_descriptor in property_type_descriptors:
+            self.named_properties.setdefault(property_type_descriptor['name'], property_type_descriptor)
+
+    def get_property(self, property_name):
+        """Gets the first appended property with the specified name"""
+        self._require_known_property(property_name, False)
+        return self.named_properties[property_name]
+
     def _require_known_property(self, property_name, allow_numeric=True):
         # size can be a constant represented by a numeric type
         if allow_numeric and not isinstance(property_name, str):
             return
 
-        if all('name' not in property_type_descriptor or property_name != property_type_descriptor['name']
-               for property_type_descriptor in self.type_descriptor['layout']):
+        if property_name not in self.named_properties:
             raise CatsParseException('no definition for referenced property "{0}"'.format(property_name))
 
     def _require_unknown_property(self, descriptor_uid):
-        if any(descriptor_uid == self._get_descriptor_uid(property_type_descriptor)
-               for property_type_descriptor in self.type_descriptor['layout']):
+        if descriptor_uid in self.property_uids:
             raise CatsParseException('duplicate definition for property "{0}"'.format(descriptor_uid))
 
     @staticmethod
@@ -66,13 +76,9 @@ class StructParserFactory(RegexParserFactory):
 # region StructConstParser(Factory)
 
 
-class StructConstParser:
+class StructConstParser(RegexParser):
     """Parser for const struct members"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
+    def process_match(self, match):
         type_name = match.group(1)
 
         const_descriptor = {
@@ -99,14 +105,10 @@ class StructConstParserFactory(RegexParserFactory):
 
 # region StructInlineParser(Factory)
 
-class StructInlineParser:
+class StructInlineParser(RegexParser):
     """Parser for inline struct members"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
+    def process_match(self, match):
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
-        match = self.regex.match(line)
         return {'type': match.group(1), 'disposition': 'inline'}
 
 
@@ -120,18 +122,17 @@ class StructInlineParserFactory(RegexParserFactory):
 # region StructArrayMemberParser(Factory)
 
 
-class StructArrayMemberParser:
+class StructArrayMemberParser(RegexParser):
     """Parser for non-inline array struct members"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
-
+    def process_match(self, match):
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
         array_size = match.group(3)
         if is_dec_or_hex(array_size):
             array_size = parse_dec_or_hex(array_size)
+        elif ' - ' in array_size:
+            # size expressions are kept as text, so that descriptors only contain plain values
+            for size_reference in get_size_references(array_size):
+                require_property_name(size_reference)
 
         property_type_descriptor = {
             'type': match.group(2),
@@ -148,20 +149,16 @@ class StructArrayMemberParser:
 class StructArrayMemberParserFactory(RegexParserFactory):
     """Factory for creating struct member parsers"""
     def __init__(self):
-        super().__init__(r'(\S+) = array\((\S+), (\S+)(, sort_key=(\S+))?\)', StructArrayMemberParser)
+        super().__init__(r'(\S+) = array\((\S+), (\S+|\S+ - \S+)(, sort_key=(\S+))?\)', StructArrayMemberParser)
 
 # endregion
 
 # region StructScalarMemberParser(Factory)
 
 
-class StructScalarMemberParser:
+class StructScalarMemberParser(RegexParser):
     """Parser for non-inline scalar struct members"""
-    def __init__(self, regex):
-        self.regex = regex
-
-    def process_line(self, line):
-        match = self.regex.match(line)
+    def process_match(self, match):
         linked_type_name = match.group(2)
 
         # type is resolved to exist upstream, so its naming doesn't need to be checked here
@@ -184,3 +181,12 @@ class StructScalarMemberParserFactory(RegexParserFactory):
         super().__init__(r'(\S+) = (\S+)( if (\S+) equals (\S+))?', StructScalarMemberParser)
 
 # endregion
+
+
+# sub-factories are shared by all struct parsers, so their patterns are only compiled once per process
+STRUCT_MEMBER_DISPATCHER = RegexDispatcher([
+    StructConstParserFactory(),
+    StructInlineParserFactory(),
+    StructArrayMemberParserFactory(),
+    StructScalarMemberParserFactory()
+])
@@ -53,6 +53,11 @@ def parse_dec_or_hex(string):
     return int(string, base)
 
 
+def get_size_references(size):
+    """Gets the numbers and property names an array size consists of, where a second reference is subtracted from the first"""
+    return size.split(' - ') if isinstance(size, str) else [size]
+
+
 def is_builtin(type_name):
     return REGEXES['int_or_uint'].match(type_name) or REGEXES['binary_fixed_type'].match(type_name)
 
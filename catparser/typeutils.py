@@ -0,0 +1,33 @@
+from collections import deque
+import hashlib
+import json
+
+
+def find_type_closure(type_descriptors, type_name):
+    """Returns the names of the specified type and all types it (transitively) references, in discovery order"""
+    closure = []
+    pending_type_names = deque([type_name])
+    visited_type_names = set()
+    while pending_type_names:
+        current_type_name = pending_type_names.popleft()
+        if current_type_name in visited_type_names or current_type_name not in type_descriptors:
+            continue
+
+        visited_type_names.add(current_type_name)
+        closure.append(current_type_name)
+        for field in type_descriptors[current_type_name].get('layout', []):
+            if 'type' in field:
+                pending_type_names.append(field['type'])
+
+    return closure
+
+
+def calculate_closure_hash(type_descriptors, type_name):
+    """Calculates a hash of the descriptors of all types in the closure of the specified type"""
+    hasher = hashlib.sha256()
+    for closure_type_name in find_type_closure(type_descriptors, type_name):
+        # compact descriptors are read-only mappings, which are hashed like the equivalent dicts
+        closure_type_json = json.dumps([closure_type_name, type_descriptors[closure_type_name]], sort_keys=True, default=dict)
+        hasher.update(closure_type_json.encode('utf8'))
+
+    return hasher.hexdigest()
@@ -1,5 +1,7 @@
 from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.py_codec.PyCodecGenerator import PyCodecGenerator
 
 AVAILABLE_GENERATORS = {
-    'cpp_builder': BuilderGenerator
+    'cpp_builder': BuilderGenerator,
+    'py_codec': PyCodecGenerator
 }
@@ -0,0 +1,47 @@
+# pylint: disable=too-few-public-methods
+import hashlib
+import os
+
+
+def _hash_file(filename):
+    with open(filename, 'rb') as input_file:
+        return hashlib.sha256(input_file.read()).digest()
+
+
+class OutputWriter:
+    """Writes generated files atomically, skipping files whose content is unchanged so that their modification times are kept"""
+    def __init__(self, directory):
+        self.directory = directory
+        self.written = 0
+        self.unchanged = 0
+
+    def write(self, descriptor):
+        """Writes the code of descriptor when it differs from the existing file and returns True when the file was written"""
+        content = ''.join('%s\n' % line for line in descriptor.code).encode('utf8')
+        output_filename = os.path.join(self.directory, descriptor.filename)
+        if self._is_unchanged(output_filename, content):
+            self.unchanged += 1
+            return False
+
+        self._write_atomic(output_filename, content)
+        self.written += 1
+        return True
+
+    @staticmethod
+    def _is_unchanged(filename, content):
+        try:
+            if os.stat(filename).st_size != len(content):
+                return False
+
+            return _hash_file(filename) == hashlib.sha256(content).digest()
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _write_atomic(filename, content):
+        # write to a temporary file first so that builds never observe a partially written file
+        temporary_path = '{0}.{1}.tmp'.format(filename, os.getpid())
+        with open(temporary_path, 'wb') as output_file:
+            output_file.write(content)
+
+        os.replace(temporary_path, filename)
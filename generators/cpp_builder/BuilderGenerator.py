@@ -1,43 +1,95 @@
 # pylint: disable=too-few-public-methods
+from concurrent.futures import ProcessPoolExecutor
+import os
 from generators.Descriptor import Descriptor
+from .HintCache import HINT_CACHE
 from .HeaderGenerator import HeaderGenerator
 from .ImplementationGenerator import ImplementationGenerator
 
 
+def _generate_transaction(schema, options, name):
+    header_generator = HeaderGenerator(schema, options, name)
+    header_descriptor = Descriptor('{}.h'.format(header_generator.builder_name()), header_generator.generate())
+
+    implementation_generator = ImplementationGenerator(schema, options, name)
+    implementation_descriptor = Descriptor('{}.cpp'.format(implementation_generator.builder_name()), implementation_generator.generate())
+    return [header_descriptor, implementation_descriptor]
+
+
+def _read_copyright(copyright_file):
+    if not os.path.isfile(copyright_file):
+        return ''
+
+    with open(copyright_file) as header:
+        return header.read()
+
+
+def _generate_transactions(schema, options, names):
+    # schema and hints are sent once per chunk instead of once per transaction
+    return [_generate_transaction(schema, options, name) for name in names]
+
+
 class BuilderGenerator:
     """Cpp transaction builder generator, creates both header and implementation file"""
     def __init__(self, schema, options):
         self.schema = schema
-        self.options = options
-        self.current = None
-        self.generated_header = False
-        self.current_name = None
+
+        # hints are loaded once and shared by the header and implementation generators of all transactions
+        self.options = {**options, 'hints': options.get('hints') or HINT_CACHE.get()}
+
+        # optionally restrict generation to a subset of transactions
+        self.transaction_names = options.get('transactions')
+
+        # number of worker processes used to generate transactions, which are generated in this process when not greater than one
+        self.jobs = options.get('jobs') or 1
+
+        # optional cache of previously generated transactions, which is removed from options so that it is not sent to worker processes
+        self.generation_cache = self.options.pop('generation_cache', None)
+
+    def _is_generated_transaction(self, name):
+        if name == 'Transaction' or name.startswith('Embedded') or not name.endswith('Transaction'):
+            return False
+
+        return self.transaction_names is None or name in self.transaction_names
 
     def __iter__(self):
-        """Creates an iterator around this generator"""
-        self.current = iter(self.schema)
-        self.generated_header = False
-        return self
-
-    def _iterate_until_next_transaction(self):
-        if self.generated_header:
-            return None
-
-        name = next(self.current)
-        while name == 'Transaction' or name.startswith('Embedded') or not name.endswith('Transaction'):
-            name = next(self.current)
-        return name
-
-    def __next__(self):
-        """Returns Descriptor with desired filename and generated file content"""
-        if not self.generated_header:
-            self.current_name = self._iterate_until_next_transaction()
-            generator = HeaderGenerator(self.schema, self.options, self.current_name)
-            code = generator.generate()
-            self.generated_header = True
-            return Descriptor('{}.h'.format(generator.builder_name()), code)
-
-        generator = ImplementationGenerator(self.schema, self.options, self.current_name)
-        code = generator.generate()
-        self.generated_header = False
-        return Descriptor('{}.cpp'.format(generator.builder_name()), code)
+        """Creates an iterator around the header and implementation Descriptors of all transactions in schema order"""
+        names = [name for name in self.schema if self._is_generated_transaction(name)]
+        if self.generation_cache is None:
+            all_descriptors = self._generate(names)
+        else:
+            all_descriptors = self._generate_cached(names)
+
+        return (descriptor for transaction_descriptors in all_descriptors for descriptor in transaction_descriptors)
+
+    def _generate_cached(self, names):
+        # only transactions whose closure, hints, copyright or generator changed are generated
+        copyright_text = _read_copyright(self.options['copyright'])
+        hints = self.options['hints']
+        keys = [self.generation_cache.calculate_key(self.schema, name, hints.get(name), copyright_text) for name in names]
+        all_descriptors = [self.generation_cache.get(key) for key in keys]
+
+        missing_indexes = [index for index, transaction_descriptors in enumerate(all_descriptors) if transaction_descriptors is None]
+        generated_descriptors = self._generate([names[index] for index in missing_indexes])
+        for index, transaction_descriptors in zip(missing_indexes, generated_descriptors):
+            self.generation_cache.put(keys[index], transaction_descriptors)
+            all_descriptors[index] = transaction_descriptors
+
+        return all_descriptors
+
+    def _generate(self, names):
+        num_workers = min(self.jobs, len(names))
+        if 1 >= num_workers:
+            return (_generate_transaction(self.schema, self.options, name) for name in names)
+
+        # transactions are dealt round robin to balance chunks and reassembled in schema order, so output is deterministic
+        chunks = [names[index::num_workers] for index in range(num_workers)]
+        with ProcessPoolExecutor(num_workers) as executor:
+            futures = [executor.submit(_generate_transactions, self.schema, self.options, chunk) for chunk in chunks]
+            chunk_results = [future.result() for future in futures]
+
+        all_descriptors = [None] * len(names)
+        for index, chunk_result in enumerate(chunk_results):
+            all_descriptors[index::num_workers] = chunk_result
+
+        return all_descriptors
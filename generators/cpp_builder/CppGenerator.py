@@ -3,7 +3,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import os
 import re
-import yaml
+from .HintCache import HINT_CACHE
+from .Template import get_template
 
 SUFFIX = 'Transaction'
 
@@ -87,23 +88,10 @@ class CppGenerator(GeneratorInterface):
         }
 
         self.indent = 0
-        self.hints = CppGenerator._load_hints(['includes', 'namespaces', 'plugin', 'rewrites', 'setters'])[self.transaction_name]
+        hints = options.get('hints') or HINT_CACHE.get()
+        self.hints = hints.get(self.transaction_name)
         self.prepend_copyright(options['copyright'])
 
-    @staticmethod
-    def _load_hints(filenames):
-        all_hints = {}
-        for filename in filenames:
-            with open('generators/cpp_builder/hints/{0}.yaml'.format(filename)) as input_file:
-                hints = yaml.load(input_file)
-                for hint_key in hints:
-                    if hint_key not in all_hints:
-                        all_hints[hint_key] = {}
-
-                    all_hints[hint_key][filename] = hints.get(hint_key)
-
-        return all_hints
-
     def transaction_body_name(self):
         return '{}Body'.format(self.transaction_name)
 
@@ -141,14 +129,10 @@ class CppGenerator(GeneratorInterface):
 
         return namespace
 
-    def append(self, multiline_string, additional_replacements=None):
-        for line in re.split(r'\n', multiline_string):
-            # indent non-empty lines
-            if line:
-                replacements = {**self.replacements, **additional_replacements} if additional_replacements else self.replacements
-                self.code.append('\t' * self.indent + line.format(**replacements))
-            else:
-                self.code.append('')
+    def append(self, template_text, additional_replacements=None):
+        # templates are compiled once, so appending only substitutes replacements and indents non-empty lines
+        replacements = {**self.replacements, **additional_replacements} if additional_replacements else self.replacements
+        self.code.extend(get_template(template_text).render(self.indent, replacements))
 
     def qualified_type(self, typename):
         namespace = self._get_namespace(typename)
@@ -198,7 +182,7 @@ class CppGenerator(GeneratorInterface):
     # region generate sub-methods
 
     def _namespace_start(self):
-        self.append('namespace catapult {{ namespace builders {{')
+        self.append('namespace catapult { namespace builders {')
         self.append('')
 
     def _setters(self):
@@ -208,7 +192,7 @@ class CppGenerator(GeneratorInterface):
         self._foreach_builder_field(self._generate_field_proxy)
 
     def _namespace_end(self):
-        self.append('}}}}')
+        self.append('}}')
 
     # endregion
 
@@ -0,0 +1,27 @@
+# pylint: disable=too-few-public-methods
+import hashlib
+import json
+from catparser.PickleStore import PickleStore, calculate_sources_version
+from catparser.typeutils import calculate_closure_hash
+from .HintCache import thaw
+
+# any change to the generator sources invalidates all cached builders
+GENERATOR_VERSION = calculate_sources_version(__file__)
+
+
+class GenerationCache(PickleStore):
+    """Cache of the Descriptors generated for each transaction keyed by their inputs, optionally persisted to disk"""
+    @staticmethod
+    def calculate_key(type_descriptors, transaction_name, transaction_hints, copyright_text):
+        """Calculates the cache key for a transaction given its type closure, its hints and the copyright header"""
+        hasher = hashlib.sha256()
+        hasher.update(GENERATOR_VERSION.encode('ascii'))
+        hasher.update(transaction_name.encode('utf8'))
+
+        # the body is hashed separately because generators read it even when it is not inlined by the transaction
+        for type_name in [transaction_name, '{0}Body'.format(transaction_name)]:
+            hasher.update(calculate_closure_hash(type_descriptors, type_name).encode('ascii'))
+
+        hasher.update(json.dumps(thaw(transaction_hints), sort_keys=True).encode('utf8'))
+        hasher.update(copyright_text.encode('utf8'))
+        return hasher.hexdigest()
@@ -1,14 +1,11 @@
 from .CppGenerator import CppGenerator, FieldKind
 
-# note: part of formatting happens in CppGenerator, so whenever literal brace needs
-# to be produced, it needs to be doubled here
-
 
 class HeaderGenerator(CppGenerator):
     def _add_includes(self):
         self.append('''#pragma once
 #include "TransactionBuilder.h"
-#include "plugins/txes/{PLUGIN}/src/model/{{TRANSACTION_NAME}}.h"'''.format(PLUGIN=self.hints['plugin']))
+#include "plugins/txes/{PLUGIN}/src/model/{TRANSACTION_NAME}.h"''', {'PLUGIN': self.hints['plugin']})
 
         if self._contains_any_field_kind(FieldKind.VECTOR):
             self.append('#include <vector>')
@@ -17,7 +14,7 @@ class HeaderGenerator(CppGenerator):
 
     def _class_header(self):
         self.append('/// Builder for {COMMENT_NAME_A_OR_AN} {COMMENT_NAME} transaction.')
-        self.append('class {BUILDER_NAME} : public TransactionBuilder {{')
+        self.append('class {BUILDER_NAME} : public TransactionBuilder {')
         self.append('public:')
 
         self.indent += 1
@@ -43,18 +40,18 @@ class HeaderGenerator(CppGenerator):
 
     def _add_comment(self, field_kind, field, param_name):
         comments = {
-            FieldKind.SIMPLE: 'Sets the {COMMENT} to \\a {NAME}{BOUND}.',
-            FieldKind.BUFFER: 'Sets the {COMMENT} to \\a {NAME}.',
-            FieldKind.VECTOR: 'Adds \\a {NAME} to {COMMENT}.'
+            FieldKind.SIMPLE: '/// Sets the {COMMENT} to \\a {NAME}{BOUND}.',
+            FieldKind.BUFFER: '/// Sets the {COMMENT} to \\a {NAME}.',
+            FieldKind.VECTOR: '/// Adds \\a {NAME} to {COMMENT}.'
         }
         bound_msg = ''
         if 'condition' in field:
             bound_msg = HeaderGenerator._format_bound(field)
-        self.append('/// ' + comments[field_kind].format(COMMENT=field['comments'], NAME=param_name, BOUND=bound_msg))
+        self.append(comments[field_kind], {'COMMENT': field['comments'], 'NAME': param_name, 'BOUND': bound_msg})
 
     def _generate_setter(self, field_kind, field, full_setter_name, param_name):
         self._add_comment(field_kind, field, param_name)
-        self.append('void {};\n'.format(full_setter_name))
+        self.append('void {SETTER};\n', {'SETTER': full_setter_name})
 
     def _setters(self):
         self.append('public:')
@@ -81,7 +78,7 @@ std::unique_ptr<TTransaction> buildImpl() const;
         self.indent -= 1
 
     def _generate_field(self, field_kind, field, builder_field_typename):
-        self.append('{TYPE} m_{NAME};'.format(TYPE=builder_field_typename, NAME=field['name']))
+        self.append('{TYPE} m_{NAME};', {'TYPE': builder_field_typename, 'NAME': field['name']})
 
     def _privates(self):
         self.append('private:')
@@ -90,4 +87,4 @@ std::unique_ptr<TTransaction> buildImpl() const;
         self.indent -= 1
 
     def _class_footer(self):
-        self.append('}};')
+        self.append('};')
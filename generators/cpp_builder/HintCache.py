@@ -0,0 +1,90 @@
+# pylint: disable=too-few-public-methods
+import os
+from types import MappingProxyType
+import yaml
+
+# libyaml based loader is several times faster, but is only available when pyyaml is built with libyaml
+try:
+    from yaml import CSafeLoader as HintLoader
+except ImportError:
+    from yaml import SafeLoader as HintLoader
+
+HINTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hints')
+HINT_NAMES = ('includes', 'namespaces', 'plugin', 'rewrites', 'setters')
+NO_HINTS = MappingProxyType({})
+
+
+def freeze(value):
+    """Converts a loaded hint value into an immutable value"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(child_value) for key, child_value in value.items()})
+
+    if isinstance(value, list):
+        return tuple(freeze(child_value) for child_value in value)
+
+    return value
+
+
+def thaw(value):
+    """Converts a frozen hint value back into plain (picklable) dicts and lists"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(child_value) for key, child_value in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [thaw(child_value) for child_value in value]
+
+    return value
+
+
+def freeze_hints(transaction_hints):
+    """Creates immutable hints from plain hints indexed by transaction name"""
+    return Hints({transaction_name: freeze(hints) for transaction_name, hints in transaction_hints.items()})
+
+
+class Hints:
+    """Immutable builder hints indexed by transaction name"""
+    def __init__(self, transaction_hints):
+        self.transaction_hints = MappingProxyType(transaction_hints)
+
+    def get(self, transaction_name):
+        """Gets the hints of the specified transaction keyed by hint name"""
+        return self.transaction_hints.get(transaction_name, NO_HINTS)
+
+    def __reduce__(self):
+        # mapping proxies cannot be pickled, so hints are sent to worker processes as plain data and frozen again
+        return (freeze_hints, (thaw(self.transaction_hints),))
+
+
+class HintCache:
+    """Cache of builder hints loaded from yaml files, which are reloaded when any of the files is modified"""
+    def __init__(self, directory=HINTS_DIRECTORY, names=HINT_NAMES, loader=HintLoader):
+        self.loader = loader
+        self.filenames = {name: os.path.join(directory, '{0}.yaml'.format(name)) for name in names}
+        self.file_times = None
+        self.hints = None
+        self.loads = 0
+
+    def get(self):
+        """Gets the (memoized) hints, which are only loaded when the hint files changed since they were last loaded"""
+        file_times = {name: os.stat(filename).st_mtime_ns for name, filename in self.filenames.items()}
+        if file_times != self.file_times:
+            self.hints = self._load()
+            self.file_times = file_times
+            self.loads += 1
+
+        return self.hints
+
+    def _load(self):
+        transaction_hints = {}
+        for name, filename in self.filenames.items():
+            with open(filename) as input_file:
+                hints = yaml.load(input_file, Loader=self.loader) or {}
+
+            for transaction_name, hint in hints.items():
+                transaction_hints.setdefault(transaction_name, {})[name] = freeze(hint)
+
+        return freeze_hints(transaction_hints)
+
+
+# hints are shared by all generators in a process
+HINT_CACHE = HintCache()
@@ -9,7 +9,7 @@ class ImplementationGenerator(CppGenerator):
 
         if 'includes' in self.hints:
             for include in self.hints['includes']:
-                self.append('#include "{0}"'.format(include))
+                self.append('#include "{INCLUDE}"', {'INCLUDE': include})
 
         self.append('')
 
@@ -19,23 +19,22 @@ class ImplementationGenerator(CppGenerator):
         self.append(': TransactionBuilder(networkIdentifier, signer)')
         self._foreach_builder_field(self._generate_field_initializer_list_entry)
         self.indent -= 2
-        self.append('{{}}')
+        self.append('{}')
         self.append('')
 
     def _generate_call_to_setter_for_bound_field(self, condition_field_name, condition_value):
         field = self._get_schema_field(condition_field_name)
         field_kind = CppGenerator._get_field_kind(field)
         _, param_type, param_name = self._get_setter_name_desc(field_kind, field)
-        return 'm_{NAME} = {TYPE_NAME}::{VALUE};'.format(NAME=param_name, TYPE_NAME=param_type, VALUE=condition_value)
+        self.append('m_{NAME} = {TYPE_NAME}::{VALUE};', {'NAME': param_name, 'TYPE_NAME': param_type, 'VALUE': condition_value})
 
     def _generate_setter(self, field_kind, field, full_setter_name, param_name):
-        self.append('void {BUILDER_NAME}::' + full_setter_name + ' {{')
+        self.append('void {BUILDER_NAME}::{SETTER} {', {'SETTER': full_setter_name})
         self.indent += 1
         if field_kind == FieldKind.SIMPLE:
-            self.append('m_{NAME} = {NAME};'.format(NAME=param_name))
+            self.append('m_{NAME} = {NAME};', {'NAME': param_name})
             if 'condition' in field:
-                call_line = self._generate_call_to_setter_for_bound_field(field['condition'], capitalize(field['condition_value']))
-                self.append(call_line)
+                self._generate_call_to_setter_for_bound_field(field['condition'], capitalize(field['condition_value']))
         elif field_kind == FieldKind.BUFFER:
             self.append('''if (0 == {NAME}.Size)
 \tCATAPULT_THROW_INVALID_ARGUMENT("argument `{NAME}` cannot be empty");
@@ -44,35 +43,34 @@ if (!m_{NAME}.empty())
 \tCATAPULT_THROW_RUNTIME_ERROR("`{NAME}` field already set");
 
 m_{NAME}.resize({NAME}.Size);
-m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);'''.format(NAME=param_name))
+m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);''', {'NAME': param_name})
         else:
             if 'sort_key' in field:
-                format_string = 'InsertSorted(m_{FIELD}, {PARAM}, [](const auto& lhs, const auto& rhs) {{{{'
-                self.append(format_string.format(FIELD=field['name'], PARAM=param_name))
+                template = 'InsertSorted(m_{FIELD}, {PARAM}, [](const auto& lhs, const auto& rhs) {'
+                self.append(template, {'FIELD': field['name'], 'PARAM': param_name})
                 self.indent += 1
-                self.append('return lhs.{SORT_KEY} < rhs.{SORT_KEY};'.format(SORT_KEY=capitalize(field['sort_key'])))
+                self.append('return lhs.{SORT_KEY} < rhs.{SORT_KEY};', {'SORT_KEY': capitalize(field['sort_key'])})
                 self.indent -= 1
-                self.append('}});')
+                self.append('});')
             else:
-                self.append('m_{FIELD}.push_back({PARAM});'.format(FIELD=field['name'], PARAM=param_name))
+                self.append('m_{FIELD}.push_back({PARAM});', {'FIELD': field['name'], 'PARAM': param_name})
         self.indent -= 1
-        self.append('}}\n')
+        self.append('}\n')
 
     def _generate_field(self, field_kind, field, builder_field_typename):
         pass
 
     def _generate_field_initializer_list_entry(self, field):
-        self.append(', m_{NAME}()'.format(NAME=field['name']))
+        self.append(', m_{NAME}()', {'NAME': field['name']})
 
     def _generate_build_variable_fields_size(self, variable_sizes, field):
         field_kind = CppGenerator._get_field_kind(field)
         formatted_vector_size = 'm_{NAME}.size()'.format(NAME=field['name'])
         if field_kind == FieldKind.BUFFER:
-            self.append('size += {};'.format(formatted_vector_size))
+            self.append('size += {SIZE};', {'SIZE': formatted_vector_size})
         elif field_kind == FieldKind.VECTOR:
             qualified_typename = self.qualified_type(field['type'])
-            formatted_size = '{ARRAY_SIZE} * sizeof({TYPE})'.format(ARRAY_SIZE=formatted_vector_size, TYPE=qualified_typename)
-            self.append('size += {};'.format(formatted_size))
+            self.append('size += {ARRAY_SIZE} * sizeof({TYPE});', {'ARRAY_SIZE': formatted_vector_size, 'TYPE': qualified_typename})
 
         if field_kind != FieldKind.SIMPLE:
             variable_sizes[field['size']] = formatted_vector_size
@@ -89,7 +87,7 @@ m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);'''.format(NAME=param_
 
         template = {'NAME': field['name'], 'TX_FIELD_NAME': self._generate_transaction_field_name(field['name'])}
         if field_kind in (FieldKind.BUFFER, FieldKind.VECTOR):
-            self.append('std::copy(m_{NAME}.cbegin(), m_{NAME}.cend(), pTransaction->{TX_FIELD_NAME}Ptr());'.format(**template))
+            self.append('std::copy(m_{NAME}.cbegin(), m_{NAME}.cend(), pTransaction->{TX_FIELD_NAME}Ptr());', template)
 
     @staticmethod
     def byte_size_to_type_name(size):
@@ -99,11 +97,12 @@ m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);'''.format(NAME=param_
         field = self._get_schema_field(condition_field_name)
         field_kind = CppGenerator._get_field_kind(field)
         _, param_type, _ = self._get_setter_name_desc(field_kind, field)
-        return 'if ({TYPE_NAME}::{VALUE} == m_{NAME})'.format(TYPE_NAME=param_type, VALUE=capitalize(condition_value), NAME=field['name'])
+        replacements = {'TYPE_NAME': param_type, 'VALUE': capitalize(condition_value), 'NAME': field['name']}
+        self.append('if ({TYPE_NAME}::{VALUE} == m_{NAME})', replacements)
 
     def _generate_build(self):
         self.append('template<typename TransactionType>')
-        self.append('std::unique_ptr<TransactionType> {BUILDER_NAME}::buildImpl() const {{')
+        self.append('std::unique_ptr<TransactionType> {BUILDER_NAME}::buildImpl() const {')
         self.indent += 1
 
         self.append('// 1. allocate, zero (header), set model::Transaction fields')
@@ -123,22 +122,21 @@ m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);'''.format(NAME=param_
             if field['name'].endswith('Size') or field['name'].endswith('Count'):
                 size = variable_sizes[field['name']]
                 size_type = ImplementationGenerator.byte_size_to_type_name(field['size'])
-                format_string = 'pTransaction->{TX_FIELD_NAME} = utils::checked_cast<size_t, {SIZE_TYPE}>({SIZE});'
-                self.append(format_string.format(**template, SIZE_TYPE=size_type, SIZE=size))
+                self.append('pTransaction->{TX_FIELD_NAME} = utils::checked_cast<size_t, {SIZE_TYPE}>({SIZE});', {
+                    **template, 'SIZE_TYPE': size_type, 'SIZE': size})
             else:
                 field_kind = CppGenerator._get_field_kind(field)
                 if field_kind == FieldKind.SIMPLE:
                     if 'condition' in field:
-                        condition = self._generate_condition(field['condition'], field['condition_value'])
-                        self.append(condition)
+                        self._generate_condition(field['condition'], field['condition_value'])
                         self.indent += 1
 
                     # if setter has been suppressed, fill in with what is defined in setters.yaml hint file
                     setter = self.hints['setters'].get(field['name'], '') if 'setters' in self.hints else ''
                     if setter:
-                        self.append('pTransaction->{TX_FIELD_NAME} = {SETTER};'.format(**template, SETTER=setter))
+                        self.append('pTransaction->{TX_FIELD_NAME} = {SETTER};', {**template, 'SETTER': setter})
                     else:
-                        self.append('pTransaction->{TX_FIELD_NAME} = m_{NAME};'.format(**template))
+                        self.append('pTransaction->{TX_FIELD_NAME} = m_{NAME};', template)
 
                     if 'condition' in field:
                         self.indent -= 1
@@ -161,16 +159,16 @@ m_{NAME}.assign({NAME}.pData, {NAME}.pData + {NAME}.Size);'''.format(NAME=param_
 
         self.append('return pTransaction;')
         self.indent -= 1
-        self.append('}}')
+        self.append('}')
 
     def _builds(self):
-        self.append('''std::unique_ptr<{BUILDER_NAME}::Transaction> {BUILDER_NAME}::build() const {{
+        self.append('''std::unique_ptr<{BUILDER_NAME}::Transaction> {BUILDER_NAME}::build() const {
 \treturn buildImpl<Transaction>();
-}}
+}
 
-std::unique_ptr<{BUILDER_NAME}::EmbeddedTransaction> {BUILDER_NAME}::buildEmbedded() const {{
+std::unique_ptr<{BUILDER_NAME}::EmbeddedTransaction> {BUILDER_NAME}::buildEmbedded() const {
 \treturn buildImpl<EmbeddedTransaction>();
-}}
+}
 ''')
         self._generate_build()
 
@@ -0,0 +1,69 @@
+# pylint: disable=too-few-public-methods
+import re
+
+PLACEHOLDER_PATTERN = re.compile(r'\{([A-Z][A-Z0-9_]*)\}')
+
+
+def _compile_line(line):
+    # placeholders are converted into named printf style conversions, so that each line is substituted in a single operation
+    parts = PLACEHOLDER_PATTERN.split(line)
+    if 1 == len(parts):
+        return line, True
+
+    literals = [part.replace('%', '%%') for part in parts[0::2]]
+    names = parts[1::2]
+    return literals[0] + ''.join('%({0})s{1}'.format(name, literal) for name, literal in zip(names, literals[1:])), False
+
+
+def _indent_continuation_lines(text, prefix):
+    lines = text.split('\n')
+    return lines[:1] + [prefix + line if line else '' for line in lines[1:]]
+
+
+class Template:
+    """Multiline code template, where {NAME} is replaced by the value of NAME and all other braces are copied verbatim"""
+    def __init__(self, text):
+        self.lines = [_compile_line(line) for line in text.split('\n')]
+        self.is_static = all(is_static for _, is_static in self.lines)
+
+        # compiled lines with indentation applied to all non-empty lines, keyed by indentation level
+        self.indented_lines = {}
+
+    def render(self, indent, replacements):
+        """Renders the template lines indented by indent tabs"""
+        indented_lines = self.indented_lines.get(indent)
+        if indented_lines is None:
+            prefix = '\t' * indent
+            indented_lines = [(prefix + line if line else '', is_static) for line, is_static in self.lines]
+            self.indented_lines[indent] = indented_lines
+
+        if self.is_static:
+            return [line for line, _ in indented_lines]
+
+        code = []
+        for line, is_static in indented_lines:
+            if is_static:
+                code.append(line)
+                continue
+
+            line = line % replacements
+
+            # lines of multiline values are indented like the template line containing them
+            if '\n' in line:
+                code.extend(_indent_continuation_lines(line, '\t' * indent))
+            else:
+                code.append(line)
+
+        return code
+
+
+TEMPLATES = {}
+
+
+def get_template(text):
+    """Gets the template compiled from text, which is only compiled when it is first used"""
+    template = TEMPLATES.get(text)
+    if template is None:
+        template = TEMPLATES[text] = Template(text)
+
+    return template
@@ -0,0 +1,275 @@
+# pylint: disable=too-few-public-methods
+import keyword
+import os
+import re
+from catcodec.codecutils import field_format, get_condition_value, group_packable_fields, is_packable, require_field_counts, scalar_format
+from catparser.SchemaLayout import SchemaLayout
+
+# names used by the generated function bodies, which must not be shadowed by field locals
+RESERVED_NAMES = {'buffer', 'offset', 'end_offset', 'union_offset', 'values', 'parts', 'element', 'struct', 'len', 'bytes', 'range'}
+
+
+def snake_case(name):
+    return re.sub('(?<=[a-z0-9])(?=[A-Z])', '_', name).lower()
+
+
+def local_name(name):
+    return name + '_' if keyword.iskeyword(name) or name in RESERVED_NAMES else name
+
+
+def indent_lines(lines, indent=1):
+    return ['    ' * indent + line if line else line for line in lines]
+
+
+class ModuleGenerator:
+    """Python codec module generator, creates encode and decode functions for all structs of a schema"""
+    def __init__(self, schema, options):
+        self.schema = schema
+        self.options = options
+        self.schema_layout = SchemaLayout(schema)
+        self.packers = {}
+
+    def generate(self):
+        """Generates the lines of the codec module"""
+        struct_names = [name for name, type_descriptor in self.schema.items() if 'struct' == type_descriptor['type']]
+
+        function_lines = []
+        for struct_name in struct_names:
+            struct_layout = self.schema_layout.get_struct_layout(struct_name)
+            require_field_counts(struct_layout, 'generated')
+            function_lines += ['', ''] + self._generate_decoder(struct_layout)
+            function_lines += ['', ''] + self._generate_encoder(struct_layout)
+
+        code = self._generate_copyright()
+        code += ['"""Encoders and decoders generated from a catbuffer schema, do not edit"""', 'import struct', '']
+        code += ['{0} = struct.Struct(\'{1}\')'.format(packer_name, packer_format) for packer_format, packer_name in self.packers.items()]
+        code += function_lines
+        code += ['', '']
+        code += ['DECODERS = {'] + ['    \'{0}\': decode_{1},'.format(name, snake_case(name)) for name in struct_names] + ['}']
+        code += ['', 'ENCODERS = {'] + ['    \'{0}\': encode_{1},'.format(name, snake_case(name)) for name in struct_names] + ['}']
+        return code
+
+    def _generate_copyright(self):
+        copyright_file = self.options.get('copyright')
+        if not copyright_file or not os.path.isfile(copyright_file):
+            return []
+
+        with open(copyright_file) as header:
+            return ['# ' + line.rstrip() if line.strip() else '#' for line in header]
+
+    def _get_packer(self, struct_name, fields_format):
+        # equal formats share a single precompiled struct
+        packer_format = '<' + fields_format
+        if packer_format not in self.packers:
+            self.packers[packer_format] = '_{0}_{1}'.format(snake_case(struct_name).upper(), len(self.packers))
+
+        return self.packers[packer_format]
+
+    def _get_struct_packer(self, struct_layout):
+        if not all(is_packable(field) for field in struct_layout.fields):
+            return None
+
+        return self._get_packer(struct_layout.name, ''.join(field_format(field) for field in struct_layout.fields))
+
+    # region decoder
+
+    def _generate_decoder(self, struct_layout):
+        lines = [
+            'def decode_{0}(buffer, offset=0):'.format(snake_case(struct_layout.name)),
+            '    """Decodes {0} starting at offset and returns its field values and the offset following it"""'.format(struct_layout.name)
+        ]
+
+        struct_packer = self._get_struct_packer(struct_layout)
+        if struct_packer:
+            names = [field.name for field in struct_layout.fields]
+            body = [
+                '{0} = {1}.unpack_from(buffer, offset)'.format(_unpack_targets(names), struct_packer),
+                'return ({0}, offset + {1})'.format(_dict_literal(names), struct_layout.size)
+            ]
+            return lines + indent_lines(body)
+
+        body = []
+        for is_packed, group in group_packable_fields(struct_layout.fields):
+            if is_packed:
+                body += self._decode_packed_fields(struct_layout, group)
+            elif group[0].condition:
+                body += self._decode_conditional_fields(struct_layout, group)
+            else:
+                body += self._decode_field(struct_layout, group[0])
+
+        # conditional fields are only present when their condition is met
+        unconditional_names = [field.name for field in struct_layout.fields if not field.condition]
+        conditional_fields = [field for field in struct_layout.fields if field.condition]
+        if not conditional_fields:
+            body.append('return ({0}, offset)'.format(_dict_literal(unconditional_names)))
+            return lines + indent_lines(body)
+
+        body.append('values = {0}'.format(_dict_literal(unconditional_names)))
+        for field in conditional_fields:
+            body.append('if {0}:'.format(self._condition_expression(struct_layout, field, local_name(field.condition))))
+            body.append('    values[\'{0}\'] = {1}'.format(field.name, local_name(field.name)))
+
+        body.append('return (values, offset)')
+        return lines + indent_lines(body)
+
+    def _decode_packed_fields(self, struct_layout, fields):
+        packer = self._get_packer(struct_layout.name, ''.join(field_format(field) for field in fields))
+        return [
+            '{0} = {1}.unpack_from(buffer, offset)'.format(_unpack_targets([field.name for field in fields]), packer),
+            'offset += {0}'.format(sum(field.size for field in fields))
+        ]
+
+    def _decode_conditional_fields(self, struct_layout, fields):
+        lines = []
+        is_fixed = all(field.is_fixed for field in fields)
+        if is_fixed:
+            lines.append('union_offset = offset')
+
+        # all alternatives of a union occupy the same bytes, but only the field matching the condition is decoded
+        for field in fields:
+            lines.append('if {0}:'.format(self._condition_expression(struct_layout, field, local_name(field.condition))))
+            lines += indent_lines(self._decode_field(struct_layout, field))
+
+        if is_fixed:
+            lines.append('offset = union_offset + {0}'.format(max(field.size for field in fields)))
+
+        return lines
+
+    def _decode_field(self, struct_layout, field):
+        name = local_name(field.name)
+        if 'struct' == field.kind:
+            return ['{0}, offset = decode_{1}(buffer, offset)'.format(name, snake_case(field.type_name))]
+
+        if 'array' == field.kind:
+            return self._decode_array_field(field)
+
+        return self._decode_packed_fields(struct_layout, [field])
+
+    def _decode_array_field(self, field):
+        name = local_name(field.name)
+        count = local_name(field.count) if isinstance(field.count, str) else field.count
+        element = field.element
+        if 'struct' == element.kind and not self._get_struct_packer(element.struct_layout):
+            return [
+                '{0} = []'.format(name),
+                'for _ in range({0}):'.format(count),
+                '    element, offset = decode_{0}(buffer, offset)'.format(snake_case(element.type_name)),
+                '    {0}.append(element)'.format(name)
+            ]
+
+        if isinstance(count, int) or 1 == element.size:
+            size = count * element.size if isinstance(count, int) else count
+        else:
+            size = '{0} * {1}'.format(count, element.size)
+
+        lines = [
+            'end_offset = offset + {0}'.format(size),
+            'if end_offset > len(buffer):',
+            '    raise struct.error(\'unable to decode "{0}" at offset {{0}}\'.format(offset))'.format(field.name)
+        ]
+
+        if 'byte' == element.type_name:
+            lines.append('{0} = bytes(buffer[offset:end_offset])'.format(name))
+        elif 'struct' == element.kind:
+            # arrays of packed structs and of scalars are decoded by unpacking all elements with a single precompiled struct
+            element_names = [element_field.name for element_field in element.struct_layout.fields]
+            element_locals = ['element{0}'.format(index) for index in range(len(element_names))]
+            lines.append('{0} = [{1} for {2} in {3}.iter_unpack(buffer[offset:end_offset])]'.format(
+                name,
+                _dict_literal(element_names, element_locals),
+                _unpack_targets(element_locals),
+                self._get_struct_packer(element.struct_layout)))
+        else:
+            packer = self._get_packer(element.type_name, scalar_format(element.size, element.signedness))
+            lines.append('{0} = [element for element, in {1}.iter_unpack(buffer[offset:end_offset])]'.format(name, packer))
+
+        lines.append('offset = end_offset')
+        return lines
+
+    # endregion
+
+    # region encoder
+
+    def _generate_encoder(self, struct_layout):
+        lines = [
+            'def encode_{0}(values):'.format(snake_case(struct_layout.name)),
+            '    """Encodes {0} field values, where count fields are calculated from their array sizes"""'.format(struct_layout.name)
+        ]
+
+        struct_packer = self._get_struct_packer(struct_layout)
+        if struct_packer:
+            arguments = [self._encode_value(struct_layout, field) for field in struct_layout.fields]
+            return lines + indent_lines(['return {0}.pack({1})'.format(struct_packer, ', '.join(arguments))])
+
+        body = ['parts = []']
+        for is_packed, group in group_packable_fields(struct_layout.fields):
+            if is_packed:
+                body += self._encode_packed_fields(struct_layout, group)
+            elif group[0].condition:
+                body += self._encode_conditional_fields(struct_layout, group)
+            else:
+                body += self._encode_field(struct_layout, group[0])
+        body.append('return b\'\'.join(parts)')
+        return lines + indent_lines(body)
+
+    @staticmethod
+    def _encode_value(struct_layout, field):
+        # count fields are always consistent with the arrays they describe
+        if field.name in struct_layout.count_fields:
+            return 'len(values[\'{0}\'])'.format(struct_layout.count_fields[field.name][0])
+
+        return 'values[\'{0}\']'.format(field.name)
+
+    def _encode_packed_fields(self, struct_layout, fields):
+        packer = self._get_packer(struct_layout.name, ''.join(field_format(field) for field in fields))
+        arguments = [self._encode_value(struct_layout, field) for field in fields]
+        return ['parts.append({0}.pack({1}))'.format(packer, ', '.join(arguments))]
+
+    def _encode_conditional_fields(self, struct_layout, fields):
+        lines = []
+        size = max(field.size for field in fields) if all(field.is_fixed for field in fields) else None
+        for index, field in enumerate(fields):
+            condition = self._condition_expression(struct_layout, field, 'values[\'{0}\']'.format(field.condition))
+            lines.append('{0} {1}:'.format('elif' if index else 'if', condition))
+            lines += indent_lines(self._encode_field(struct_layout, field))
+            if size is not None and size != field.size:
+                lines.append('    parts.append(bytes({0}))'.format(size - field.size))
+
+        # unused union bytes are zeroed
+        if size is not None:
+            lines += ['else:', '    parts.append(bytes({0}))'.format(size)]
+
+        return lines
+
+    def _encode_field(self, struct_layout, field):
+        value = 'values[\'{0}\']'.format(field.name)
+        if 'struct' == field.kind:
+            return ['parts.append(encode_{0}({1}))'.format(snake_case(field.type_name), value)]
+
+        if 'array' != field.kind:
+            return self._encode_packed_fields(struct_layout, [field])
+
+        element = field.element
+        if 'byte' == element.type_name:
+            return ['parts.append(bytes({0}))'.format(value)]
+
+        if 'struct' == element.kind:
+            return ['parts += [encode_{0}(element) for element in {1}]'.format(snake_case(element.type_name), value)]
+
+        packer = self._get_packer(element.type_name, scalar_format(element.size, element.signedness))
+        return ['parts += [{0}.pack(element) for element in {1}]'.format(packer, value)]
+
+    # endregion
+
+    def _condition_expression(self, struct_layout, field, condition):
+        return '{0} == {1}'.format(condition, get_condition_value(self.schema, struct_layout, field))
+
+
+def _unpack_targets(names):
+    targets = [local_name(name) for name in names]
+    return ', '.join(targets) + (',' if 1 == len(targets) else '')
+
+
+def _dict_literal(names, values=None):
+    values = values or [local_name(name) for name in names]
+    return '{' + ', '.join('\'{0}\': {1}'.format(name, value) for name, value in zip(names, values)) + '}'
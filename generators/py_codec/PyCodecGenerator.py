@@ -0,0 +1,27 @@
+# pylint: disable=too-few-public-methods
+import os
+from generators.Descriptor import Descriptor
+from .ModuleGenerator import ModuleGenerator
+
+
+class PyCodecGenerator:
+    """Python codec generator, creates a single module with encode and decode functions for all structs of a schema"""
+    def __init__(self, schema, options):
+        self.schema = schema
+        self.options = options
+
+        # optionally restrict generation to schemas containing a subset of transactions
+        self.transaction_names = options.get('transactions')
+
+    def module_name(self):
+        """Gets the name of the generated module, which is derived from the schema filename"""
+        schema_filename = self.options.get('schema')
+        return os.path.splitext(os.path.basename(schema_filename))[0] if schema_filename else 'schema'
+
+    def __iter__(self):
+        """Creates an iterator around the (single) generated module"""
+        if self.transaction_names is not None and not any(name in self.schema for name in self.transaction_names):
+            return iter([])
+
+        code = ModuleGenerator(self.schema, self.options).generate()
+        return iter([Descriptor('{0}.py'.format(self.module_name()), code)])
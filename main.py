@@ -1,75 +1,212 @@
-# pylint: disable=too-few-public-methods
 import argparse
 import os
 import pprint
-from catparser.CatsParser import CatsParser
+import time
+from catparser.CatsParseException import CatsParseException
+from catparser.CompactDescriptor import DescriptorInterner, compact_type_descriptors
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParallelParser import ParallelParser
+from catparser.ParseCache import ParseCache
+from catparser.ParseProfiler import ParseProfiler
+from catparser.SchemaResolver import FileSystemResolver
+from catparser.typeutils import calculate_closure_hash
 from generators.All import AVAILABLE_GENERATORS
+from generators.OutputWriter import OutputWriter
+from generators.cpp_builder.GenerationCache import GenerationCache
+from generators.cpp_builder.HintCache import HINT_CACHE, thaw
 
 
-class MultiFileParser:
-    """CATS parser that resolves imports in global namespace"""
-    def __init__(self):
-        self.cats_parser = CatsParser(self._process_import_file)
-        self.dirname = None
+def _generate_output(generator_name, directory, schema, options):
+    generator_class = AVAILABLE_GENERATORS[generator_name]
+    output_path = os.path.join(directory, generator_name)
+    os.makedirs(output_path, exist_ok=True)
+    generator = generator_class(schema, options)
 
-    def set_include_path(self, include_path):
-        self.dirname = include_path
+    # unchanged files are not rewritten, so their modification times are kept and dependent builds are not triggered
+    writer = OutputWriter(output_path)
+    for generated_descriptor in generator:
+        writer.write(generated_descriptor)
 
-    def parse(self, schema_filename):
-        self._process_file(schema_filename)
+    print('generated {0}: {1} written, {2} unchanged'.format(options.get('schema', generator_name), writer.written, writer.unchanged))
 
-    def _process_import_file(self, filename):
-        filename = os.path.join(self.dirname, filename)
-        self._process_file(filename)
 
-    def _process_file(self, filename):
-        self.cats_parser.push_scope(filename)
+def _read_manifest(manifest_filename):
+    # manifest lists one schema per line relative to the manifest directory
+    manifest_directory = os.path.dirname(manifest_filename)
+    with open(manifest_filename) as manifest_file:
+        lines = [line.strip() for line in manifest_file]
 
-        with open(filename) as input_file:
-            lines = input_file.readlines()
-            for line in lines:
-                self.cats_parser.process_line(line)
+    return [os.path.join(manifest_directory, line) for line in lines if line and not line.startswith('#')]
 
-        self.cats_parser.pop_scope()
 
+def _print_schema(type_descriptors):
+    # console output the parsed schema
+    printer = pprint.PrettyPrinter(width=140)
+    printer.pprint('*** *** ***')
+    for key in type_descriptors:
+        printer.pprint((key, type_descriptors[key]))
+
+
+def _parse_schema(schema_filename, resolver, cache, listener=None):
+    file_parser = MultiFileParser(cache, resolver, listener)
+
+    start_time = time.perf_counter()
+    file_parser.parse(schema_filename)
+    elapsed_time = time.perf_counter() - start_time
+
+    type_descriptors = file_parser.cats_parser.type_descriptors()
+    _print_schema(type_descriptors)
+    print('parsed {0} in {1:.2f}ms'.format(schema_filename, elapsed_time * 1000))
+    return type_descriptors
+
+
+def _parse_schemas(schema_filenames, resolver, cache, jobs, listener):
+    if 1 == jobs:
+        for schema_filename in schema_filenames:
+            yield _parse_schema(schema_filename, resolver, cache, listener)
+
+        return
+
+    start_time = time.perf_counter()
+    all_type_descriptors = ParallelParser(resolver, cache, jobs).parse(schema_filenames)
+    elapsed_time = time.perf_counter() - start_time
+
+    for type_descriptors in all_type_descriptors:
+        _print_schema(type_descriptors)
+        yield type_descriptors
+
+    print('parsed {0} schema(s) with {1} jobs in {2:.2f}ms'.format(len(schema_filenames), jobs, elapsed_time * 1000))
 
-def _generate_output(generator_name, directory, schema, options):
-    generator_class = AVAILABLE_GENERATORS[generator_name]
-    output_path = os.path.join(directory, generator_name)
-    os.makedirs(output_path, exist_ok=True)
-    generator = generator_class(schema, options)
-    for generated_descriptor in generator:
-        output_filename = os.path.join(output_path, generated_descriptor.filename)
-        with open(output_filename, 'w', newline='\n') as output_file:
-            for line in generated_descriptor.code:
-                output_file.write('%s\n' % line)
+
+def _get_watched_file_times(include_path, schema_filenames):
+    # builder hints are watched along with the schema files, because they are inputs of the generated builders
+    filenames = list(schema_filenames) + list(HINT_CACHE.filenames.values())
+    for directory, _, directory_filenames in os.walk(include_path):
+        filenames += [os.path.join(directory, filename) for filename in directory_filenames if filename.endswith('.cats')]
+
+    return {filename: os.stat(filename).st_mtime_ns for filename in filenames if os.path.exists(filename)}
+
+
+def _update_changed_transactions(type_descriptors, hints, transaction_inputs):
+    # a transaction needs to be regenerated when any type reachable from its body or any of its hints changes
+    changed_transaction_names = set()
+    for type_name in type_descriptors:
+        if not type_name.endswith('TransactionBody'):
+            continue
+
+        transaction_name = type_name[:-len('Body')]
+        inputs = (calculate_closure_hash(type_descriptors, type_name), thaw(hints.get(transaction_name)))
+        if inputs != transaction_inputs.get(transaction_name):
+            transaction_inputs[transaction_name] = inputs
+            changed_transaction_names.add(transaction_name)
+
+    return changed_transaction_names
+
+
+def _watch(args, schema_filenames, cache, generation_cache, should_stop=None):
+    # should_stop is called after every check for changes, so that the loop can be ended without interrupting it
+    resolver = FileSystemResolver(args.include)
+    transaction_inputs = {schema_filename: {} for schema_filename in schema_filenames}
+    watched_file_times = None
+    try:
+        while True:
+            current_watched_file_times = _get_watched_file_times(args.include, schema_filenames)
+            if current_watched_file_times != watched_file_times:
+                watched_file_times = current_watched_file_times
+
+                # unchanged files are replayed from the in-memory cache, so only modified files and their importers are parsed
+                resolver.invalidate()
+                hints = HINT_CACHE.get()
+                for schema_filename in schema_filenames:
+                    try:
+                        type_descriptors = _parse_schema(schema_filename, resolver, cache)
+                    except CatsParseException as ex:
+                        print('failed parsing {0}: {1}'.format(schema_filename, ex))
+                        continue
+
+                    changed_transaction_names = _update_changed_transactions(type_descriptors, hints, transaction_inputs[schema_filename])
+                    if not changed_transaction_names:
+                        continue
+
+                    print('changed transactions: {0}'.format(', '.join(sorted(changed_transaction_names))))
+                    if args.generator:
+                        options = {
+                            'copyright': args.copyright,
+                            'schema': schema_filename,
+                            'transactions': changed_transaction_names,
+                            'generation_cache': generation_cache
+                        }
+                        _generate_output(args.generator, args.output, type_descriptors, options)
+
+                print('watching {0} for changes'.format(args.include))
+
+            if should_stop and should_stop():
+                return
+
+            time.sleep(args.watch_interval)
+    except KeyboardInterrupt:
+        print('stopped watching {0}'.format(args.include))
 
 
 def generate():
     parser = argparse.ArgumentParser(description='CATS code generator')
-    parser.add_argument('-s', '--schema', help='input CATS file', required=True)
+    parser.add_argument('-s', '--schema', help='input CATS file (can be specified multiple times)', action='append', default=[])
+    parser.add_argument('-m', '--manifest', help='file listing input CATS files, one per line')
     parser.add_argument('-o', '--output', help='output directory', default='_generated')
     parser.add_argument('-i', '--include', help='schema root directory', default='./schemas')
 
     generators_list = list(AVAILABLE_GENERATORS.keys())
     parser.add_argument('-g', '--generator', help='generator to use to produce output files', choices=generators_list)
     parser.add_argument('-c', '--copyright', help='file containing copyright data to use with output files', default='../HEADER.inc')
+    parser.add_argument('--cache', help='directory used to cache parsed schema files across runs')
+    parser.add_argument('-j', '--jobs', help='number of processes used to parse schema files and to generate builders', type=int, default=1)
+    parser.add_argument('-w', '--watch', help='watch schema files and regenerate output on change', action='store_true')
+    parser.add_argument('--watch-interval', help='seconds between checks for changed schema files', type=float, default=0.5)
+    parser.add_argument('--compact', help='convert parsed schemas into compact immutable descriptors', action='store_true')
+    parser.add_argument('--profile', help='print parse timings by file and by line kind', action='store_true')
     args = parser.parse_args()
 
-    file_parser = MultiFileParser()
-    file_parser.set_include_path(args.include)
-    file_parser.parse(args.schema)
+    schema_filenames = args.schema + (_read_manifest(args.manifest) if args.manifest else [])
+    if not schema_filenames:
+        parser.error('at least one schema must be specified via --schema or --manifest')
 
-    # console output the parsed schema
-    printer = pprint.PrettyPrinter(width=140)
-    printer.pprint('*** *** ***')
-    type_descriptors = file_parser.cats_parser.type_descriptors()
-    for key in type_descriptors:
-        printer.pprint((key, type_descriptors[key]))
+    if args.profile and 1 != args.jobs:
+        parser.error('--profile can only be used with a single job')
+
+    # each schema is parsed by a separate parser, but files imported by multiple schemas are only parsed once
+    cache = ParseCache(args.cache)
+
+    # generated builders are cached next to the parsed schema files, so only builders with changed inputs are generated again
+    generation_cache = GenerationCache(os.path.join(args.cache, 'cpp_builder') if args.cache else None)
+    if args.watch:
+        _watch(args, schema_filenames, cache, generation_cache)
+        return
+
+    resolver = FileSystemResolver(args.include)
+
+    start_time = time.perf_counter()
+    interner = DescriptorInterner()
+    profiler = ParseProfiler() if args.profile else None
+    all_type_descriptors = _parse_schemas(schema_filenames, resolver, cache, args.jobs, profiler)
+    for schema_filename, type_descriptors in zip(schema_filenames, all_type_descriptors):
+        if args.compact:
+            type_descriptors = compact_type_descriptors(type_descriptors, interner)
+
+        # generate and output code
+        if args.generator:
+            options = {'copyright': args.copyright, 'schema': schema_filename, 'jobs': args.jobs, 'generation_cache': generation_cache}
+            _generate_output(args.generator, args.output, type_descriptors, options)
+
+    elapsed_time = time.perf_counter() - start_time
+    print('processed {0} schema(s) in {1:.2f}ms ({2} cache hits, {3} cache misses)'.format(
+        len(schema_filenames), elapsed_time * 1000, cache.hits, cache.misses))
+
+    if 'cpp_builder' == args.generator:
+        print('generation cache: {0} hits, {1} misses'.format(generation_cache.hits, generation_cache.misses))
 
-    # generate and output code
-    if args.generator:
-        _generate_output(args.generator, args.output, type_descriptors, {'copyright': args.copyright})
+    if profiler:
+        print('\n'.join(profiler.report()))
 
 
-generate()
+if __name__ == '__main__':
+    generate()
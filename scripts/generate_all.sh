@@ -29,16 +29,20 @@ function generate_all {
 		"transfer/transfer"
 	)
 
+	local schema_args=()
 	for input in ${inputs[*]}
 	do
-		echo "generating ${input}"
-		python3 main.py --schema ./schemas/${input}.cats --output _generated --generator ${builder} --copyright $1
-		if [ $? -ne 0 ]; then
-			echo "${start_error_color}ERROR: failed generating ${input}${end_color}"
-			exit 1
-		fi
+		schema_args+=("--schema" "./schemas/${input}.cats")
 	done
 
+	# all schemas are generated by a single process so that shared imports are only parsed once
+	echo "generating ${inputs[*]}"
+	python3 main.py ${schema_args[*]} --output _generated --generator ${builder} --copyright $1
+	if [ $? -ne 0 ]; then
+		echo "${start_error_color}ERROR: failed generating schemas${end_color}"
+		exit 1
+	fi
+
 	echo "${start_success_color}SUCCESS: generation complete with no errors${end_color}"
 }
 
@@ -0,0 +1,68 @@
+import contextlib
+import os
+import tempfile
+
+# type definitions shared by codec schemas
+CODEC_TYPE_LINES = [
+    'using Amount = uint64',
+    'using Key = binary_fixed(6)',
+    'enum Shape : uint8',
+    '\tcircle = 1',
+    '\tsquare = 2'
+]
+
+# union of shape dependent fields, which requires a preceding shape field
+SHAPE_UNION_LINES = [
+    '\tshape = Shape',
+    '\tradius = uint16 if shape equals circle',
+    '\tside = uint32 if shape equals square'
+]
+
+SCHEMA_FILES = {
+    'types.cats': [
+        'using Amount = uint64',
+        '',
+        '# binary layout for a mosaic',
+        'struct Mosaic',
+        '\tamount = Amount'
+    ],
+    'entity.cats': [
+        'import "types.cats"',
+        '',
+        'enum EntityType : uint16',
+        '\treserved = 0'
+    ],
+    'transfer.cats': [
+        'import "entity.cats"',
+        '',
+        'struct TransferTransaction',
+        '\tconst EntityType entityType = 0x4154',
+        '\tmosaicsCount = uint8',
+        '\tmosaics = array(Mosaic, mosaicsCount)',
+        '',
+        'using Fee = uint32'
+    ]
+}
+
+
+# mosaic.cats uses Amount without importing types.cats, so it is only valid when a root imports types.cats before it
+UNDER_IMPORTING_SCHEMA_FILES = {
+    'mosaic.cats': ['struct MosaicBundle', '\tamount = Amount'],
+    'full.cats': ['import "types.cats"', 'import "mosaic.cats"'],
+    'partial.cats': ['import "mosaic.cats"']
+}
+
+
+def write_schema_files(directory, schema_files):
+    """Writes schema files given as lists of lines keyed by filename into directory"""
+    for filename, lines in schema_files.items():
+        with open(os.path.join(directory, filename), 'w') as output_file:
+            output_file.write('\n'.join(lines) + '\n')
+
+
+@contextlib.contextmanager
+def temporary_schema_files(schema_files):
+    """Creates a temporary directory containing the specified schema files"""
+    with tempfile.TemporaryDirectory() as directory:
+        write_schema_files(directory, schema_files)
+        yield directory
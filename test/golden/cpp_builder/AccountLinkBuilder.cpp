@@ -0,0 +1,39 @@
+#include "AccountLinkBuilder.h"
+
+namespace catapult { namespace builders {
+
+	AccountLinkBuilder::AccountLinkBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_remoteAccountKey()
+			, m_linkAction()
+	{}
+
+	void AccountLinkBuilder::setRemoteAccountKey(const Key& remoteAccountKey) {
+		m_remoteAccountKey = remoteAccountKey;
+	}
+
+	void AccountLinkBuilder::setLinkAction(model::AccountLinkAction linkAction) {
+		m_linkAction = linkAction;
+	}
+
+	std::unique_ptr<AccountLinkBuilder::Transaction> AccountLinkBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<AccountLinkBuilder::EmbeddedTransaction> AccountLinkBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> AccountLinkBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->RemoteAccountKey = m_remoteAccountKey;
+		pTransaction->LinkAction = m_linkAction;
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,40 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/accountlink/src/model/AccountLinkTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for an account link transaction.
+	class AccountLinkBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::AccountLinkTransaction;
+		using EmbeddedTransaction = model::EmbeddedAccountLinkTransaction;
+
+	public:
+		/// Creates an account link builder for building an account link transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		AccountLinkBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the remote account key to \a remoteAccountKey.
+		void setRemoteAccountKey(const Key& remoteAccountKey);
+
+		/// Sets the account link action to \a linkAction.
+		void setLinkAction(model::AccountLinkAction linkAction);
+
+	public:
+		/// Builds a new account link transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded account link transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		Key m_remoteAccountKey;
+		model::AccountLinkAction m_linkAction;
+	};
+}}
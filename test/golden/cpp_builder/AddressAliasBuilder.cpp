@@ -0,0 +1,45 @@
+#include "AddressAliasBuilder.h"
+
+namespace catapult { namespace builders {
+
+	AddressAliasBuilder::AddressAliasBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_aliasAction()
+			, m_namespaceId()
+			, m_address()
+	{}
+
+	void AddressAliasBuilder::setAliasAction(model::AliasAction aliasAction) {
+		m_aliasAction = aliasAction;
+	}
+
+	void AddressAliasBuilder::setNamespaceId(NamespaceId namespaceId) {
+		m_namespaceId = namespaceId;
+	}
+
+	void AddressAliasBuilder::setAddress(const Address& address) {
+		m_address = address;
+	}
+
+	std::unique_ptr<AddressAliasBuilder::Transaction> AddressAliasBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<AddressAliasBuilder::EmbeddedTransaction> AddressAliasBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> AddressAliasBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->AliasAction = m_aliasAction;
+		pTransaction->NamespaceId = m_namespaceId;
+		pTransaction->Address = m_address;
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,44 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/namespace/src/model/AddressAliasTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for an address alias transaction.
+	class AddressAliasBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::AddressAliasTransaction;
+		using EmbeddedTransaction = model::EmbeddedAddressAliasTransaction;
+
+	public:
+		/// Creates an address alias builder for building an address alias transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		AddressAliasBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the alias action to \a aliasAction.
+		void setAliasAction(model::AliasAction aliasAction);
+
+		/// Sets the id of a namespace that will become an alias to \a namespaceId.
+		void setNamespaceId(NamespaceId namespaceId);
+
+		/// Sets the aliased address to \a address.
+		void setAddress(const Address& address);
+
+	public:
+		/// Builds a new address alias transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded address alias transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::AliasAction m_aliasAction;
+		NamespaceId m_namespaceId;
+		Address m_address;
+	};
+}}
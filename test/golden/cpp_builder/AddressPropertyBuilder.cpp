@@ -0,0 +1,43 @@
+#include "AddressPropertyBuilder.h"
+
+namespace catapult { namespace builders {
+
+	AddressPropertyBuilder::AddressPropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_propertyType()
+			, m_modifications()
+	{}
+
+	void AddressPropertyBuilder::setPropertyType(model::PropertyType propertyType) {
+		m_propertyType = propertyType;
+	}
+
+	void AddressPropertyBuilder::addModification(const model::AddressPropertyModification& modification) {
+		m_modifications.push_back(modification);
+	}
+
+	std::unique_ptr<AddressPropertyBuilder::Transaction> AddressPropertyBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<AddressPropertyBuilder::EmbeddedTransaction> AddressPropertyBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> AddressPropertyBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_modifications.size() * sizeof(model::AddressPropertyModification);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->PropertyType = m_propertyType;
+		pTransaction->ModificationsCount = utils::checked_cast<size_t, uint8_t>(m_modifications.size());
+
+		// 3. set transaction attachments
+		std::copy(m_modifications.cbegin(), m_modifications.cend(), pTransaction->ModificationsPtr());
+
+		return pTransaction;
+	}
+}}
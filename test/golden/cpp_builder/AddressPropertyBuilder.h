@@ -0,0 +1,41 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/property/src/model/AddressPropertyTransaction.h"
+#include <vector>
+
+namespace catapult { namespace builders {
+
+	/// Builder for an address property transaction.
+	class AddressPropertyBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::AddressPropertyTransaction;
+		using EmbeddedTransaction = model::EmbeddedAddressPropertyTransaction;
+
+	public:
+		/// Creates an address property builder for building an address property transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		AddressPropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the property type to \a propertyType.
+		void setPropertyType(model::PropertyType propertyType);
+
+		/// Adds \a modification to property modifications.
+		void addModification(const model::AddressPropertyModification& modification);
+
+	public:
+		/// Builds a new address property transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded address property transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::PropertyType m_propertyType;
+		std::vector<model::AddressPropertyModification> m_modifications;
+	};
+}}
@@ -0,0 +1,45 @@
+#include "HashLockBuilder.h"
+
+namespace catapult { namespace builders {
+
+	HashLockBuilder::HashLockBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_mosaic()
+			, m_duration()
+			, m_hash()
+	{}
+
+	void HashLockBuilder::setMosaic(const model::UnresolvedMosaic& mosaic) {
+		m_mosaic = mosaic;
+	}
+
+	void HashLockBuilder::setDuration(BlockDuration duration) {
+		m_duration = duration;
+	}
+
+	void HashLockBuilder::setHash(const Hash256& hash) {
+		m_hash = hash;
+	}
+
+	std::unique_ptr<HashLockBuilder::Transaction> HashLockBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<HashLockBuilder::EmbeddedTransaction> HashLockBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> HashLockBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->Mosaic = m_mosaic;
+		pTransaction->Duration = m_duration;
+		pTransaction->Hash = m_hash;
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,44 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/lock_hash/src/model/HashLockTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for a hash lock transaction.
+	class HashLockBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::HashLockTransaction;
+		using EmbeddedTransaction = model::EmbeddedHashLockTransaction;
+
+	public:
+		/// Creates a hash lock builder for building a hash lock transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		HashLockBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the lock mosaic to \a mosaic.
+		void setMosaic(const model::UnresolvedMosaic& mosaic);
+
+		/// Sets the number of blocks for which a lock should be valid to \a duration.
+		void setDuration(BlockDuration duration);
+
+		/// Sets the lock hash to \a hash.
+		void setHash(const Hash256& hash);
+
+	public:
+		/// Builds a new hash lock transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded hash lock transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::UnresolvedMosaic m_mosaic;
+		BlockDuration m_duration;
+		Hash256 m_hash;
+	};
+}}
@@ -0,0 +1,49 @@
+#include "ModifyMultisigAccountBuilder.h"
+
+namespace catapult { namespace builders {
+
+	ModifyMultisigAccountBuilder::ModifyMultisigAccountBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_minRemovalDelta()
+			, m_minApprovalDelta()
+			, m_modifications()
+	{}
+
+	void ModifyMultisigAccountBuilder::setMinRemovalDelta(int8_t minRemovalDelta) {
+		m_minRemovalDelta = minRemovalDelta;
+	}
+
+	void ModifyMultisigAccountBuilder::setMinApprovalDelta(int8_t minApprovalDelta) {
+		m_minApprovalDelta = minApprovalDelta;
+	}
+
+	void ModifyMultisigAccountBuilder::addModification(const model::CosignatoryModification& modification) {
+		m_modifications.push_back(modification);
+	}
+
+	std::unique_ptr<ModifyMultisigAccountBuilder::Transaction> ModifyMultisigAccountBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<ModifyMultisigAccountBuilder::EmbeddedTransaction> ModifyMultisigAccountBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> ModifyMultisigAccountBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_modifications.size() * sizeof(model::CosignatoryModification);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->MinRemovalDelta = m_minRemovalDelta;
+		pTransaction->MinApprovalDelta = m_minApprovalDelta;
+		pTransaction->ModificationsCount = utils::checked_cast<size_t, uint8_t>(m_modifications.size());
+
+		// 3. set transaction attachments
+		std::copy(m_modifications.cbegin(), m_modifications.cend(), pTransaction->ModificationsPtr());
+
+		return pTransaction;
+	}
+}}
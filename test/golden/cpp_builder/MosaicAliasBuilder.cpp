@@ -0,0 +1,45 @@
+#include "MosaicAliasBuilder.h"
+
+namespace catapult { namespace builders {
+
+	MosaicAliasBuilder::MosaicAliasBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_aliasAction()
+			, m_namespaceId()
+			, m_mosaicId()
+	{}
+
+	void MosaicAliasBuilder::setAliasAction(model::AliasAction aliasAction) {
+		m_aliasAction = aliasAction;
+	}
+
+	void MosaicAliasBuilder::setNamespaceId(NamespaceId namespaceId) {
+		m_namespaceId = namespaceId;
+	}
+
+	void MosaicAliasBuilder::setMosaicId(MosaicId mosaicId) {
+		m_mosaicId = mosaicId;
+	}
+
+	std::unique_ptr<MosaicAliasBuilder::Transaction> MosaicAliasBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<MosaicAliasBuilder::EmbeddedTransaction> MosaicAliasBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> MosaicAliasBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->AliasAction = m_aliasAction;
+		pTransaction->NamespaceId = m_namespaceId;
+		pTransaction->MosaicId = m_mosaicId;
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,44 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/namespace/src/model/MosaicAliasTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for a mosaic alias transaction.
+	class MosaicAliasBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::MosaicAliasTransaction;
+		using EmbeddedTransaction = model::EmbeddedMosaicAliasTransaction;
+
+	public:
+		/// Creates a mosaic alias builder for building a mosaic alias transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		MosaicAliasBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the alias action to \a aliasAction.
+		void setAliasAction(model::AliasAction aliasAction);
+
+		/// Sets the id of a namespace that will become an alias to \a namespaceId.
+		void setNamespaceId(NamespaceId namespaceId);
+
+		/// Sets the aliased mosaic id to \a mosaicId.
+		void setMosaicId(MosaicId mosaicId);
+
+	public:
+		/// Builds a new mosaic alias transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded mosaic alias transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::AliasAction m_aliasAction;
+		NamespaceId m_namespaceId;
+		MosaicId m_mosaicId;
+	};
+}}
@@ -0,0 +1,50 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/mosaic/src/model/MosaicDefinitionTransaction.h"
+#include <vector>
+
+namespace catapult { namespace builders {
+
+	/// Builder for a mosaic definition transaction.
+	class MosaicDefinitionBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::MosaicDefinitionTransaction;
+		using EmbeddedTransaction = model::EmbeddedMosaicDefinitionTransaction;
+
+	public:
+		/// Creates a mosaic definition builder for building a mosaic definition transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		MosaicDefinitionBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the mosaic nonce to \a mosaicNonce.
+		void setMosaicNonce(MosaicNonce mosaicNonce);
+
+		/// Sets the mosaic flags to \a flags.
+		void setFlags(model::MosaicFlags flags);
+
+		/// Sets the mosaic divisibility to \a divisibility.
+		void setDivisibility(uint8_t divisibility);
+
+		/// Adds \a property to optional properties.
+		void addProperty(const model::MosaicProperty& property);
+
+	public:
+		/// Builds a new mosaic definition transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded mosaic definition transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		MosaicNonce m_mosaicNonce;
+		MosaicId m_mosaicId;
+		model::MosaicFlags m_flags;
+		uint8_t m_divisibility;
+		std::vector<model::MosaicProperty> m_properties;
+	};
+}}
@@ -0,0 +1,43 @@
+#include "MosaicPropertyBuilder.h"
+
+namespace catapult { namespace builders {
+
+	MosaicPropertyBuilder::MosaicPropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_propertyType()
+			, m_modifications()
+	{}
+
+	void MosaicPropertyBuilder::setPropertyType(model::PropertyType propertyType) {
+		m_propertyType = propertyType;
+	}
+
+	void MosaicPropertyBuilder::addModification(const model::MosaicPropertyModification& modification) {
+		m_modifications.push_back(modification);
+	}
+
+	std::unique_ptr<MosaicPropertyBuilder::Transaction> MosaicPropertyBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<MosaicPropertyBuilder::EmbeddedTransaction> MosaicPropertyBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> MosaicPropertyBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_modifications.size() * sizeof(model::MosaicPropertyModification);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->PropertyType = m_propertyType;
+		pTransaction->ModificationsCount = utils::checked_cast<size_t, uint8_t>(m_modifications.size());
+
+		// 3. set transaction attachments
+		std::copy(m_modifications.cbegin(), m_modifications.cend(), pTransaction->ModificationsPtr());
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,41 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/property/src/model/MosaicPropertyTransaction.h"
+#include <vector>
+
+namespace catapult { namespace builders {
+
+	/// Builder for a mosaic property transaction.
+	class MosaicPropertyBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::MosaicPropertyTransaction;
+		using EmbeddedTransaction = model::EmbeddedMosaicPropertyTransaction;
+
+	public:
+		/// Creates a mosaic property builder for building a mosaic property transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		MosaicPropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the property type to \a propertyType.
+		void setPropertyType(model::PropertyType propertyType);
+
+		/// Adds \a modification to property modifications.
+		void addModification(const model::MosaicPropertyModification& modification);
+
+	public:
+		/// Builds a new mosaic property transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded mosaic property transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::PropertyType m_propertyType;
+		std::vector<model::MosaicPropertyModification> m_modifications;
+	};
+}}
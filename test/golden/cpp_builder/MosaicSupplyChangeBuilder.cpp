@@ -0,0 +1,45 @@
+#include "MosaicSupplyChangeBuilder.h"
+
+namespace catapult { namespace builders {
+
+	MosaicSupplyChangeBuilder::MosaicSupplyChangeBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_mosaicId()
+			, m_direction()
+			, m_delta()
+	{}
+
+	void MosaicSupplyChangeBuilder::setMosaicId(UnresolvedMosaicId mosaicId) {
+		m_mosaicId = mosaicId;
+	}
+
+	void MosaicSupplyChangeBuilder::setDirection(model::MosaicSupplyChangeDirection direction) {
+		m_direction = direction;
+	}
+
+	void MosaicSupplyChangeBuilder::setDelta(Amount delta) {
+		m_delta = delta;
+	}
+
+	std::unique_ptr<MosaicSupplyChangeBuilder::Transaction> MosaicSupplyChangeBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<MosaicSupplyChangeBuilder::EmbeddedTransaction> MosaicSupplyChangeBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> MosaicSupplyChangeBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->MosaicId = m_mosaicId;
+		pTransaction->Direction = m_direction;
+		pTransaction->Delta = m_delta;
+
+		return pTransaction;
+	}
+}}
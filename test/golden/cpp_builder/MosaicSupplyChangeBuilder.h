@@ -0,0 +1,44 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/mosaic/src/model/MosaicSupplyChangeTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for a mosaic supply change transaction.
+	class MosaicSupplyChangeBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::MosaicSupplyChangeTransaction;
+		using EmbeddedTransaction = model::EmbeddedMosaicSupplyChangeTransaction;
+
+	public:
+		/// Creates a mosaic supply change builder for building a mosaic supply change transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		MosaicSupplyChangeBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the id of the affected mosaic to \a mosaicId.
+		void setMosaicId(UnresolvedMosaicId mosaicId);
+
+		/// Sets the supply change direction to \a direction.
+		void setDirection(model::MosaicSupplyChangeDirection direction);
+
+		/// Sets the amount of the change to \a delta.
+		void setDelta(Amount delta);
+
+	public:
+		/// Builds a new mosaic supply change transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded mosaic supply change transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		UnresolvedMosaicId m_mosaicId;
+		model::MosaicSupplyChangeDirection m_direction;
+		Amount m_delta;
+	};
+}}
@@ -0,0 +1,46 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/namespace/src/model/RegisterNamespaceTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for a register namespace transaction.
+	class RegisterNamespaceBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::RegisterNamespaceTransaction;
+		using EmbeddedTransaction = model::EmbeddedRegisterNamespaceTransaction;
+
+	public:
+		/// Creates a register namespace builder for building a register namespace transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		RegisterNamespaceBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the namespace duration to \a duration and namespaceType to `root`.
+		void setDuration(BlockDuration duration);
+
+		/// Sets the id of the parent namespace to \a parentId and namespaceType to `child`.
+		void setParentId(NamespaceId parentId);
+
+		/// Sets the namespace name to \a name.
+		void setName(const RawBuffer& name);
+
+	public:
+		/// Builds a new register namespace transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded register namespace transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::NamespaceType m_namespaceType;
+		BlockDuration m_duration;
+		NamespaceId m_parentId;
+		NamespaceId m_namespaceId;
+		std::vector<uint8_t> m_name;
+	};
+}}
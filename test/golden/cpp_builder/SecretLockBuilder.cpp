@@ -0,0 +1,57 @@
+#include "SecretLockBuilder.h"
+
+namespace catapult { namespace builders {
+
+	SecretLockBuilder::SecretLockBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_mosaic()
+			, m_duration()
+			, m_hashAlgorithm()
+			, m_secret()
+			, m_recipient()
+	{}
+
+	void SecretLockBuilder::setMosaic(const model::UnresolvedMosaic& mosaic) {
+		m_mosaic = mosaic;
+	}
+
+	void SecretLockBuilder::setDuration(BlockDuration duration) {
+		m_duration = duration;
+	}
+
+	void SecretLockBuilder::setHashAlgorithm(model::LockHashAlgorithm hashAlgorithm) {
+		m_hashAlgorithm = hashAlgorithm;
+	}
+
+	void SecretLockBuilder::setSecret(const Hash256& secret) {
+		m_secret = secret;
+	}
+
+	void SecretLockBuilder::setRecipient(const UnresolvedAddress& recipient) {
+		m_recipient = recipient;
+	}
+
+	std::unique_ptr<SecretLockBuilder::Transaction> SecretLockBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<SecretLockBuilder::EmbeddedTransaction> SecretLockBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> SecretLockBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->Mosaic = m_mosaic;
+		pTransaction->Duration = m_duration;
+		pTransaction->HashAlgorithm = m_hashAlgorithm;
+		pTransaction->Secret = m_secret;
+		pTransaction->Recipient = m_recipient;
+
+		return pTransaction;
+	}
+}}
@@ -0,0 +1,52 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/lock_secret/src/model/SecretLockTransaction.h"
+
+namespace catapult { namespace builders {
+
+	/// Builder for a secret lock transaction.
+	class SecretLockBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::SecretLockTransaction;
+		using EmbeddedTransaction = model::EmbeddedSecretLockTransaction;
+
+	public:
+		/// Creates a secret lock builder for building a secret lock transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		SecretLockBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the lock mosaic to \a mosaic.
+		void setMosaic(const model::UnresolvedMosaic& mosaic);
+
+		/// Sets the number of blocks for which a lock should be valid to \a duration.
+		void setDuration(BlockDuration duration);
+
+		/// Sets the hash alghoritm to \a hashAlgorithm.
+		void setHashAlgorithm(model::LockHashAlgorithm hashAlgorithm);
+
+		/// Sets the secret to \a secret.
+		void setSecret(const Hash256& secret);
+
+		/// Sets the recipient of the locked mosaic to \a recipient.
+		void setRecipient(const UnresolvedAddress& recipient);
+
+	public:
+		/// Builds a new secret lock transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded secret lock transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::UnresolvedMosaic m_mosaic;
+		BlockDuration m_duration;
+		model::LockHashAlgorithm m_hashAlgorithm;
+		Hash256 m_secret;
+		UnresolvedAddress m_recipient;
+	};
+}}
@@ -0,0 +1,56 @@
+#include "SecretProofBuilder.h"
+
+namespace catapult { namespace builders {
+
+	SecretProofBuilder::SecretProofBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_hashAlgorithm()
+			, m_secret()
+			, m_proof()
+	{}
+
+	void SecretProofBuilder::setHashAlgorithm(model::LockHashAlgorithm hashAlgorithm) {
+		m_hashAlgorithm = hashAlgorithm;
+	}
+
+	void SecretProofBuilder::setSecret(const Hash256& secret) {
+		m_secret = secret;
+	}
+
+	void SecretProofBuilder::setProof(const RawBuffer& proof) {
+		if (0 == proof.Size)
+			CATAPULT_THROW_INVALID_ARGUMENT("argument `proof` cannot be empty");
+
+		if (!m_proof.empty())
+			CATAPULT_THROW_RUNTIME_ERROR("`proof` field already set");
+
+		m_proof.resize(proof.Size);
+		m_proof.assign(proof.pData, proof.pData + proof.Size);
+	}
+
+	std::unique_ptr<SecretProofBuilder::Transaction> SecretProofBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<SecretProofBuilder::EmbeddedTransaction> SecretProofBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> SecretProofBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_proof.size();
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->HashAlgorithm = m_hashAlgorithm;
+		pTransaction->Secret = m_secret;
+		pTransaction->ProofSize = utils::checked_cast<size_t, uint16_t>(m_proof.size());
+
+		// 3. set transaction attachments
+		std::copy(m_proof.cbegin(), m_proof.cend(), pTransaction->ProofPtr());
+
+		return pTransaction;
+	}
+}}
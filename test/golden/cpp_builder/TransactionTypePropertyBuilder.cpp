@@ -0,0 +1,43 @@
+#include "TransactionTypePropertyBuilder.h"
+
+namespace catapult { namespace builders {
+
+	TransactionTypePropertyBuilder::TransactionTypePropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_propertyType()
+			, m_modifications()
+	{}
+
+	void TransactionTypePropertyBuilder::setPropertyType(model::PropertyType propertyType) {
+		m_propertyType = propertyType;
+	}
+
+	void TransactionTypePropertyBuilder::addModification(const model::TransactionTypePropertyModification& modification) {
+		m_modifications.push_back(modification);
+	}
+
+	std::unique_ptr<TransactionTypePropertyBuilder::Transaction> TransactionTypePropertyBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<TransactionTypePropertyBuilder::EmbeddedTransaction> TransactionTypePropertyBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> TransactionTypePropertyBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_modifications.size() * sizeof(model::TransactionTypePropertyModification);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->PropertyType = m_propertyType;
+		pTransaction->ModificationsCount = utils::checked_cast<size_t, uint8_t>(m_modifications.size());
+
+		// 3. set transaction attachments
+		std::copy(m_modifications.cbegin(), m_modifications.cend(), pTransaction->ModificationsPtr());
+
+		return pTransaction;
+	}
+}}
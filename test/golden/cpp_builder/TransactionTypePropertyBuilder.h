@@ -0,0 +1,41 @@
+#pragma once
+#include "TransactionBuilder.h"
+#include "plugins/txes/property/src/model/TransactionTypePropertyTransaction.h"
+#include <vector>
+
+namespace catapult { namespace builders {
+
+	/// Builder for a transaction type property transaction.
+	class TransactionTypePropertyBuilder : public TransactionBuilder {
+	public:
+		using Transaction = model::TransactionTypePropertyTransaction;
+		using EmbeddedTransaction = model::EmbeddedTransactionTypePropertyTransaction;
+
+	public:
+		/// Creates a transaction type property builder for building a transaction type property transaction from \a signer
+		/// for the network specified by \a networkIdentifier.
+		TransactionTypePropertyBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer);
+
+	public:
+		/// Sets the property type to \a propertyType.
+		void setPropertyType(model::PropertyType propertyType);
+
+		/// Adds \a modification to property modifications.
+		void addModification(const model::TransactionTypePropertyModification& modification);
+
+	public:
+		/// Builds a new transaction type property transaction.
+		std::unique_ptr<Transaction> build() const;
+
+		/// Builds a new embedded transaction type property transaction.
+		std::unique_ptr<EmbeddedTransaction> buildEmbedded() const;
+
+	private:
+		template<typename TTransaction>
+		std::unique_ptr<TTransaction> buildImpl() const;
+
+	private:
+		model::PropertyType m_propertyType;
+		std::vector<model::TransactionTypePropertyModification> m_modifications;
+	};
+}}
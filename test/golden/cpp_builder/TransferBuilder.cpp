@@ -0,0 +1,60 @@
+#include "TransferBuilder.h"
+
+namespace catapult { namespace builders {
+
+	TransferBuilder::TransferBuilder(model::NetworkIdentifier networkIdentifier, const Key& signer)
+			: TransactionBuilder(networkIdentifier, signer)
+			, m_recipient()
+			, m_message()
+			, m_mosaics()
+	{}
+
+	void TransferBuilder::setRecipient(const UnresolvedAddress& recipient) {
+		m_recipient = recipient;
+	}
+
+	void TransferBuilder::setMessage(const RawBuffer& message) {
+		if (0 == message.Size)
+			CATAPULT_THROW_INVALID_ARGUMENT("argument `message` cannot be empty");
+
+		if (!m_message.empty())
+			CATAPULT_THROW_RUNTIME_ERROR("`message` field already set");
+
+		m_message.resize(message.Size);
+		m_message.assign(message.pData, message.pData + message.Size);
+	}
+
+	void TransferBuilder::addMosaic(const model::UnresolvedMosaic& mosaic) {
+		InsertSorted(m_mosaics, mosaic, [](const auto& lhs, const auto& rhs) {
+			return lhs.MosaicId < rhs.MosaicId;
+		});
+	}
+
+	std::unique_ptr<TransferBuilder::Transaction> TransferBuilder::build() const {
+		return buildImpl<Transaction>();
+	}
+
+	std::unique_ptr<TransferBuilder::EmbeddedTransaction> TransferBuilder::buildEmbedded() const {
+		return buildImpl<EmbeddedTransaction>();
+	}
+
+	template<typename TransactionType>
+	std::unique_ptr<TransactionType> TransferBuilder::buildImpl() const {
+		// 1. allocate, zero (header), set model::Transaction fields
+		auto size = sizeof(TransactionType);
+		size += m_message.size();
+		size += m_mosaics.size() * sizeof(model::UnresolvedMosaic);
+		auto pTransaction = createTransaction<TransactionType>(size);
+
+		// 2. set fixed transaction fields
+		pTransaction->Recipient = m_recipient;
+		pTransaction->MessageSize = utils::checked_cast<size_t, uint16_t>(m_message.size());
+		pTransaction->MosaicsCount = utils::checked_cast<size_t, uint8_t>(m_mosaics.size());
+
+		// 3. set transaction attachments
+		std::copy(m_message.cbegin(), m_message.cend(), pTransaction->MessagePtr());
+		std::copy(m_mosaics.cbegin(), m_mosaics.cend(), pTransaction->MosaicsPtr());
+
+		return pTransaction;
+	}
+}}
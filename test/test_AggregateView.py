@@ -0,0 +1,275 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.test_CatsParser import parse_all
+from catcodec.AggregateView import AggregateView
+from catcodec.DecodeException import DecodeException
+from catcodec.SchemaEncoder import SchemaEncoder
+from catcodec.SchemaView import SchemaView
+from catparser.CatsParseException import CatsParseException
+from catparser.MultiFileParser import MultiFileParser
+from catparser.SchemaSource import SchemaSource
+
+SCHEMA_LINES = [
+    'using Key = binary_fixed(5)',
+    'using Signature = binary_fixed(6)',
+    'enum EntityType : uint16',
+    '\treserved = 0',
+    'struct SizePrefixedEntity',
+    '\tsize = uint32',
+    'struct EntityBody',
+    '\tsigner = Key',
+    '\tversion = uint16',
+    '\ttype = EntityType',
+    'struct Transaction',
+    '\tinline SizePrefixedEntity',
+    '\tsignature = Signature',
+    '\tinline EntityBody',
+    'struct EmbeddedTransaction',
+    '\tinline SizePrefixedEntity',
+    '\tinline EntityBody',
+    'struct TransferTransactionBody',
+    '\tmessageSize = uint8',
+    '\tmessage = array(byte, messageSize)',
+    'struct TransferTransaction',
+    '\tconst uint8 version = 3',
+    '\tconst EntityType entityType = 0x4154',
+    '\tinline Transaction',
+    '\tinline TransferTransactionBody',
+    'struct EmbeddedTransferTransaction',
+    '\tinline EmbeddedTransaction',
+    '\tinline TransferTransactionBody',
+    'struct LinkTransactionBody',
+    '\tremoteKey = Key',
+    'struct LinkTransaction',
+    '\tconst uint8 version = 1',
+    '\tconst EntityType entityType = 0x414C',
+    '\tinline Transaction',
+    '\tinline LinkTransactionBody',
+    'struct EmbeddedLinkTransaction',
+    '\tinline EmbeddedTransaction',
+    '\tinline LinkTransactionBody',
+    'struct Cosignature',
+    '\tsigner = Key',
+    '\tsignature = Signature',
+    'struct AggregateTransactionHeader',
+    '\tpayloadSize = uint8',
+    'struct AggregateTransaction',
+    '\tconst uint8 version = 2',
+    '\tconst EntityType entityType = 0x4141',
+    '\tinline Transaction',
+    '\tinline AggregateTransactionHeader',
+    '\ttransactions = array(byte, payloadSize)',
+    '\tcosignatures = array(byte, size - payloadSize)'
+]
+
+
+# embedded link transaction added to the aggregate schema file, which does not define any embedded transactions
+AGGREGATE_FILE_SCHEMA_TEXT = '''import "aggregate/aggregate.cats"
+import "aggregate/cosignature.cats"
+
+struct LinkTransactionBody
+\tremoteKey = Key
+
+struct LinkTransaction
+\tconst uint8 version = 1
+\tconst EntityType entityType = 0x414C
+\tinline Transaction
+\tinline LinkTransactionBody
+
+struct EmbeddedLinkTransaction
+\tinline EmbeddedTransaction
+\tinline LinkTransactionBody
+'''
+
+
+def create_aggregate_view():
+    return AggregateView(SchemaView(parse_all(SCHEMA_LINES)))
+
+
+def parse_aggregate_file_schema():
+    file_parser = MultiFileParser()
+    file_parser.set_include_path('schemas')
+    file_parser.parse(SchemaSource.from_string('aggregate_link.cats', AGGREGATE_FILE_SCHEMA_TEXT))
+    return file_parser.cats_parser.type_descriptors()
+
+
+def get_cosignatures(aggregate):
+    return [(bytes(cosignature.signer), bytes(cosignature.signature)) for cosignature in aggregate.cosignatures]
+
+
+def serialize_embedded_transfer(signer, message):
+    return struct.pack('<I5sHHB', 14 + len(message), signer, 0x9003, 0x4154, len(message)) + message
+
+
+def serialize_embedded_link(signer, remote_key):
+    return struct.pack('<I5sHH5s', 18, signer, 0x9001, 0x414C, remote_key)
+
+
+def serialize_aggregate(transactions, cosignatures):
+    payload = b''.join(transactions)
+    cosignatures_payload = b''.join(struct.pack('<5s6s', signer, signature) for signer, signature in cosignatures)
+    size = 4 + 6 + 5 + 2 + 2 + 1 + len(payload) + len(cosignatures_payload)
+    return struct.pack('<I6s5sHHB', size, b'SIGNAT', b'AGGRE', 0x9002, 0x4141, len(payload)) + payload + cosignatures_payload
+
+
+TRANSACTIONS = [
+    serialize_embedded_transfer(b'ALICE', b'hello'),
+    serialize_embedded_link(b'BOB!!', b'REMOT'),
+    serialize_embedded_transfer(b'CARLA', b'')
+]
+
+COSIGNATURES = [(b'COS01', b'SIGNA1'), (b'COS02', b'SIGNA2')]
+
+
+class AggregateViewTest(unittest.TestCase):
+    def test_can_view_aggregate_header(self):
+        # Act:
+        aggregate = create_aggregate_view().view(serialize_aggregate(TRANSACTIONS, COSIGNATURES))
+
+        # Assert:
+        self.assertEqual(b'AGGRE', aggregate.header.signer)
+        self.assertEqual(0x4141, aggregate.header.type)
+        self.assertEqual(sum(len(transaction) for transaction in TRANSACTIONS), aggregate.header.payloadSize)
+
+    def test_embedded_transactions_are_dispatched_to_their_embedded_layouts(self):
+        # Act:
+        aggregate = create_aggregate_view().view(serialize_aggregate(TRANSACTIONS, COSIGNATURES))
+        transactions = list(aggregate.transactions)
+
+        # Assert:
+        self.assertEqual(
+            ['EmbeddedTransferTransactionView', 'EmbeddedLinkTransactionView', 'EmbeddedTransferTransactionView'],
+            [type(transaction).__name__ for transaction in transactions])
+        self.assertEqual([b'ALICE', b'BOB!!', b'CARLA'], [bytes(transaction.signer) for transaction in transactions])
+        self.assertEqual(b'hello', bytes(transactions[0].message))
+        self.assertEqual(b'REMOT', bytes(transactions[1].remoteKey))
+        self.assertEqual(b'', bytes(transactions[2].message))
+        self.assertEqual([len(transaction) for transaction in TRANSACTIONS], [transaction.view_size() for transaction in transactions])
+
+    def test_embedded_transactions_are_not_copied(self):
+        # Arrange:
+        buffer = bytearray(serialize_aggregate(TRANSACTIONS, COSIGNATURES))
+        aggregate = create_aggregate_view().view(buffer)
+
+        # Act:
+        message = next(iter(aggregate.transactions)).message
+        buffer[4 + 6 + 5 + 2 + 2 + 1 + 14] = ord('j')
+
+        # Assert:
+        self.assertEqual(b'jello', bytes(message))
+
+    def test_embedded_transactions_are_decoded_lazily(self):
+        # Arrange: second transaction has an unregistered version
+        transactions = [TRANSACTIONS[0], struct.pack('<I5sHH5s', 18, b'BOB!!', 0x9002, 0x414C, b'REMOT')]
+        aggregate = create_aggregate_view().view(serialize_aggregate(transactions, []))
+        iterator = iter(aggregate.transactions)
+
+        # Act:
+        transaction = next(iterator)
+
+        # Assert:
+        self.assertEqual(b'hello', bytes(transaction.message))
+        with self.assertRaisesRegex(DecodeException, 'no embedded entity is registered for entity type 0x414C and version 2'):
+            next(iterator)
+
+    def test_cosignatures_are_fixed_stride_views(self):
+        # Act:
+        aggregate = create_aggregate_view().view(serialize_aggregate(TRANSACTIONS, COSIGNATURES))
+
+        # Assert:
+        self.assertEqual(2, len(aggregate.cosignatures))
+        self.assertEqual(COSIGNATURES, get_cosignatures(aggregate))
+        self.assertEqual(b'COS02', bytes(aggregate.cosignatures[-1].signer))
+        self.assertEqual(memoryview, type(aggregate.cosignatures[0].signer))
+
+    def test_can_view_aggregate_without_transactions_or_cosignatures(self):
+        # Act:
+        aggregate = create_aggregate_view().view(serialize_aggregate([], []))
+
+        # Assert:
+        self.assertEqual([], list(aggregate.transactions))
+        self.assertEqual(0, len(aggregate.cosignatures))
+
+    def test_can_view_aggregate_at_offset(self):
+        # Act:
+        aggregate = create_aggregate_view().view(b'\xFF' * 5 + serialize_aggregate(TRANSACTIONS, COSIGNATURES) + b'\xFF', 5)
+
+        # Assert:
+        self.assertEqual(3, len(list(aggregate.transactions)))
+        self.assertEqual(COSIGNATURES, get_cosignatures(aggregate))
+
+    def test_cannot_view_embedded_transaction_exceeding_transactions_region(self):
+        # Arrange: size of last transaction is too large
+        transactions = [TRANSACTIONS[0], struct.pack('<I5sHH5s', 19, b'BOB!!', 0x9001, 0x414C, b'REMOT')]
+        aggregate = create_aggregate_view().view(serialize_aggregate(transactions, COSIGNATURES))
+
+        # Act + Assert:
+        with self.assertRaises(DecodeException):
+            list(aggregate.transactions)
+
+    def test_cannot_view_aggregate_with_partial_cosignature(self):
+        # Arrange:
+        buffer = serialize_aggregate(TRANSACTIONS, COSIGNATURES)
+        buffer = struct.pack('<I', len(buffer) - 1) + buffer[4:-1]
+
+        # Act + Assert:
+        with self.assertRaisesRegex(DecodeException, 'not a multiple of cosignature size 11'):
+            create_aggregate_view().view(buffer)
+
+    def test_cannot_view_aggregate_with_size_exceeding_buffer(self):
+        # Arrange:
+        buffer = serialize_aggregate(TRANSACTIONS, COSIGNATURES)
+
+        # Act + Assert:
+        with self.assertRaisesRegex(DecodeException, 'is invalid for buffer with size'):
+            create_aggregate_view().view(buffer[:-1])
+
+    def test_cannot_create_view_for_aggregate_without_cosignatures_field(self):
+        # Arrange:
+        schema_view = SchemaView(parse_all(SCHEMA_LINES[:-1]))
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            AggregateView(schema_view)
+
+    def test_cosignatures_field_cannot_be_viewed_generically(self):
+        # Arrange:
+        aggregate = create_aggregate_view().view(serialize_aggregate(TRANSACTIONS, COSIGNATURES))
+
+        # Act + Assert:
+        with self.assertRaisesRegex(DecodeException, 'sized by expression "size - payloadSize"'):
+            _ = aggregate.header.cosignatures
+
+    def test_can_view_aggregate_described_by_schema_file(self):
+        # Arrange:
+        type_descriptors = parse_aggregate_file_schema()
+        encoder = SchemaEncoder(type_descriptors)
+        embedded_values = {'signer': b'S' * 32, 'version': 0x9001, 'type': 0x414C}
+        transactions = [
+            encoder.encode('EmbeddedLinkTransaction', {**embedded_values, 'remoteKey': remote_key}) for remote_key in [b'R' * 32, b'T' * 32]
+        ]
+        cosignatures = [(b'C' * 32, b'D' * 64), (b'E' * 32, b'F' * 64)]
+
+        aggregate_values = {
+            'signature': b'G' * 64,
+            'signer': b'A' * 32,
+            'version': 0x9002,
+            'type': 0x4141,
+            'fee': 10,
+            'deadline': 20,
+            'transactions': b''.join(transactions),
+            'cosignatures': b''.join(signer + signature for signer, signature in cosignatures)
+        }
+        buffer = encoder.encode('AggregateTransaction', aggregate_values)
+
+        # Act:
+        aggregate = AggregateView(SchemaView(type_descriptors)).view(buffer)
+        embedded_transactions = list(aggregate.transactions)
+
+        # Assert:
+        self.assertEqual(b'A' * 32, aggregate.header.signer)
+        self.assertEqual(2 * 72, aggregate.header.payloadSize)
+        self.assertEqual(['EmbeddedLinkTransactionView'] * 2, [type(transaction).__name__ for transaction in embedded_transactions])
+        self.assertEqual([b'R' * 32, b'T' * 32], [bytes(transaction.remoteKey) for transaction in embedded_transactions])
+        self.assertEqual(cosignatures, get_cosignatures(aggregate))
@@ -0,0 +1,147 @@
+# pylint: disable=invalid-name
+import asyncio
+import functools
+import struct
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from test.test_CatsParser import parse_all
+from test.test_FrameReader import FRAMES, create_frame
+from catcodec.AsyncFrameReader import AsyncFrameReader
+from catcodec.FrameException import FrameException
+from catcodec.SchemaDecoder import SchemaDecoder
+
+
+def run_with_server(data, client, chunk_size=None):
+    """Serves data from a local stream server and runs client with a stream reader connected to it"""
+    async def handle_connection(_, writer):
+        for index in range(0, len(data), chunk_size or max(1, len(data))):
+            writer.write(data[index:index + (chunk_size or len(data))])
+            await writer.drain()
+
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle_connection, '127.0.0.1', 0)
+        try:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                return await client(reader)
+            finally:
+                writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+async def read_all_frames(reader, **kwargs):
+    return [frame async for frame in AsyncFrameReader(reader, **kwargs)]
+
+
+async def read_all_batches(reader, batch_size, max_queued_batches, consume_delay=0):
+    queue = asyncio.Queue(max_queued_batches)
+    frame_reader = AsyncFrameReader(reader)
+    producer = asyncio.ensure_future(frame_reader.read_batches(queue, batch_size))
+
+    batches = []
+    max_frames_ahead = 0
+    while True:
+        batch = await queue.get()
+        if batch is None:
+            break
+
+        batches.append(batch)
+        num_consumed_bytes = sum(len(frame) for batch in batches for frame in batch)
+        max_frames_ahead = max(max_frames_ahead, (frame_reader.offset - num_consumed_bytes) // len(FRAMES[1]))
+        await asyncio.sleep(consume_delay)
+
+    await producer
+    return (batches, max_frames_ahead)
+
+
+class AsyncFrameReaderTest(unittest.TestCase):
+    def test_can_read_frames_as_they_arrive(self):
+        for chunk_size in [1, 7, 1000]:
+            # Act:
+            frames = run_with_server(b''.join(FRAMES), read_all_frames, chunk_size)
+
+            # Assert:
+            self.assertEqual(FRAMES, frames, chunk_size)
+
+    def test_can_read_empty_stream(self):
+        self.assertEqual([], run_with_server(b'', read_all_frames))
+
+    def _assert_frame_exception(self, data, expected_offset, expected_message, **kwargs):
+        # Act:
+        with self.assertRaises(FrameException) as context:
+            run_with_server(data, functools.partial(read_all_frames, **kwargs))
+
+        # Assert:
+        self.assertEqual(expected_offset, context.exception.offset)
+        self.assertIn(expected_message, str(context.exception))
+
+    def test_cannot_read_truncated_frame(self):
+        self._assert_frame_exception(b''.join(FRAMES)[:-2], 129, 'frame is truncated (7 of 9 bytes available)')
+
+    def test_cannot_read_truncated_size_prefix(self):
+        self._assert_frame_exception(b''.join(FRAMES) + b'\x05\x00', 138, 'frame is truncated (2 of 4 bytes available)')
+
+    def test_cannot_read_frame_larger_than_max_frame_size(self):
+        self._assert_frame_exception(
+            FRAMES[1] + FRAMES[2] + FRAMES[3], 21, 'frame size 104 exceeds max frame size 100', max_frame_size=100)
+
+    def test_can_read_frames_in_bounded_batches(self):
+        # Arrange:
+        frames = [FRAMES[1]] * 1000
+
+        # Act:
+        batches, _ = run_with_server(b''.join(frames), lambda reader: read_all_batches(reader, 16, 2))
+
+        # Assert:
+        self.assertEqual(frames, [frame for batch in batches for frame in batch])
+        self.assertTrue(all(1 <= len(batch) <= 16 for batch in batches))
+
+    def test_frames_are_not_read_ahead_of_slow_consumer(self):
+        # Arrange:
+        frames = [FRAMES[1]] * 200
+
+        # Act:
+        batches, max_frames_ahead = run_with_server(b''.join(frames), lambda reader: read_all_batches(reader, 4, 2, 0.001))
+
+        # Assert: at most two queued batches, the batch being filled and the batch blocked on the full queue are read ahead
+        self.assertEqual(frames, [frame for batch in batches for frame in batch])
+        self.assertLessEqual(max_frames_ahead, 4 * 4)
+
+    def test_can_decode_batches_in_executor(self):
+        # Arrange:
+        decoder = SchemaDecoder(parse_all(['struct Entity', '\tsize = uint32', '\tvalue = uint16', '\tpadding = uint8']))
+        frames = [struct.pack('<IHB', 7, value, 0) for value in range(500)]
+
+        def decode(frame):
+            return decoder.decode('Entity', frame)['value']
+
+        async def decode_all(reader):
+            with ThreadPoolExecutor(2) as executor:
+                return [batch async for batch in AsyncFrameReader(reader).decode_batches(decode, executor, batch_size=32)]
+
+        # Act:
+        batches = run_with_server(b''.join(frames), decode_all, 100)
+
+        # Assert:
+        self.assertEqual(list(range(500)), [value for batch in batches for value in batch])
+        self.assertTrue(all(len(batch) <= 32 for batch in batches))
+
+    def test_decode_batches_raises_read_errors(self):
+        # Arrange:
+        async def decode_all(reader):
+            return [batch async for batch in AsyncFrameReader(reader).decode_batches(bytes)]
+
+        # Act + Assert:
+        with self.assertRaises(FrameException):
+            run_with_server(b''.join(FRAMES) + create_frame(10)[:-1], decode_all)
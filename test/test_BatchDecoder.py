@@ -0,0 +1,137 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.test_CatsParser import parse_all
+from test.test_SchemaDecoder import SCHEMA_LINES, serialize_bundle
+from catcodec.BatchDecoder import BatchDecoder
+from catcodec.DecodeException import DecodeException
+from catcodec.DtypeBuilder import np
+from catcodec.SchemaDecoder import SchemaDecoder
+from catparser.CatsParseException import CatsParseException
+
+# notes is an array of variable size structs, so only the fields preceding it can be decoded in batch
+BATCH_FIELD_NAMES = [
+    'size', 'signer', 'shape', 'radius', 'side', 'messageSize', 'mosaicsCount', 'hash', 'message', 'mosaics', 'amounts', 'keys'
+]
+
+
+def create_buffers():
+    buffers = [serialize_bundle(1, 'H', 0xABCD), serialize_bundle(2, 'I', 0xABCDEF01), serialize_bundle(0, 'I', 0)]
+
+    # vary the sizes of the arrays of the last bundle
+    buffers[2] = buffers[2][:15] + struct.pack('<BB', 5, 0) + b'HH' + b'hello' + struct.pack('<QQ', 9, 10) + buffers[2][-16:]
+    return buffers
+
+
+def create_batch_decoder(field_names=None):
+    return BatchDecoder(parse_all(SCHEMA_LINES), 'Bundle', field_names or BATCH_FIELD_NAMES)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class BatchDecoderTest(unittest.TestCase):
+    def _assert_columns_match_schema_decoder(self, buffers, columns):
+        decoder = SchemaDecoder(parse_all(SCHEMA_LINES))
+        all_values = [decoder.decode_from('Bundle', buffer)[0] for buffer in buffers]
+
+        self.assertEqual([values['size'] for values in all_values], columns['size'].tolist())
+        self.assertEqual([values['signer'] for values in all_values], [bytes(signer) for signer in columns['signer']])
+        self.assertEqual([values['shape'] for values in all_values], columns['shape'].tolist())
+        self.assertEqual([values['hash'] for values in all_values], [bytes(hash_value) for hash_value in columns['hash']])
+        self.assertEqual([values['amounts'] for values in all_values], columns['amounts'].tolist())
+
+        # conditional fields are decoded for all structs
+        self.assertEqual(['radius' in values for values in all_values], columns['radius_present'].tolist())
+        self.assertEqual(['side' in values for values in all_values], columns['side_present'].tolist())
+        self.assertEqual(0xABCD, columns['radius'][0])
+        self.assertEqual(0xABCDEF01, columns['side'][1])
+
+        # arrays are flattened
+        self.assertEqual(b''.join(values['message'] for values in all_values), columns['message'].tobytes())
+        self.assertEqual([0, 3, 6, 11], columns['message_offsets'].tolist())
+        self.assertEqual([0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2], columns['message_parents'].tolist())
+
+        self.assertEqual([mosaic['amount'] for values in all_values for mosaic in values['mosaics']], columns['mosaics']['amount'].tolist())
+        self.assertEqual([mosaic['delta'] for values in all_values for mosaic in values['mosaics']], columns['mosaics']['delta'].tolist())
+        self.assertEqual([0, 2, 4, 4], columns['mosaics_offsets'].tolist())
+        self.assertEqual([0, 0, 1, 1], columns['mosaics_parents'].tolist())
+        self.assertEqual([key for values in all_values for key in values['keys']], [bytes(key) for key in columns['keys']])
+
+    def test_can_decode_list_of_buffers(self):
+        # Arrange:
+        buffers = create_buffers()
+
+        # Act:
+        columns = create_batch_decoder().decode(buffers)
+
+        # Assert:
+        self._assert_columns_match_schema_decoder(buffers, columns)
+
+    def test_can_decode_concatenated_buffer_with_offsets(self):
+        # Arrange:
+        buffers = create_buffers()
+        offsets = [0, len(buffers[0]), len(buffers[0]) + len(buffers[1])]
+
+        # Act:
+        columns = create_batch_decoder().decode_buffer(b''.join(buffers), offsets)
+
+        # Assert:
+        self._assert_columns_match_schema_decoder(buffers, columns)
+
+    def test_only_requested_columns_are_returned(self):
+        # Act:
+        columns = create_batch_decoder(['size', 'radius', 'mosaics']).decode(create_buffers())
+
+        # Assert: count and condition fields are decoded but not returned
+        self.assertEqual(
+            ['size', 'radius_present', 'radius', 'mosaics', 'mosaics_offsets', 'mosaics_parents'],
+            list(columns.keys()))
+
+    def test_can_decode_fields_with_underscores_in_names(self):
+        # Arrange:
+        type_descriptors = parse_all([
+            'using Amount = uint64',
+            'struct Fee',
+            '\tmax_fee = Amount',
+            '\tfee_count = uint8',
+            '\tfee_values = array(Amount, fee_count)'
+        ])
+        buffers = [struct.pack('<QBQ', 7, 1, 3), struct.pack('<QBQQ', 9, 2, 4, 5)]
+
+        # Act:
+        columns = BatchDecoder(type_descriptors, 'Fee', ['max_fee', 'fee_values']).decode(buffers)
+
+        # Assert:
+        self.assertEqual(['max_fee', 'fee_values', 'fee_values_offsets', 'fee_values_parents'], list(columns.keys()))
+        self.assertEqual([7, 9], columns['max_fee'].tolist())
+        self.assertEqual([3, 4, 5], columns['fee_values'].tolist())
+        self.assertEqual([0, 1, 3], columns['fee_values_offsets'].tolist())
+
+    def test_can_decode_empty_batch(self):
+        # Act:
+        columns = create_batch_decoder(['size', 'mosaics']).decode([])
+
+        # Assert:
+        self.assertEqual(0, len(columns['size']))
+        self.assertEqual(0, len(columns['mosaics']))
+        self.assertEqual([0], columns['mosaics_offsets'].tolist())
+
+    def test_cannot_decode_array_of_variable_size_structs(self):
+        # Arrange:
+        batch_decoder = create_batch_decoder(['size', 'notes'])
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            batch_decoder.decode(create_buffers())
+
+    def test_cannot_decode_truncated_struct(self):
+        # Arrange:
+        buffers = create_buffers()
+        buffers[1] = buffers[1][:20]
+
+        # Act + Assert:
+        with self.assertRaises(DecodeException):
+            create_batch_decoder().decode(buffers)
+
+    def test_cannot_request_unknown_field(self):
+        with self.assertRaises(CatsParseException):
+            create_batch_decoder(['size', 'fee'])
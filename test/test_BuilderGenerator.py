@@ -0,0 +1,103 @@
+# pylint: disable=invalid-name
+import os
+import unittest
+from test.test_CatsParser import parse_all
+from catparser.MultiFileParser import MultiFileParser
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.cpp_builder.HintCache import Hints
+
+TRANSACTION_NAMES = ['FooTransaction', 'BarTransaction', 'BazTransaction', 'QuxTransaction', 'QuuxTransaction']
+
+GOLDEN_DIRECTORY = 'test/golden/cpp_builder'
+SCHEMA_NAMES = [
+    'accountlink/account_link', 'lock_hash/hash_lock', 'lock_secret/secret_lock', 'lock_secret/secret_proof', 'mosaic/mosaic_definition',
+    'mosaic/mosaic_supply_change', 'multisig/modify_multisig_account', 'namespace/address_alias', 'namespace/mosaic_alias',
+    'namespace/register_namespace', 'property/address_property', 'property/mosaic_property', 'property/transaction_type_property',
+    'transfer/transfer'
+]
+
+
+def create_schema_lines(transaction_names):
+    lines = ['using Key = binary_fixed(32)']
+    for transaction_name in transaction_names:
+        lines += [
+            'struct {0}Body'.format(transaction_name),
+            '\trecipient = Key',
+            '\tvalueSize = uint8',
+            '\tvalue = array(byte, valueSize)',
+            'struct {0}'.format(transaction_name),
+            '\tinline {0}Body'.format(transaction_name)
+        ]
+
+    return lines
+
+
+def load_schema(schema_name):
+    file_parser = MultiFileParser()
+    file_parser.set_include_path('schemas')
+    file_parser.parse('schemas/{0}.cats'.format(schema_name))
+    return file_parser.cats_parser.type_descriptors()
+
+
+def read_golden_file(filename):
+    with open(os.path.join(GOLDEN_DIRECTORY, filename), 'rb') as golden_file:
+        return golden_file.read()
+
+
+def generate(transaction_names, **options):
+    schema = parse_all(create_schema_lines(TRANSACTION_NAMES))
+    hints = Hints({transaction_name: {'plugin': transaction_name.lower()} for transaction_name in TRANSACTION_NAMES})
+    return list(BuilderGenerator(schema, {'copyright': '', 'hints': hints, 'transactions': transaction_names, **options}))
+
+
+class BuilderGeneratorTest(unittest.TestCase):
+    def test_generates_header_and_implementation_of_each_transaction_in_schema_order(self):
+        # Act:
+        descriptors = generate(None)
+
+        # Assert:
+        expected_filenames = []
+        for transaction_name in TRANSACTION_NAMES:
+            builder_name = transaction_name[:-len('Transaction')] + 'Builder'
+            expected_filenames += ['{0}.h'.format(builder_name), '{0}.cpp'.format(builder_name)]
+
+        self.assertEqual(expected_filenames, [descriptor.filename for descriptor in descriptors])
+
+    def test_parallel_generation_produces_same_descriptors_as_serial_generation(self):
+        # Arrange:
+        expected_descriptors = generate(None)
+
+        for jobs in [2, 3, 8]:
+            # Act:
+            descriptors = generate(None, jobs=jobs)
+
+            # Assert:
+            self.assertEqual(expected_descriptors, descriptors, 'jobs {0}'.format(jobs))
+
+    def test_parallel_generation_respects_transaction_subset(self):
+        # Act:
+        descriptors = generate({'BazTransaction', 'FooTransaction'}, jobs=2)
+
+        # Assert:
+        expected_filenames = ['FooBuilder.h', 'FooBuilder.cpp', 'BazBuilder.h', 'BazBuilder.cpp']
+        self.assertEqual(expected_filenames, [descriptor.filename for descriptor in descriptors])
+        self.assertEqual(generate({'BazTransaction', 'FooTransaction'}), descriptors)
+
+    def test_parallel_generation_produces_nothing_when_no_transactions_match(self):
+        # Act:
+        descriptors = generate({'MissingTransaction'}, jobs=2)
+
+        # Assert:
+        self.assertEqual([], descriptors)
+
+    def test_generated_builders_are_identical_to_golden_files(self):
+        # Act:
+        filenames = []
+        for schema_name in SCHEMA_NAMES:
+            for descriptor in BuilderGenerator(load_schema(schema_name), {'copyright': ''}):
+                # Assert:
+                code = ''.join('{0}\n'.format(line) for line in descriptor.code).encode('utf8')
+                self.assertEqual(read_golden_file(descriptor.filename), code, descriptor.filename)
+                filenames.append(descriptor.filename)
+
+        self.assertEqual(sorted(os.listdir(GOLDEN_DIRECTORY)), sorted(filenames))
@@ -198,6 +198,69 @@ class CatsParserTests(unittest.TestCase):
             {'name': 'perimiter', 'type': 'Perm', 'condition': 'enclosingType', 'condition_value': 'rectangle', 'comments': 'union part 2'}
         ]})
 
+    def test_can_parse_struct_conditional_types_after_inline_member(self):
+        # Act:
+        type_descriptors = parse_all([
+            'enum Shape : uint8',
+            '\tcircle = 4',
+            'using Circ = uint16',
+            'struct Placeholder',
+            'struct Enclosing',
+            '\tinline Placeholder',
+            '\tenclosingType = Shape',
+            '\tcircumference = Circ if enclosingType equals circle'
+        ])
+
+        # Assert:
+        self.assertEqual(4, len(type_descriptors))
+        self.assertEqual(type_descriptors['Enclosing'], {'type': 'struct', 'comments': '', 'layout': [
+            {'type': 'Placeholder', 'disposition': 'inline', 'comments': ''},
+            {'name': 'enclosingType', 'type': 'Shape', 'comments': ''},
+            {'name': 'circumference', 'type': 'Circ', 'condition': 'enclosingType', 'condition_value': 'circle', 'comments': ''}
+        ]})
+
+    def test_can_parse_struct_with_references_to_inlined_properties(self):
+        # Act: references are resolved through transitively inlined structs
+        type_descriptors = parse_all([
+            'enum Shape : uint8',
+            '\tcircle = 4',
+            'struct Header',
+            '\tshape = Shape',
+            '\tpayloadSize = uint8',
+            'struct Transaction',
+            '\tinline Header',
+            'struct Enclosing',
+            '\tinline Transaction',
+            '\tpayload = array(byte, payloadSize)',
+            '\tradius = uint16 if shape equals circle'
+        ])
+
+        # Assert:
+        self.assertEqual(type_descriptors['Enclosing'], {'type': 'struct', 'comments': '', 'layout': [
+            {'type': 'Transaction', 'disposition': 'inline', 'comments': ''},
+            {'name': 'payload', 'type': 'byte', 'size': 'payloadSize', 'comments': ''},
+            {
+                'name': 'radius', 'size': 2, 'type': 'byte', 'signedness': 'unsigned', 'condition': 'shape', 'condition_value': 'circle',
+                'comments': ''
+            }
+        ]})
+
+    def test_can_parse_struct_with_many_members(self):
+        # Arrange:
+        lines = ['enum Shape : uint16'] + ['\tshape{0} = {0}'.format(i) for i in range(2000)]
+        lines += ['struct Enclosing', '\tshapeType = Shape']
+        lines += ['\tfield{0} = uint8 if shapeType equals shape{0}'.format(i) for i in range(2000)]
+
+        # Act:
+        type_descriptors = parse_all(lines)
+
+        # Assert:
+        self.assertEqual(2000, len(type_descriptors['Shape']['values']))
+        self.assertEqual(2001, len(type_descriptors['Enclosing']['layout']))
+        self.assertEqual(
+            {'name': 'field1999', **uint_descriptor(1), 'condition': 'shapeType', 'condition_value': 'shape1999', 'comments': ''},
+            type_descriptors['Enclosing']['layout'][-1])
+
     def test_can_parse_struct_array_types(self):
         # Act:
         type_descriptors = parse_all([
@@ -485,6 +548,38 @@ class CatsParserTests(unittest.TestCase):
             {'name': 'foo', 'value': 9, 'comments': ''}
         ]})
 
+    def test_open_type_is_closed_when_scope_is_popped(self):
+        # Arrange:
+        parser = CatsParser(None)
+        parser.push_scope('foo.cats')
+        for line in ['struct Bar', '\tfoo = uint8']:
+            parser.process_line(line)
+
+        # Act:
+        parser.pop_scope()
+
+        # Assert:
+        self.assertEqual(['Bar'], list(parser.wip_type_descriptors.keys()))
+
+    def test_can_add_type_descriptor(self):
+        # Arrange:
+        parser = CatsParser(None)
+
+        # Act:
+        parser.add_type_descriptor('Bar', {'type': 'byte', 'size': 1, 'signedness': 'unsigned', 'comments': ''})
+
+        # Assert:
+        self.assertEqual({'Bar': {'type': 'byte', 'size': 1, 'signedness': 'unsigned', 'comments': ''}}, parser.type_descriptors())
+
+    def test_cannot_add_duplicate_type_descriptor(self):
+        # Arrange:
+        parser = CatsParser(None)
+        parser.process_line('using Bar = uint16')
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            parser.add_type_descriptor('Bar', {'type': 'byte', 'size': 1, 'signedness': 'unsigned', 'comments': ''})
+
     # endregion
 
     # region ordering
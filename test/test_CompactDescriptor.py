@@ -0,0 +1,114 @@
+# pylint: disable=invalid-name
+import pickle
+import unittest
+from test.test_CatsParser import parse_all
+from catparser.CompactDescriptor import DescriptorInterner, MemberDescriptor, StructDescriptor, compact_type_descriptors
+
+SCHEMA_LINES = [
+    'using Amount = uint64',
+    'using Height = uint64',
+    '# shape of a mosaic',
+    'enum Shape : uint8',
+    '\tcircle = 1',
+    '\tsquare = 2',
+    'struct Mosaic',
+    '\tconst uint8 version = 1',
+    '\tshape = Shape',
+    '\tamount = Amount if shape equals circle',
+    '\tpadding = uint8',
+    'struct Pair',
+    '\tpadding = uint8',
+    '\tmosaicsCount = uint8',
+    '\tmosaics = array(Mosaic, mosaicsCount, sort_key=amount)'
+]
+
+
+class CompactDescriptorTest(unittest.TestCase):
+    def test_compact_descriptors_are_equivalent_to_dict_descriptors(self):
+        # Arrange:
+        type_descriptors = parse_all(SCHEMA_LINES)
+
+        # Act:
+        compact_descriptors = compact_type_descriptors(type_descriptors)
+
+        # Assert:
+        self.assertEqual(list(type_descriptors.keys()), list(compact_descriptors.keys()))
+        for type_name, type_descriptor in type_descriptors.items():
+            self.assertEqual(type_descriptor, compact_descriptors[type_name].to_dict())
+
+    def test_compact_descriptors_support_dict_read_interface(self):
+        # Act:
+        mosaic = compact_type_descriptors(parse_all(SCHEMA_LINES))['Mosaic']
+        amount = mosaic['layout'][2]
+
+        # Assert:
+        self.assertEqual('struct', mosaic['type'])
+        self.assertEqual(4, len(mosaic['layout']))
+        self.assertEqual(['name', 'type', 'condition', 'condition_value', 'comments'], list(amount))
+        self.assertEqual(5, len(amount))
+        self.assertTrue('condition' in amount)
+        self.assertFalse('size' in amount)
+        self.assertEqual(0, amount.get('size', 0))
+        self.assertEqual('circle', amount['condition_value'])
+        self.assertEqual({'name': 'amount', 'type': 'Amount', 'condition': 'shape', 'condition_value': 'circle', 'comments': ''}, amount)
+
+    def test_compact_descriptors_raise_key_error_for_missing_keys(self):
+        # Arrange:
+        amount = compact_type_descriptors(parse_all(SCHEMA_LINES))['Mosaic']['layout'][2]
+
+        # Act + Assert:
+        for key in ['size', 'foo']:
+            with self.assertRaises(KeyError):
+                amount[key]  # pylint: disable=pointless-statement
+
+    def test_compact_descriptors_are_immutable(self):
+        # Arrange:
+        mosaic = compact_type_descriptors(parse_all(SCHEMA_LINES))['Mosaic']
+
+        # Act + Assert:
+        with self.assertRaises(TypeError):
+            mosaic['type'] = 'enum'  # pylint: disable=unsupported-assignment-operation
+
+        with self.assertRaises(AttributeError):
+            mosaic.foo = 'enum'  # pylint: disable=attribute-defined-outside-init
+
+        with self.assertRaises(AttributeError):
+            mosaic._type = 'enum'  # pylint: disable=protected-access
+
+    def test_cannot_create_compact_descriptor_with_unsupported_key(self):
+        # Act + Assert:
+        with self.assertRaises(KeyError):
+            StructDescriptor({'type': 'struct', 'layout': (), 'comments': '', 'size': 1})
+
+    def test_compact_descriptors_can_be_pickled(self):
+        # Arrange:
+        compact_descriptors = compact_type_descriptors(parse_all(SCHEMA_LINES))
+
+        # Act:
+        unpickled_descriptors = pickle.loads(pickle.dumps(compact_descriptors))
+
+        # Assert:
+        self.assertEqual(compact_descriptors, unpickled_descriptors)
+        self.assertEqual(MemberDescriptor, type(unpickled_descriptors['Mosaic']['layout'][0]))
+
+    def test_equal_leaf_descriptors_are_shared(self):
+        # Act:
+        compact_descriptors = compact_type_descriptors(parse_all(SCHEMA_LINES))
+
+        # Assert:
+        self.assertIs(compact_descriptors['Amount'], compact_descriptors['Height'])
+        self.assertIs(compact_descriptors['Mosaic']['layout'][3], compact_descriptors['Pair']['layout'][0])
+        self.assertIsNot(compact_descriptors['Pair']['layout'][0], compact_descriptors['Pair']['layout'][1])
+
+    def test_equal_leaf_descriptors_are_shared_across_schemas_with_same_interner(self):
+        # Arrange:
+        interner = DescriptorInterner()
+
+        # Act:
+        compact_descriptors1 = compact_type_descriptors(parse_all(SCHEMA_LINES), interner)
+        compact_descriptors2 = compact_type_descriptors(parse_all(SCHEMA_LINES), interner)
+
+        # Assert:
+        self.assertIs(compact_descriptors1['Amount'], compact_descriptors2['Amount'])
+        self.assertIs(compact_descriptors1['Mosaic']['layout'][1], compact_descriptors2['Mosaic']['layout'][1])
+        self.assertIs(compact_descriptors1['Shape']['comments'], compact_descriptors2['Shape']['comments'])
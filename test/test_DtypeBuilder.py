@@ -0,0 +1,133 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.SchemaTestUtils import CODEC_TYPE_LINES
+from test.test_CatsParser import parse_all
+from catcodec.DecodeException import DecodeException
+from catcodec.DtypeBuilder import DtypeBuilder, np
+from catcodec.SchemaDecoder import SchemaDecoder
+from catparser.CatsParseException import CatsParseException
+
+SCHEMA_LINES = CODEC_TYPE_LINES + [
+    'struct Mosaic',
+    '\tmosaicId = uint64',
+    '\tamount = Amount',
+    'struct Modification',
+    '\tconst uint8 version = 1',
+    '\tshape = Shape',
+    '\tkey = Key',
+    '\tdelta = int16',
+    '\tradius = uint16 if shape equals circle',
+    '\tside = uint32 if shape equals square',
+    '\ttag = array(byte, 3)',
+    '\tamounts = array(Amount, 2)',
+    '\tmosaic = Mosaic',
+    'struct Note',
+    '\tnoteSize = uint8',
+    '\tnote = array(byte, noteSize)'
+]
+
+
+def create_builder(bytes_kind='V'):
+    return DtypeBuilder(parse_all(SCHEMA_LINES), bytes_kind=bytes_kind)
+
+
+def serialize_modification(key, radius):
+    return struct.pack('<B6shHxx3sQQQQ', 1, key, -3, radius, b'TAG', 7, 8, 9, 10)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class DtypeBuilderTest(unittest.TestCase):
+    def test_can_build_dtype_of_struct_with_scalar_fields(self):
+        # Act:
+        dtype = create_builder().get_dtype('Mosaic')
+
+        # Assert:
+        self.assertEqual(16, dtype.itemsize)
+        self.assertEqual((np.dtype('<u8'), 0), dtype.fields['mosaicId'])
+        self.assertEqual((np.dtype('<u8'), 8), dtype.fields['amount'])
+
+    def test_can_build_packed_dtype_of_struct_with_all_fixed_member_kinds(self):
+        # Act:
+        dtype = create_builder().get_dtype('Modification')
+
+        # Assert: constants are not serialized and union alternatives overlap
+        self.assertEqual(48, dtype.itemsize)
+        self.assertEqual(['shape', 'key', 'delta', 'radius', 'side', 'tag', 'amounts', 'mosaic'], list(dtype.names))
+        self.assertEqual((np.dtype('<u1'), 0), dtype.fields['shape'])
+        self.assertEqual((np.dtype('V6'), 1), dtype.fields['key'])
+        self.assertEqual((np.dtype('<i2'), 7), dtype.fields['delta'])
+        self.assertEqual((np.dtype('<u2'), 9), dtype.fields['radius'])
+        self.assertEqual((np.dtype('<u4'), 9), dtype.fields['side'])
+        self.assertEqual((np.dtype('V3'), 13), dtype.fields['tag'])
+        self.assertEqual((np.dtype(('<u8', (2,))), 16), dtype.fields['amounts'])
+        self.assertEqual(32, dtype.fields['mosaic'][1])
+        self.assertEqual(create_builder().get_dtype('Mosaic'), dtype.fields['mosaic'][0])
+
+    def test_can_build_dtype_with_byte_strings(self):
+        # Act:
+        dtype = create_builder('S').get_dtype('Modification')
+
+        # Assert:
+        self.assertEqual(np.dtype('S6'), dtype.fields['key'][0])
+        self.assertEqual(np.dtype('S3'), dtype.fields['tag'][0])
+
+    def test_cannot_build_dtype_of_variable_size_struct(self):
+        with self.assertRaises(CatsParseException):
+            create_builder().get_dtype('Note')
+
+    def test_cannot_create_builder_with_unknown_bytes_kind(self):
+        with self.assertRaises(ValueError):
+            create_builder('U')
+
+    def test_dtypes_are_built_once(self):
+        # Arrange:
+        builder = create_builder()
+
+        # Act:
+        dtype1 = builder.get_dtype('Modification')
+        dtype2 = builder.get_dtype('Modification')
+
+        # Assert:
+        self.assertIs(dtype1, dtype2)
+        self.assertEqual(['Mosaic', 'Modification'], list(builder.dtypes.keys()))
+
+    def test_can_decode_array_with_single_call(self):
+        # Arrange:
+        buffer = b'\xFF' + struct.pack('<QQQQQQ', 1, 100, 2, 200, 3, 300)
+
+        # Act:
+        mosaics = create_builder().decode_array('Mosaic', buffer, 3, 1)
+
+        # Assert:
+        self.assertEqual([1, 2, 3], mosaics['mosaicId'].tolist())
+        self.assertEqual([100, 200, 300], mosaics['amount'].tolist())
+
+    def test_decoded_array_matches_schema_decoder(self):
+        # Arrange:
+        buffers = [serialize_modification(b'KEY001', 0xABCD), serialize_modification(b'KEY002', 0x1234)]
+
+        # Act:
+        modifications = create_builder('S').decode_array('Modification', b''.join(buffers), 2)
+
+        # Assert:
+        decoder = SchemaDecoder(parse_all(SCHEMA_LINES))
+        for modification, buffer in zip(modifications, buffers):
+            values = decoder.decode('Modification', buffer)
+            self.assertEqual(values['key'], modification['key'])
+            self.assertEqual(values['delta'], modification['delta'])
+            self.assertEqual(values['radius'], modification['radius'])
+            self.assertEqual(values['tag'], modification['tag'])
+            self.assertEqual(values['amounts'], modification['amounts'].tolist())
+            self.assertEqual(values['mosaic']['amount'], modification['mosaic']['amount'])
+
+    def test_cannot_decode_array_beyond_buffer(self):
+        with self.assertRaises(DecodeException):
+            create_builder().decode_array('Mosaic', bytes(47), 3)
+
+
+@unittest.skipIf(np is not None, 'numpy is installed')
+class DtypeBuilderWithoutNumpyTest(unittest.TestCase):
+    def test_cannot_create_builder(self):
+        with self.assertRaises(ImportError):
+            create_builder()
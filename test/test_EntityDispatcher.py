@@ -0,0 +1,81 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.test_CatsParser import parse_all
+from test.test_EntityRegistry import SCHEMA_LINES
+from catcodec.DecodeException import DecodeException
+from catcodec.EntityDispatcher import EntityDispatcher
+from catcodec.SchemaDecoder import SchemaDecoder
+
+
+def serialize_entity(version, entity_type):
+    return struct.pack('<IHH', 8, version, entity_type)
+
+
+class EntityDispatcherTest(unittest.TestCase):
+    def test_can_route_entity_by_type_and_version(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES))
+
+        # Act + Assert: high byte of version field (network) is ignored
+        self.assertEqual('TransferTransaction', dispatcher.get_type_name(serialize_entity(0x9003, 0x4154)))
+        self.assertEqual('TransferTransactionV4', dispatcher.get_type_name(serialize_entity(0x9004, 0x4154)))
+        self.assertEqual('BlockHeader', dispatcher.get_type_name(serialize_entity(0x0001, 0x8143)))
+
+    def test_can_route_embedded_entity_by_type_and_version(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES))
+
+        # Act:
+        type_name = dispatcher.get_type_name(serialize_entity(0x9003, 0x4154), is_embedded=True)
+
+        # Assert:
+        self.assertEqual('EmbeddedTransferTransaction', type_name)
+
+    def test_can_route_entity_at_offset(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES))
+
+        # Act:
+        entity_types = dispatcher.get_entity_types(b'\xFF' * 3 + serialize_entity(0x9004, 0x4154), 3)
+
+        # Assert:
+        self.assertEqual((0x4154, 4), (entity_types.entity_type, entity_types.version))
+
+    def test_routed_entities_can_be_decoded(self):
+        # Arrange:
+        type_descriptors = parse_all(SCHEMA_LINES)
+        dispatcher = EntityDispatcher(type_descriptors)
+        decoder = SchemaDecoder(type_descriptors)
+        buffer = serialize_entity(0x9003, 0x4154)
+
+        # Act:
+        values = decoder.decode(dispatcher.get_type_name(buffer), buffer)
+
+        # Assert:
+        self.assertEqual({'size': 8, 'version': 0x9003, 'type': 0x4154}, values)
+
+    def test_cannot_route_unregistered_entity(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES))
+
+        # Act + Assert:
+        for buffer, is_embedded in [(serialize_entity(5, 0x4154), False), (serialize_entity(4, 0x4154), True)]:
+            with self.assertRaisesRegex(DecodeException, 'entity is registered for entity type 0x4154'):
+                dispatcher.get_type_name(buffer, is_embedded=is_embedded)
+
+    def test_cannot_route_truncated_entity(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES))
+
+        # Act + Assert:
+        with self.assertRaisesRegex(DecodeException, 'unable to read entity header'):
+            dispatcher.get_type_name(serialize_entity(3, 0x4154)[:-1])
+
+    def test_cannot_route_embedded_entity_without_embedded_header(self):
+        # Arrange:
+        dispatcher = EntityDispatcher(parse_all(SCHEMA_LINES[:6] + SCHEMA_LINES[8:12]))
+
+        # Act + Assert:
+        with self.assertRaisesRegex(DecodeException, 'does not define embedded transaction header'):
+            dispatcher.get_type_name(serialize_entity(3, 0x4154), is_embedded=True)
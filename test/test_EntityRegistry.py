@@ -0,0 +1,85 @@
+# pylint: disable=invalid-name
+import unittest
+from test.test_CatsParser import parse_all
+from catparser.CatsParseException import CatsParseException
+from catparser.EntityRegistry import EntityRegistry
+
+SCHEMA_LINES = [
+    'enum EntityType : uint16',
+    '\treserved = 0',
+    'struct Transaction',
+    '\tsize = uint32',
+    '\tversion = uint16',
+    '\ttype = EntityType',
+    'struct EmbeddedTransaction',
+    '\tinline Transaction',
+    'struct TransferTransaction',
+    '\tconst uint8 version = 3',
+    '\tconst EntityType entityType = 0x4154',
+    '\tinline Transaction',
+    'struct EmbeddedTransferTransaction',
+    '\tinline EmbeddedTransaction',
+    'struct TransferTransactionV4',
+    '\tconst uint8 version = 4',
+    '\tconst EntityType entityType = 0x4154',
+    '\tinline Transaction',
+    'struct BlockHeader',
+    '\tconst uint8 version = 1',
+    '\tconst EntityType entityType = 0x8143',
+    '\tinline Transaction'
+]
+
+
+def describe_entities(registry):
+    return sorted((entity.entity_type, entity.version, entity.name, entity.embedded_name) for entity in registry)
+
+
+class EntityRegistryTest(unittest.TestCase):
+    def test_can_register_entities_declaring_type_and_version_constants(self):
+        # Act:
+        registry = EntityRegistry(parse_all(SCHEMA_LINES))
+
+        # Assert: embedded structs and structs without constants are not registered
+        self.assertEqual(3, len(registry))
+        self.assertEqual([
+            (0x4154, 3, 'TransferTransaction', 'EmbeddedTransferTransaction'),
+            (0x4154, 4, 'TransferTransactionV4', None),
+            (0x8143, 1, 'BlockHeader', None)
+        ], describe_entities(registry))
+        self.assertEqual(1, registry.version_size)
+
+    def test_can_find_entity_by_type_and_version(self):
+        # Arrange:
+        registry = EntityRegistry(parse_all(SCHEMA_LINES))
+
+        # Act + Assert:
+        self.assertEqual('TransferTransaction', registry.find(0x4154, 3).name)
+        self.assertEqual('TransferTransactionV4', registry.find(0x4154, 4).name)
+        self.assertEqual(None, registry.find(0x4154, 5))
+        self.assertEqual(None, registry.find(0x4155, 3))
+
+    def test_cannot_register_entities_with_same_type_and_version(self):
+        # Arrange:
+        lines = SCHEMA_LINES + [
+            'struct OtherTransaction',
+            '\tconst uint8 version = 3',
+            '\tconst EntityType entityType = 0x4154',
+            '\tinline Transaction'
+        ]
+
+        # Act + Assert:
+        expected_message = '"TransferTransaction" and "OtherTransaction" both have entity type 0x4154 and version 3'
+        with self.assertRaisesRegex(CatsParseException, expected_message):
+            EntityRegistry(parse_all(lines))
+
+    def test_cannot_register_entity_without_version(self):
+        # Arrange:
+        lines = SCHEMA_LINES + [
+            'struct OtherTransaction',
+            '\tconst EntityType entityType = 0x4155',
+            '\tinline Transaction'
+        ]
+
+        # Act + Assert:
+        with self.assertRaisesRegex(CatsParseException, '"OtherTransaction" must declare a version constant'):
+            EntityRegistry(parse_all(lines))
@@ -0,0 +1,98 @@
+# pylint: disable=invalid-name
+import io
+import os
+import struct
+import tempfile
+import unittest
+from catcodec.FrameException import FrameException
+from catcodec.FrameReader import FrameReader
+
+
+def create_frame(payload_size, fill=None):
+    return struct.pack('<I', 4 + payload_size) + bytes([payload_size % 256 if fill is None else fill]) * payload_size
+
+
+FRAMES = [create_frame(payload_size) for payload_size in [0, 3, 10, 100, 5]]
+
+
+def read_frames(data, **kwargs):
+    reader = FrameReader(io.BytesIO(data), **kwargs)
+    frames = []
+    offsets = []
+    for frame in reader:
+        frames.append(bytes(frame))
+        offsets.append(reader.frame_offset)
+
+    return (frames, offsets)
+
+
+class FrameReaderTest(unittest.TestCase):
+    def test_can_read_frames_with_any_chunk_size(self):
+        for chunk_size in [1, 4, 7, 16, 1000]:
+            # Act:
+            frames, offsets = read_frames(b''.join(FRAMES), chunk_size=chunk_size)
+
+            # Assert:
+            self.assertEqual(FRAMES, frames, chunk_size)
+            self.assertEqual([0, 4, 11, 25, 129], offsets, chunk_size)
+
+    def test_can_read_empty_stream(self):
+        self.assertEqual(([], []), read_frames(b''))
+
+    def test_frames_are_views_into_reusable_buffer(self):
+        # Arrange:
+        reader = FrameReader(io.BytesIO(b''.join(FRAMES)), chunk_size=1000)
+
+        # Act:
+        frames = list(reader)
+
+        # Assert:
+        self.assertEqual([memoryview] * len(FRAMES), [type(frame) for frame in frames])
+        self.assertTrue(all(frame.obj is frames[0].obj for frame in frames))
+
+    def test_can_read_frame_larger_than_chunk_size(self):
+        # Arrange:
+        data = create_frame(10) + create_frame(5000, 0xAB) + create_frame(20)
+
+        # Act:
+        frames, offsets = read_frames(data, chunk_size=64)
+
+        # Assert:
+        self.assertEqual([create_frame(10), create_frame(5000, 0xAB), create_frame(20)], frames)
+        self.assertEqual([0, 14, 5018], offsets)
+
+    def test_can_read_frames_from_file(self):
+        # Arrange:
+        with tempfile.TemporaryDirectory() as temp_directory:
+            filename = os.path.join(temp_directory, 'frames.bin')
+            with open(filename, 'wb') as output_file:
+                output_file.write(b''.join(FRAMES * 100))
+
+            # Act:
+            with open(filename, 'rb') as input_file:
+                frames = [bytes(frame) for frame in FrameReader(input_file, chunk_size=256)]
+
+        # Assert:
+        self.assertEqual(FRAMES * 100, frames)
+
+    def _assert_frame_exception(self, data, expected_offset, expected_message, **kwargs):
+        # Act:
+        with self.assertRaises(FrameException) as context:
+            read_frames(data, **kwargs)
+
+        # Assert:
+        self.assertEqual(expected_offset, context.exception.offset)
+        self.assertIn(expected_message, str(context.exception))
+
+    def test_cannot_read_truncated_frame(self):
+        self._assert_frame_exception(b''.join(FRAMES)[:-2], 129, 'frame is truncated (7 of 9 bytes available)', chunk_size=8)
+
+    def test_cannot_read_truncated_size_prefix(self):
+        self._assert_frame_exception(b''.join(FRAMES) + b'\x05\x00', 138, 'frame is truncated (2 of 4 bytes available)')
+
+    def test_cannot_read_frame_smaller_than_size_prefix(self):
+        self._assert_frame_exception(FRAMES[1] + struct.pack('<I', 3), 7, 'frame size 3 is smaller than its size prefix')
+
+    def test_cannot_read_frame_larger_than_max_frame_size(self):
+        self._assert_frame_exception(
+            FRAMES[1] + FRAMES[2] + FRAMES[3], 21, 'frame size 104 exceeds max frame size 100', max_frame_size=100)
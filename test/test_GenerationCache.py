@@ -0,0 +1,133 @@
+# pylint: disable=invalid-name
+import tempfile
+import unittest
+from test.test_BuilderGenerator import TRANSACTION_NAMES, create_schema_lines
+from test.test_CatsParser import parse_all
+from generators.Descriptor import Descriptor
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.cpp_builder.GenerationCache import GenerationCache
+from generators.cpp_builder.HintCache import Hints
+
+FOO_HINTS = {'plugin': 'foo', 'setters': {'recipient': 'generate(m_recipient)'}}
+DESCRIPTORS = [Descriptor('FooBuilder.h', ['alpha']), Descriptor('FooBuilder.cpp', ['beta'])]
+
+
+def calculate_key(schema_lines, transaction_hints=None, copyright_text=''):
+    return GenerationCache.calculate_key(parse_all(schema_lines), 'FooTransaction', transaction_hints or FOO_HINTS, copyright_text)
+
+
+def create_hints(plugin_suffix=''):
+    return Hints({transaction_name: {'plugin': transaction_name.lower() + plugin_suffix} for transaction_name in TRANSACTION_NAMES})
+
+
+def generate(generation_cache, schema_lines, hints):
+    return list(BuilderGenerator(parse_all(schema_lines), {'copyright': '', 'hints': hints, 'generation_cache': generation_cache}))
+
+
+class GenerationCacheKeyTest(unittest.TestCase):
+    def test_key_is_deterministic(self):
+        # Act:
+        key1 = calculate_key(create_schema_lines(['FooTransaction']))
+        key2 = calculate_key(create_schema_lines(['FooTransaction']))
+
+        # Assert:
+        self.assertEqual(key1, key2)
+
+    def test_key_changes_when_type_in_closure_changes(self):
+        # Arrange:
+        schema_lines = create_schema_lines(['FooTransaction'])
+
+        # Act:
+        key1 = calculate_key(schema_lines)
+        key2 = calculate_key(['using Key = binary_fixed(33)'] + schema_lines[1:])
+
+        # Assert:
+        self.assertNotEqual(key1, key2)
+
+    def test_key_does_not_change_when_type_outside_closure_changes(self):
+        # Act:
+        key1 = calculate_key(create_schema_lines(['FooTransaction']))
+        key2 = calculate_key(create_schema_lines(['FooTransaction', 'BarTransaction']))
+
+        # Assert:
+        self.assertEqual(key1, key2)
+
+    def test_key_changes_when_hints_change(self):
+        # Arrange:
+        schema_lines = create_schema_lines(['FooTransaction'])
+
+        # Act:
+        key1 = calculate_key(schema_lines)
+        key2 = calculate_key(schema_lines, {'plugin': 'foo', 'setters': {'recipient': 'generate(m_sender)'}})
+
+        # Assert:
+        self.assertNotEqual(key1, key2)
+
+    def test_key_changes_when_copyright_changes(self):
+        # Arrange:
+        schema_lines = create_schema_lines(['FooTransaction'])
+
+        # Act:
+        key1 = calculate_key(schema_lines)
+        key2 = calculate_key(schema_lines, copyright_text='// copyright')
+
+        # Assert:
+        self.assertNotEqual(key1, key2)
+
+
+class GenerationCacheTest(unittest.TestCase):
+    def test_can_get_put_descriptors(self):
+        # Arrange:
+        cache = GenerationCache()
+
+        # Act:
+        cache.put('abc', DESCRIPTORS)
+        descriptors = cache.get('abc')
+        missing_descriptors = cache.get('def')
+
+        # Assert:
+        self.assertEqual(DESCRIPTORS, descriptors)
+        self.assertEqual(None, missing_descriptors)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_descriptors_are_persisted_across_caches(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            GenerationCache(temp_directory).put('abc', DESCRIPTORS)
+            cache = GenerationCache(temp_directory)
+
+            # Act:
+            descriptors = cache.get('abc')
+
+        # Assert:
+        self.assertEqual(DESCRIPTORS, descriptors)
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+
+    def test_builder_generator_skips_generation_of_cached_transactions(self):
+        # Arrange:
+        cache = GenerationCache()
+        schema_lines = create_schema_lines(TRANSACTION_NAMES)
+        expected_descriptors = generate(cache, schema_lines, create_hints())
+
+        # Act:
+        descriptors = generate(cache, schema_lines, create_hints())
+
+        # Assert:
+        self.assertEqual(expected_descriptors, descriptors)
+        self.assertEqual(generate(None, schema_lines, create_hints()), descriptors)
+        self.assertEqual((5, 5), (cache.hits, cache.misses))
+
+    def test_builder_generator_only_generates_transactions_with_changed_inputs(self):
+        # Arrange:
+        cache = GenerationCache()
+        schema_lines = create_schema_lines(TRANSACTION_NAMES)
+        generate(cache, schema_lines, create_hints())
+        changed_hints = Hints({**create_hints().transaction_hints, 'BazTransaction': {'plugin': 'baz_changed'}})
+
+        # Act:
+        descriptors = generate(cache, schema_lines, changed_hints)
+
+        # Assert:
+        self.assertEqual(generate(None, schema_lines, changed_hints), descriptors)
+        self.assertIn('plugins/txes/baz_changed/', '\n'.join(descriptors[4].code))
+        self.assertEqual((4, 6), (cache.hits, cache.misses))
@@ -0,0 +1,128 @@
+# pylint: disable=invalid-name
+import os
+import pickle
+import tempfile
+import unittest
+from test.test_CatsParser import parse_all
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.cpp_builder.HintCache import HINT_CACHE, HintCache, Hints
+
+HINT_FILES = {
+    'includes': 'FooTransaction:\n  - foo/Foo.h\n  - foo/Bar.h\n',
+    'plugin': '# plugin names\nFooTransaction: foo\nBarTransaction: bar\n',
+    'setters': 'FooTransaction:\n  fooId: generate(m_foo)\n'
+}
+
+SCHEMA_LINES = [
+    'struct FooTransactionBody',
+    '\tfooId = uint32',
+    '\tbarSize = uint8',
+    '\tbar = array(byte, barSize)',
+    'struct FooTransaction',
+    '\tinline FooTransactionBody'
+]
+
+
+def write_hint_files(directory, hint_files):
+    for name, contents in hint_files.items():
+        with open(os.path.join(directory, '{0}.yaml'.format(name)), 'w') as output_file:
+            output_file.write(contents)
+
+
+def bump_file_time(filename):
+    file_time = os.stat(filename).st_mtime_ns + 1000000000
+    os.utime(filename, ns=(file_time, file_time))
+
+
+class HintCacheTest(unittest.TestCase):
+    def test_can_load_hints_indexed_by_transaction(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            write_hint_files(temp_directory, HINT_FILES)
+
+            # Act:
+            hints = HintCache(temp_directory, tuple(HINT_FILES.keys())).get()
+
+        # Assert:
+        self.assertEqual(
+            {'includes': ('foo/Foo.h', 'foo/Bar.h'), 'plugin': 'foo', 'setters': {'fooId': 'generate(m_foo)'}},
+            dict(hints.get('FooTransaction')))
+        self.assertEqual({'plugin': 'bar'}, dict(hints.get('BarTransaction')))
+        self.assertEqual({}, dict(hints.get('BazTransaction')))
+
+    def test_hints_are_immutable(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            write_hint_files(temp_directory, HINT_FILES)
+            hints = HintCache(temp_directory, tuple(HINT_FILES.keys())).get()
+
+        # Act + Assert:
+        for mapping in [hints.transaction_hints, hints.get('FooTransaction'), hints.get('FooTransaction')['setters']]:
+            with self.assertRaises(TypeError):
+                mapping['foo'] = 'bar'
+
+    def test_hints_can_be_pickled(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            write_hint_files(temp_directory, HINT_FILES)
+            hints = HintCache(temp_directory, tuple(HINT_FILES.keys())).get()
+
+        # Act:
+        unpickled_hints = pickle.loads(pickle.dumps(hints))
+
+        # Assert:
+        self.assertEqual(dict(hints.get('FooTransaction')), dict(unpickled_hints.get('FooTransaction')))
+        self.assertEqual({'fooId': 'generate(m_foo)'}, dict(unpickled_hints.get('FooTransaction')['setters']))
+        with self.assertRaises(TypeError):
+            unpickled_hints.get('FooTransaction')['setters']['foo'] = 'bar'
+
+    def test_hints_are_loaded_once_when_files_are_unchanged(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            write_hint_files(temp_directory, HINT_FILES)
+            cache = HintCache(temp_directory, tuple(HINT_FILES.keys()))
+
+            # Act:
+            all_hints = [cache.get() for _ in range(3)]
+
+        # Assert:
+        self.assertEqual(1, cache.loads)
+        self.assertTrue(all(hints is all_hints[0] for hints in all_hints))
+
+    def test_hints_are_reloaded_when_any_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            write_hint_files(temp_directory, HINT_FILES)
+            cache = HintCache(temp_directory, tuple(HINT_FILES.keys()))
+            cache.get()
+
+            # Act:
+            write_hint_files(temp_directory, {'plugin': 'FooTransaction: foo2\n'})
+            bump_file_time(os.path.join(temp_directory, 'plugin.yaml'))
+            hints = cache.get()
+
+        # Assert:
+        self.assertEqual(2, cache.loads)
+        self.assertEqual('foo2', hints.get('FooTransaction')['plugin'])
+        self.assertEqual(None, hints.get('BarTransaction').get('plugin'))
+
+    def test_can_load_builder_hints(self):
+        # Act:
+        hints = HINT_CACHE.get()
+
+        # Assert:
+        self.assertEqual('transfer', hints.get('TransferTransaction')['plugin'])
+        self.assertEqual('model', hints.get('MosaicDefinitionTransaction')['namespaces']['MosaicFlags'])
+
+    def test_builder_generator_uses_hints_passed_through_options(self):
+        # Arrange:
+        hints = Hints({'FooTransaction': {'plugin': 'foo_plugin', 'setters': {'fooId': 'generate(m_foo)'}}})
+
+        # Act:
+        descriptors = list(BuilderGenerator(parse_all(SCHEMA_LINES), {'copyright': '', 'hints': hints}))
+
+        # Assert:
+        self.assertEqual(['FooBuilder.h', 'FooBuilder.cpp'], [descriptor.filename for descriptor in descriptors])
+        self.assertIn('#include "plugins/txes/foo_plugin/src/model/FooTransaction.h"', descriptors[0].code)
+        self.assertNotIn('setFooId', '\n'.join(descriptors[0].code))
+        self.assertIn('generate(m_foo)', '\n'.join(descriptors[1].code))
@@ -0,0 +1,208 @@
+# pylint: disable=invalid-name
+import io
+import os
+import unittest
+from test.SchemaTestUtils import SCHEMA_FILES, UNDER_IMPORTING_SCHEMA_FILES, temporary_schema_files, write_schema_files
+from catparser.CatsParseException import CatsParseException
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParseCache import ParseCache
+from catparser.SchemaResolver import MappingResolver
+from catparser.SchemaSource import SchemaSource
+
+
+def parse_file(directory, filename, cache=None):
+    parser = MultiFileParser(cache)
+    parser.set_include_path(directory)
+    parser.parse(os.path.join(directory, filename))
+    return parser.cats_parser.type_descriptors()
+
+
+class MultiFileParserTest(unittest.TestCase):
+    def test_can_parse_file_with_imports(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Act:
+            type_descriptors = parse_file(directory, 'transfer.cats')
+
+            # Assert:
+            self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'TransferTransaction', 'Fee'], list(type_descriptors.keys()))
+            self.assertEqual(3, len(type_descriptors['TransferTransaction']['layout']))
+
+    def test_cannot_parse_file_with_duplicate_definition_across_files(self):
+        with temporary_schema_files({**SCHEMA_FILES, 'fee.cats': ['import "transfer.cats"', 'using Amount = uint32']}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'fee.cats')
+
+    def test_can_parse_file_importing_same_file_multiple_times(self):
+        schema_files = {**SCHEMA_FILES, 'all.cats': ['import "types.cats"', 'import "transfer.cats"', 'import "types.cats"']}
+        with temporary_schema_files(schema_files) as directory:
+            for cache in [None, ParseCache()]:
+                # Act:
+                type_descriptors = parse_file(directory, 'all.cats', cache)
+
+                # Assert: each file is only imported once
+                self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'TransferTransaction', 'Fee'], list(type_descriptors.keys()))
+
+    def test_cannot_parse_circular_imports(self):
+        with temporary_schema_files({'alpha.cats': ['import "beta.cats"'], 'beta.cats': ['import "alpha.cats"']}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'alpha.cats')
+
+    # region sources
+
+    def test_can_parse_virtual_schema_files(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            resolver = MappingResolver({filename: '\n'.join(lines) for filename, lines in SCHEMA_FILES.items()})
+            parser = MultiFileParser(resolver=resolver)
+
+            # Act:
+            parser.parse(resolver.resolve('transfer.cats'))
+            type_descriptors = parser.cats_parser.type_descriptors()
+
+            # Assert:
+            self.assertEqual(parse_file(directory, 'transfer.cats'), type_descriptors)
+
+    def test_can_parse_root_schema_from_binary_stream(self):
+        for cache in [None, ParseCache()]:
+            # Arrange:
+            resolver = MappingResolver({filename: '\n'.join(lines) for filename, lines in SCHEMA_FILES.items()})
+            parser = MultiFileParser(cache, resolver)
+            stream = io.BytesIO('\n'.join(['import "entity.cats"', 'using Fee = uint32']).encode('utf8'))
+
+            # Act:
+            parser.parse(SchemaSource.from_stream('<stream>', stream))
+            type_descriptors = parser.cats_parser.type_descriptors()
+
+            # Assert:
+            self.assertEqual(['Amount', 'Mosaic', 'EntityType', 'Fee'], list(type_descriptors.keys()))
+
+    def test_cannot_parse_schema_with_unresolvable_import(self):
+        # Arrange:
+        parser = MultiFileParser(resolver=MappingResolver({'entity.cats': '\n'.join(SCHEMA_FILES['entity.cats'])}))
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            parser.parse(SchemaSource.from_string('<string>', 'import "entity.cats"'))
+
+    # endregion
+
+    # region cache
+
+    def test_cold_cache_parse_is_equivalent_to_uncached_parse(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            type_descriptors = parse_file(directory, 'transfer.cats', cache)
+
+            # Assert:
+            self.assertEqual(parse_file(directory, 'transfer.cats'), type_descriptors)
+            self.assertEqual((0, 3), (cache.hits, cache.misses))
+
+    def test_warm_cache_parse_is_equivalent_to_uncached_parse(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            parse_file(directory, 'transfer.cats', ParseCache(os.path.join(directory, 'cache')))
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            type_descriptors = parse_file(directory, 'transfer.cats', cache)
+
+            # Assert:
+            self.assertEqual(parse_file(directory, 'transfer.cats'), type_descriptors)
+            self.assertEqual(list(parse_file(directory, 'transfer.cats').keys()), list(type_descriptors.keys()))
+            self.assertEqual((3, 0), (cache.hits, cache.misses))
+
+    def test_cached_imports_are_shared_across_root_files(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            parse_file(directory, 'transfer.cats', ParseCache(os.path.join(directory, 'cache')))
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            type_descriptors = parse_file(directory, 'entity.cats', cache)
+
+            # Assert:
+            self.assertEqual(parse_file(directory, 'entity.cats'), type_descriptors)
+            self.assertEqual((2, 0), (cache.hits, cache.misses))
+
+    def test_change_to_import_invalidates_all_importing_files(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            parse_file(directory, 'transfer.cats', ParseCache(os.path.join(directory, 'cache')))
+            write_schema_files(directory, {'types.cats': SCHEMA_FILES['types.cats'] + ['using Height = uint64']})
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            type_descriptors = parse_file(directory, 'transfer.cats', cache)
+
+            # Assert:
+            self.assertEqual(['Amount', 'Mosaic', 'Height', 'EntityType', 'TransferTransaction', 'Fee'], list(type_descriptors.keys()))
+            self.assertEqual((0, 3), (cache.hits, cache.misses))
+
+    def test_change_to_import_is_validated_by_importing_files(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange: remove a type used by transfer.cats
+            parse_file(directory, 'transfer.cats', ParseCache(os.path.join(directory, 'cache')))
+            write_schema_files(directory, {'types.cats': ['using Amount = uint64']})
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'transfer.cats', ParseCache(os.path.join(directory, 'cache')))
+
+    def test_cached_file_is_validated_against_types_visible_to_importing_root(self):
+        with temporary_schema_files({**SCHEMA_FILES, **UNDER_IMPORTING_SCHEMA_FILES}) as directory:
+            # Arrange:
+            parse_file(directory, 'full.cats', ParseCache(os.path.join(directory, 'cache')))
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'partial.cats', ParseCache(os.path.join(directory, 'cache')))
+
+    def test_memory_cache_shares_imports_across_root_files(self):
+        with temporary_schema_files({**SCHEMA_FILES, 'fee.cats': ['import "entity.cats"', 'using Fee = uint16']}) as directory:
+            # Arrange:
+            cache = ParseCache()
+
+            # Act:
+            type_descriptors1 = parse_file(directory, 'transfer.cats', cache)
+            type_descriptors2 = parse_file(directory, 'fee.cats', cache)
+
+            # Assert: each root has its own definitions, so both can define Fee
+            self.assertEqual(parse_file(directory, 'transfer.cats'), type_descriptors1)
+            self.assertEqual(parse_file(directory, 'fee.cats'), type_descriptors2)
+            self.assertEqual((2, 4), (cache.hits, cache.misses))
+            self.assertFalse(os.path.exists(os.path.join(directory, 'cache')))
+
+    def test_memory_cache_preserves_duplicate_detection_per_root_file(self):
+        with temporary_schema_files({**SCHEMA_FILES, 'fee.cats': ['import "entity.cats"', 'using Amount = uint16']}) as directory:
+            # Arrange:
+            cache = ParseCache()
+            parse_file(directory, 'transfer.cats', cache)
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'fee.cats', cache)
+
+    def test_memory_cache_preserves_link_validation_per_root_file(self):
+        with temporary_schema_files({**SCHEMA_FILES, **UNDER_IMPORTING_SCHEMA_FILES}) as directory:
+            # Arrange: root importing everything is parsed first, so all files imported by the under-importing root are cached
+            cache = ParseCache()
+            parse_file(directory, 'full.cats', cache)
+
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'partial.cats', cache)
+
+            self.assertEqual(1, cache.hits)
+
+    def test_cannot_parse_circular_imports_with_cache(self):
+        with temporary_schema_files({'alpha.cats': ['import "beta.cats"'], 'beta.cats': ['import "alpha.cats"']}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_file(directory, 'alpha.cats', ParseCache(os.path.join(directory, 'cache')))
+
+    # endregion
@@ -0,0 +1,81 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from generators.Descriptor import Descriptor
+from generators.OutputWriter import OutputWriter
+
+
+def read_file(filename):
+    with open(filename, 'rb') as input_file:
+        return input_file.read()
+
+
+def set_file_time(filename, file_time):
+    os.utime(filename, ns=(file_time, file_time))
+
+
+class OutputWriterTest(unittest.TestCase):
+    def test_can_write_new_file(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            writer = OutputWriter(temp_directory)
+
+            # Act:
+            is_written = writer.write(Descriptor('foo.h', ['alpha', 'beta']))
+
+            # Assert:
+            self.assertTrue(is_written)
+            self.assertEqual(b'alpha\nbeta\n', read_file(os.path.join(temp_directory, 'foo.h')))
+            self.assertEqual((1, 0), (writer.written, writer.unchanged))
+            self.assertEqual(['foo.h'], os.listdir(temp_directory))
+
+    def test_unchanged_file_is_not_rewritten(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            OutputWriter(temp_directory).write(Descriptor('foo.h', ['alpha', 'beta']))
+            filename = os.path.join(temp_directory, 'foo.h')
+            set_file_time(filename, 1000000000)
+            writer = OutputWriter(temp_directory)
+
+            # Act:
+            is_written = writer.write(Descriptor('foo.h', ['alpha', 'beta']))
+
+            # Assert:
+            self.assertFalse(is_written)
+            self.assertEqual(1000000000, os.stat(filename).st_mtime_ns)
+            self.assertEqual((0, 1), (writer.written, writer.unchanged))
+
+    def test_changed_file_is_rewritten(self):
+        for lines in [['alpha', 'gamma'], ['alpha', 'beta', 'gamma'], ['alpha']]:
+            with tempfile.TemporaryDirectory() as temp_directory:
+                # Arrange:
+                OutputWriter(temp_directory).write(Descriptor('foo.h', ['alpha', 'beta']))
+                filename = os.path.join(temp_directory, 'foo.h')
+                set_file_time(filename, 1000000000)
+                writer = OutputWriter(temp_directory)
+
+                # Act:
+                is_written = writer.write(Descriptor('foo.h', lines))
+
+                # Assert:
+                self.assertTrue(is_written)
+                self.assertEqual(''.join(line + '\n' for line in lines).encode('utf8'), read_file(filename))
+                self.assertNotEqual(1000000000, os.stat(filename).st_mtime_ns)
+                self.assertEqual((1, 0), (writer.written, writer.unchanged))
+                self.assertEqual(['foo.h'], os.listdir(temp_directory))
+
+    def test_counts_are_accumulated_across_files(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # Arrange:
+            OutputWriter(temp_directory).write(Descriptor('foo.h', ['alpha']))
+            OutputWriter(temp_directory).write(Descriptor('bar.h', ['beta']))
+            writer = OutputWriter(temp_directory)
+
+            # Act:
+            for descriptor in [Descriptor('foo.h', ['alpha']), Descriptor('bar.h', ['gamma']), Descriptor('baz.h', ['delta'])]:
+                writer.write(descriptor)
+
+            # Assert:
+            self.assertEqual((2, 1), (writer.written, writer.unchanged))
+            self.assertEqual(['bar.h', 'baz.h', 'foo.h'], sorted(os.listdir(temp_directory)))
@@ -0,0 +1,107 @@
+# pylint: disable=invalid-name
+import glob
+import os
+import unittest
+from test.SchemaTestUtils import SCHEMA_FILES, UNDER_IMPORTING_SCHEMA_FILES, temporary_schema_files
+from test.test_MultiFileParser import parse_file
+from catparser.CatsParseException import CatsParseException
+from catparser.ParallelParser import ParallelParser
+from catparser.ParseCache import ParseCache
+from catparser.SchemaResolver import FileSystemResolver
+
+LEAF_SCHEMA_FILES = {
+    'fee.cats': ['import "entity.cats"', 'using Fee = uint16'],
+    'lock.cats': ['import "types.cats"', 'struct Lock', '\tmosaic = Mosaic', 'using Fee = uint64']
+}
+
+
+def parse_files(directory, filenames, cache=None):
+    parser = ParallelParser(FileSystemResolver(directory), cache, 2)
+    return parser.parse([os.path.join(directory, filename) for filename in filenames])
+
+
+class ParallelParserTest(unittest.TestCase):
+    def test_parallel_parse_is_equivalent_to_sequential_parse(self):
+        with temporary_schema_files({**SCHEMA_FILES, **LEAF_SCHEMA_FILES}) as directory:
+            # Arrange:
+            filenames = ['transfer.cats', 'fee.cats', 'lock.cats']
+
+            # Act:
+            all_type_descriptors = parse_files(directory, filenames)
+
+            # Assert:
+            self.assertEqual(3, len(all_type_descriptors))
+            for filename, type_descriptors in zip(filenames, all_type_descriptors):
+                expected_type_descriptors = parse_file(directory, filename)
+                self.assertEqual(expected_type_descriptors, type_descriptors)
+                self.assertEqual(list(expected_type_descriptors.keys()), list(type_descriptors.keys()))
+
+    def test_parallel_parse_of_shipped_schemas_is_equivalent_to_sequential_parse(self):
+        # Arrange:
+        filenames = sorted(os.path.relpath(filename, 'schemas') for filename in glob.glob('schemas/**/*.cats', recursive=True))
+
+        # Act:
+        all_type_descriptors = parse_files('schemas', filenames)
+
+        # Assert:
+        self.assertEqual(len(filenames), len(all_type_descriptors))
+        for filename, type_descriptors in zip(filenames, all_type_descriptors):
+            expected_type_descriptors = parse_file('schemas', filename)
+            self.assertEqual(expected_type_descriptors, type_descriptors, filename)
+            self.assertEqual(list(expected_type_descriptors.keys()), list(type_descriptors.keys()), filename)
+
+    def test_files_using_types_imported_by_their_importers_are_parsed_in_context_of_importing_root(self):
+        with temporary_schema_files({**SCHEMA_FILES, **UNDER_IMPORTING_SCHEMA_FILES}) as directory:
+            # Arrange:
+            cache = ParseCache()
+
+            # Act:
+            type_descriptors = parse_files(directory, ['full.cats'], cache)[0]
+
+            # Assert: mosaic.cats is parsed (and cached) when full.cats is merged
+            self.assertEqual(parse_file(directory, 'full.cats'), type_descriptors)
+            self.assertEqual(['Amount', 'Mosaic', 'MosaicBundle'], list(type_descriptors.keys()))
+            self.assertEqual(3, len(cache.records))
+
+    def test_cannot_parse_root_not_importing_types_used_by_its_imports(self):
+        with temporary_schema_files({**SCHEMA_FILES, **UNDER_IMPORTING_SCHEMA_FILES}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_files(directory, ['full.cats', 'partial.cats'])
+
+    def test_each_file_is_parsed_once(self):
+        with temporary_schema_files({**SCHEMA_FILES, **LEAF_SCHEMA_FILES}) as directory:
+            # Arrange:
+            cache = ParseCache()
+
+            # Act:
+            parse_files(directory, ['transfer.cats', 'fee.cats', 'lock.cats'], cache)
+
+            # Assert: one record per file
+            self.assertEqual(5, len(cache.records))
+
+    def test_previously_cached_files_are_not_parsed(self):
+        with temporary_schema_files({**SCHEMA_FILES, **LEAF_SCHEMA_FILES}) as directory:
+            # Arrange:
+            cache = ParseCache(os.path.join(directory, 'cache'))
+            parse_files(directory, ['transfer.cats'], cache)
+            cache = ParseCache(os.path.join(directory, 'cache'))
+
+            # Act:
+            type_descriptors = parse_files(directory, ['transfer.cats'], cache)[0]
+
+            # Assert:
+            self.assertEqual(parse_file(directory, 'transfer.cats'), type_descriptors)
+            self.assertEqual(0, cache.misses)
+
+    def test_cannot_parse_file_with_duplicate_definition_across_files(self):
+        with temporary_schema_files({**SCHEMA_FILES, 'fee.cats': ['import "transfer.cats"', 'using Amount = uint32']}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_files(directory, ['fee.cats'])
+
+    def test_cannot_parse_circular_imports(self):
+        with temporary_schema_files({'alpha.cats': ['import "beta.cats"'], 'beta.cats': ['import "alpha.cats"']}) as directory:
+            # Act + Assert:
+            with self.assertRaises(CatsParseException):
+                parse_files(directory, ['alpha.cats'])
@@ -0,0 +1,73 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from catparser.ParseCache import ParseCache, ParseRecord, scan_imports
+
+
+class ScanImportsTest(unittest.TestCase):
+    def test_can_scan_imports(self):
+        # Act:
+        imports = scan_imports([
+            'import "types.cats"',
+            '# import "comment.cats"',
+            'using Amount = uint64',
+            'import "foo bar/entity.cats"\n',
+            '\timport "nested.cats"'
+        ])
+
+        # Assert:
+        self.assertEqual(['types.cats', 'foo bar/entity.cats'], imports)
+
+
+class ParseCacheTest(unittest.TestCase):
+    def test_key_depends_on_content_and_import_keys(self):
+        # Act:
+        key = ParseCache.calculate_key('using Foo = uint8', ['aa', 'bb'])
+
+        # Assert:
+        self.assertEqual(key, ParseCache.calculate_key('using Foo = uint8', ['aa', 'bb']))
+        self.assertNotEqual(key, ParseCache.calculate_key('using Foo = uint16', ['aa', 'bb']))
+        self.assertNotEqual(key, ParseCache.calculate_key('using Foo = uint8', ['aa', 'cc']))
+        self.assertNotEqual(key, ParseCache.calculate_key('using Foo = uint8', ['aa']))
+
+    def test_get_returns_none_for_unknown_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            cache = ParseCache(directory)
+
+            # Act:
+            record = cache.get('abcd')
+
+            # Assert:
+            self.assertEqual(None, record)
+            self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+    def test_can_get_put_record(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            record = ParseRecord()
+            record.add_import('types.cats')
+            record.add_type_descriptor('Foo', {'type': 'byte', 'size': 1})
+            ParseCache(os.path.join(directory, 'nested')).put('abcd', record)
+            cache = ParseCache(os.path.join(directory, 'nested'))
+
+            # Act:
+            cached_record = cache.get('abcd')
+
+            # Assert:
+            self.assertEqual([('import', 'types.cats'), ('type', 'Foo', {'type': 'byte', 'size': 1})], cached_record.events)
+            self.assertEqual((1, 0), (cache.hits, cache.misses))
+
+    def test_can_get_put_record_in_memory(self):
+        # Arrange:
+        record = ParseRecord()
+        cache = ParseCache()
+        cache.put('abcd', record)
+
+        # Act:
+        cached_record = cache.get('abcd')
+
+        # Assert:
+        self.assertIs(record, cached_record)
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
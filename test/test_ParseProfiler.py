@@ -0,0 +1,188 @@
+# pylint: disable=invalid-name
+import unittest
+from test.SchemaTestUtils import SCHEMA_FILES
+from catparser.CatsParser import CatsParser
+from catparser.MultiFileParser import MultiFileParser
+from catparser.ParseCache import ParseCache
+from catparser.ParseProfiler import ParseListener, ParseProfiler
+from catparser.SchemaResolver import MappingResolver
+
+
+class RecordingListener(ParseListener):
+    def __init__(self):
+        self.events = []
+
+    def begin_file(self, name):
+        self.events.append(('begin', name))
+
+    def end_file(self, name, elapsed_time, is_cached):
+        self.events.append(('end', name, is_cached))
+
+    def line_processed(self, kind, elapsed_time):
+        self.events.append(('line', kind))
+
+    def import_resolved(self, filename, elapsed_time):
+        self.events.append(('import', filename))
+
+    def validation_performed(self, elapsed_time):
+        self.events.append(('validation',))
+
+
+def parse_with_listener(listener, root_filename, cache=None):
+    resolver = MappingResolver({filename: '\n'.join(lines) for filename, lines in SCHEMA_FILES.items()})
+    parser = MultiFileParser(cache, resolver, listener)
+    parser.parse(resolver.resolve(root_filename))
+    return parser.cats_parser.type_descriptors()
+
+
+class CatsParserListenerTest(unittest.TestCase):
+    def test_listener_is_notified_about_each_line_kind(self):
+        # Arrange:
+        listener = RecordingListener()
+        parser = CatsParser([].append)
+        parser.set_listener(listener)
+
+        # Act:
+        for line in ['import "foo.cats"', '# comment', 'using Amount = uint64', '', 'enum Shape : uint8', '\tcircle = 1']:
+            parser.process_line(line)
+
+        # Assert:
+        self.assertEqual(
+            [('line', 'import'), ('line', 'comment'), ('validation',), ('line', 'alias'), ('line', 'blank'), ('line', 'enum'),
+             ('line', 'enum value')],
+            listener.events)
+
+    def test_listener_is_notified_about_struct_lines_and_validations(self):
+        # Arrange:
+        listener = RecordingListener()
+        parser = CatsParser(None)
+        parser.set_listener(listener)
+
+        # Act:
+        for line in ['using Amount = uint64', 'struct Mosaic', '\tamount = Amount', '\tcount = uint8']:
+            parser.process_line(line)
+
+        parser.type_descriptors()
+
+        # Assert: type validation is performed for each member with a type and duplicate validation for each type
+        self.assertEqual(
+            [('validation',), ('line', 'alias'), ('line', 'struct'), ('validation',), ('line', 'struct member'),
+             ('validation',), ('line', 'struct member'), ('validation',)],
+            listener.events)
+
+    def test_listener_is_notified_about_failed_validation(self):
+        # Arrange:
+        listener = RecordingListener()
+        parser = CatsParser(None)
+        parser.set_listener(listener)
+        parser.process_line('struct Mosaic')
+
+        # Act:
+        with self.assertRaises(Exception):
+            parser.process_line('\tamount = Amount')
+
+        # Assert:
+        self.assertEqual([('line', 'struct'), ('validation',)], listener.events)
+
+    def test_listener_can_be_removed(self):
+        # Arrange:
+        listener = RecordingListener()
+        parser = CatsParser(None)
+        parser.set_listener(listener)
+
+        # Act:
+        parser.set_listener(None)
+        for line in ['using Amount = uint64', 'struct Mosaic', '\tamount = Amount']:
+            parser.process_line(line)
+
+        parser.type_descriptors()
+
+        # Assert:
+        self.assertEqual([], listener.events)
+        self.assertFalse('_validate_member' in parser.__dict__)
+
+
+class MultiFileParserListenerTest(unittest.TestCase):
+    def test_listener_is_notified_about_files_and_imports(self):
+        # Arrange:
+        listener = RecordingListener()
+
+        # Act:
+        parse_with_listener(listener, 'entity.cats')
+
+        # Assert:
+        file_events = [event for event in listener.events if event[0] in ('begin', 'end', 'import')]
+        self.assertEqual(
+            [('begin', 'entity.cats'), ('import', 'types.cats'), ('begin', 'types.cats'), ('end', 'types.cats', False),
+             ('end', 'entity.cats', False)],
+            file_events)
+
+    def test_listener_is_notified_about_cached_files(self):
+        # Arrange:
+        cache = ParseCache()
+        parse_with_listener(None, 'entity.cats', cache)
+        listener = RecordingListener()
+
+        # Act:
+        parse_with_listener(listener, 'entity.cats', cache)
+
+        # Assert: cache keys are calculated by resolving imports and replayed struct members are validated
+        self.assertEqual(
+            [('begin', 'entity.cats'), ('import', 'types.cats'), ('import', 'types.cats'), ('begin', 'types.cats'),
+             ('validation',), ('validation',), ('validation',), ('end', 'types.cats', True), ('validation',), ('end', 'entity.cats', True)],
+            listener.events)
+
+
+class ParseProfilerTest(unittest.TestCase):
+    def test_profiler_aggregates_lines_by_file_and_kind(self):
+        # Arrange:
+        profiler = ParseProfiler()
+
+        # Act:
+        parse_with_listener(profiler, 'transfer.cats')
+
+        # Assert:
+        self.assertEqual(['types.cats', 'entity.cats', 'transfer.cats'], list(profiler.files.keys()))
+        self.assertEqual([5, 4, 8], [file_statistics.num_lines for file_statistics in profiler.files.values()])
+        self.assertEqual([1, 1, 1], [file_statistics.count for file_statistics in profiler.files.values()])
+        self.assertEqual([0, 0, 0], [file_statistics.num_cached for file_statistics in profiler.files.values()])
+        self.assertEqual(
+            {'import': 2, 'blank': 4, 'comment': 1, 'alias': 2, 'struct': 2, 'struct member': 4, 'enum': 1, 'enum value': 1},
+            {kind: kind_statistics.count for kind, kind_statistics in profiler.line_kinds.items()})
+        self.assertEqual(2, profiler.imports.count)
+        self.assertEqual(9, profiler.validations.count)
+
+    def test_profiler_excludes_import_time_from_importing_file(self):
+        # Arrange:
+        profiler = ParseProfiler()
+
+        # Act:
+        profiler.begin_file('a.cats')
+        profiler.begin_file('b.cats')
+        profiler.line_processed('alias', 1)
+        profiler.end_file('b.cats', 2, False)
+        profiler.line_processed('import', 3)
+        profiler.line_processed('alias', 4)
+        profiler.end_file('a.cats', 10, False)
+
+        # Assert:
+        self.assertEqual({'a.cats': (8, 2), 'b.cats': (2, 1)}, {
+            name: (file_statistics.time, file_statistics.num_lines) for name, file_statistics in profiler.files.items()
+        })
+        self.assertEqual({'alias': (2, 5), 'import': (1, 1)}, {
+            kind: (kind_statistics.count, kind_statistics.time) for kind, kind_statistics in profiler.line_kinds.items()
+        })
+
+    def test_profiler_can_report_timings(self):
+        # Arrange:
+        profiler = ParseProfiler()
+        parse_with_listener(profiler, 'transfer.cats')
+
+        # Act:
+        lines = profiler.report()
+
+        # Assert:
+        self.assertEqual(1 + 3 + 2 + 8 + 1 + 2, len(lines))
+        self.assertEqual(['file', 'parses', 'lines', 'cached', 'self', 'ms'], lines[0].split())
+        self.assertEqual(['import', 'resolution', '2'], lines[-2].split()[:3])
+        self.assertEqual(['validation', '9'], lines[-1].split()[:2])
@@ -0,0 +1,76 @@
+# pylint: disable=invalid-name
+import os
+import tempfile
+import unittest
+from catparser.PickleStore import PickleStore, calculate_sources_version
+
+
+class CalculateSourcesVersionTest(unittest.TestCase):
+    def test_version_changes_when_any_source_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            for filename, content in [('alpha.py', 'A = 1'), ('beta.py', 'B = 2'), ('notes.txt', 'ignored')]:
+                with open(os.path.join(directory, filename), 'w') as output_file:
+                    output_file.write(content)
+
+            module_filename = os.path.join(directory, 'alpha.py')
+            version = calculate_sources_version(module_filename)
+
+            # Act:
+            with open(os.path.join(directory, 'notes.txt'), 'w') as output_file:
+                output_file.write('still ignored')
+
+            unchanged_version = calculate_sources_version(module_filename)
+
+            with open(os.path.join(directory, 'beta.py'), 'w') as output_file:
+                output_file.write('B = 3')
+
+            changed_version = calculate_sources_version(module_filename)
+
+            # Assert:
+            self.assertEqual(version, unchanged_version)
+            self.assertNotEqual(version, changed_version)
+
+
+class PickleStoreTest(unittest.TestCase):
+    def test_can_get_put_value_in_memory(self):
+        # Arrange:
+        value = {'foo': [1, 2]}
+        store = PickleStore()
+        store.put('abcd', value)
+
+        # Act:
+        stored_value = store.get('abcd')
+
+        # Assert:
+        self.assertIs(value, stored_value)
+        self.assertEqual((1, 0), (store.hits, store.misses))
+
+    def test_values_are_persisted_across_stores(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            PickleStore(os.path.join(directory, 'nested')).put('abcd', {'foo': [1, 2]})
+            store = PickleStore(os.path.join(directory, 'nested'))
+
+            # Act:
+            stored_value = store.get('abcd')
+
+            # Assert:
+            self.assertEqual({'foo': [1, 2]}, stored_value)
+            self.assertEqual(['abcd.pickle'], os.listdir(os.path.join(directory, 'nested')))
+            self.assertEqual((1, 0), (store.hits, store.misses))
+
+    def test_get_returns_none_for_corrupt_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange:
+            with open(os.path.join(directory, 'abcd.pickle'), 'wb') as output_file:
+                output_file.write(b'\x80\x04 not a pickle')
+
+            store = PickleStore(directory)
+
+            # Act:
+            stored_value = store.get('abcd')
+
+            # Assert:
+            self.assertEqual(None, stored_value)
+            self.assertEqual((0, 1), (store.hits, store.misses))
@@ -0,0 +1,132 @@
+# pylint: disable=invalid-name
+import os
+import struct
+import tempfile
+import unittest
+from test.test_CatsParser import parse_all
+from test.test_SchemaDecoder import SCHEMA_LINES, serialize_bundle
+from catcodec.SchemaDecoder import SchemaDecoder
+from generators.All import AVAILABLE_GENERATORS
+from generators.py_codec.PyCodecGenerator import PyCodecGenerator
+
+
+def generate_module(options=None):
+    descriptors = list(PyCodecGenerator(parse_all(SCHEMA_LINES), options or {}))
+    assert 1 == len(descriptors)
+    return descriptors[0]
+
+
+def load_module():
+    module_globals = {}
+    exec('\n'.join(generate_module().code), module_globals)  # pylint: disable=exec-used
+    return module_globals
+
+
+class PyCodecGeneratorTest(unittest.TestCase):
+    def test_generator_is_registered(self):
+        self.assertEqual(PyCodecGenerator, AVAILABLE_GENERATORS['py_codec'])
+
+    def test_module_is_named_after_schema(self):
+        # Act:
+        descriptor = generate_module({'schema': 'schemas/transfer/transfer.cats'})
+
+        # Assert:
+        self.assertEqual('transfer.py', descriptor.filename)
+
+    def test_module_has_default_name_without_schema(self):
+        self.assertEqual('schema.py', generate_module().filename)
+
+    def test_module_is_not_generated_when_no_requested_transaction_is_defined(self):
+        # Act:
+        descriptors = list(PyCodecGenerator(parse_all(SCHEMA_LINES), {'transactions': {'TransferTransaction'}}))
+
+        # Assert:
+        self.assertEqual([], descriptors)
+
+    def test_copyright_is_prepended_as_comments(self):
+        # Arrange:
+        with tempfile.TemporaryDirectory() as temp_directory:
+            copyright_filename = os.path.join(temp_directory, 'HEADER.inc')
+            with open(copyright_filename, 'w') as copyright_file:
+                copyright_file.write('Copyright (c) Tester\n\nAll rights reserved\n')
+
+            # Act:
+            code = generate_module({'copyright': copyright_filename}).code
+
+        # Assert:
+        self.assertEqual(['# Copyright (c) Tester', '#', '# All rights reserved'], code[:3])
+
+    def test_fixed_size_runs_are_decoded_with_precompiled_structs(self):
+        # Act:
+        code = generate_module().code
+
+        # Assert: each run of fixed size fields is decoded by a single precompiled struct, which is shared by equal runs
+        self.assertEqual([
+            '_MOSAIC_0 = struct.Struct(\'<Qh\')',
+            '_HEADER_1 = struct.Struct(\'<I6s\')',
+            '_NOTE_2 = struct.Struct(\'<B\')',
+            '_BUNDLE_3 = struct.Struct(\'<I6sB\')',
+            '_BUNDLE_4 = struct.Struct(\'<H\')',
+            '_BUNDLE_5 = struct.Struct(\'<I\')',
+            '_BUNDLE_6 = struct.Struct(\'<BB2s\')',
+            '_AMOUNT_7 = struct.Struct(\'<Q\')',
+            '_KEY_8 = struct.Struct(\'<6s\')',
+            '_BUNDLE_9 = struct.Struct(\'<h\')'
+        ], [line for line in code if ' = struct.Struct(' in line])
+        self.assertIn('    size, signer, shape = _BUNDLE_3.unpack_from(buffer, offset)', code)
+        self.assertIn(
+            '    mosaics = [{\'amount\': element0, \'delta\': element1} for element0, element1 in '
+            '_MOSAIC_0.iter_unpack(buffer[offset:end_offset])]',
+            code)
+
+    def test_generated_decoders_match_schema_decoder(self):
+        # Arrange:
+        module = load_module()
+        decoder = SchemaDecoder(parse_all(SCHEMA_LINES))
+
+        # Act + Assert:
+        for shape, shape_value_format, shape_value in [(0, 'I', 0), (1, 'H', 0xABCD), (2, 'I', 0xABCDEF01)]:
+            buffer = serialize_bundle(shape, shape_value_format, shape_value)
+            values, offset = module['decode_bundle'](memoryview(buffer))
+
+            self.assertEqual(decoder.decode('Bundle', buffer), values)
+            self.assertEqual(len(buffer), offset)
+
+    def test_can_decode_struct_at_offset(self):
+        # Act:
+        values, offset = load_module()['DECODERS']['Mosaic'](b'\xFF' * 3 + struct.pack('<Qh', 12345, -7) + b'\xFF', 3)
+
+        # Assert:
+        self.assertEqual({'amount': 12345, 'delta': -7}, values)
+        self.assertEqual(13, offset)
+
+    def test_cannot_decode_truncated_buffer(self):
+        # Arrange:
+        decode_bundle = load_module()['decode_bundle']
+        buffer = serialize_bundle(1, 'H', 0xABCD)
+
+        # Act + Assert:
+        for size in [0, 5, 30, len(buffer) - 1]:
+            with self.assertRaises(struct.error):
+                decode_bundle(buffer[:size])
+
+    def test_encoded_values_round_trip(self):
+        # Arrange:
+        module = load_module()
+
+        # Act + Assert:
+        for shape, shape_value_format, shape_value in [(0, 'I', 0), (1, 'H', 0xABCD), (2, 'I', 0xABCDEF01)]:
+            buffer = serialize_bundle(shape, shape_value_format, shape_value)
+            values, _ = module['decode_bundle'](buffer)
+
+            self.assertEqual(buffer, module['ENCODERS']['Bundle'](values))
+
+    def test_encoder_calculates_count_fields(self):
+        # Arrange:
+        encode_note = load_module()['encode_note']
+
+        # Act:
+        buffer = encode_note({'noteSize': 99, 'note': b'hello'})
+
+        # Assert:
+        self.assertEqual(struct.pack('<B', 5) + b'hello', buffer)
@@ -0,0 +1,64 @@
+# pylint: disable=invalid-name
+import unittest
+from catparser.AliasParser import AliasParserFactory
+from catparser.CatsParser import TYPE_DISPATCHER
+from catparser.RegexDispatcher import RegexDispatcher
+from catparser.StructParser import STRUCT_MEMBER_DISPATCHER, StructArrayMemberParserFactory, StructScalarMemberParserFactory
+
+
+class RegexDispatcherTest(unittest.TestCase):
+    def test_can_dispatch_to_matching_factory(self):
+        # Arrange:
+        dispatcher = RegexDispatcher([AliasParserFactory(), StructArrayMemberParserFactory()])
+
+        # Act:
+        factory, match = dispatcher.match('cars = array(Car, carCount, sort_key=color)')
+
+        # Assert: groups are numbered relative to the matching factory pattern
+        self.assertIs(dispatcher.factories[1], factory)
+        self.assertEqual(
+            ['cars', 'Car', 'carCount', ', sort_key=color', 'color'],
+            [match.group(index) for index in range(1, 6)])
+
+    def test_first_matching_factory_is_selected(self):
+        # Arrange: all factories match scalar members
+        dispatcher = RegexDispatcher([AliasParserFactory(), StructScalarMemberParserFactory(), StructScalarMemberParserFactory()])
+
+        # Act:
+        factory, match = dispatcher.match('car = Car')
+
+        # Assert:
+        self.assertIs(dispatcher.factories[1], factory)
+        self.assertEqual(['car', 'Car', None], [match.group(index) for index in range(1, 4)])
+
+    def test_returns_none_when_no_factory_matches(self):
+        # Arrange:
+        dispatcher = RegexDispatcher([AliasParserFactory()])
+
+        # Act:
+        factory, match = dispatcher.match('alias Foo = uint8')
+
+        # Assert:
+        self.assertEqual((None, None), (factory, match))
+
+    def test_dispatch_results_are_equivalent_to_linear_factory_scan(self):
+        # Arrange:
+        lines_by_dispatcher = [
+            (TYPE_DISPATCHER, ['using Foo = uint8', 'enum Foo : uint8', 'import "foo.cats"', 'struct Foo', 'struct Foo Bar']),
+            (STRUCT_MEMBER_DISPATCHER, [
+                'const uint8 foo = 1', 'inline Foo', 'foo = array(Foo, 10)', 'foo = Foo if bar equals baz', 'foo = Foo', 'foo'
+            ])
+        ]
+
+        for dispatcher, lines in lines_by_dispatcher:
+            for line in lines:
+                # Act:
+                factory, match = dispatcher.match(line)
+
+                # Assert:
+                expected_factory = next((factory for factory in dispatcher.factories if factory.is_match(line)), None)
+                self.assertIs(expected_factory, factory)
+                if expected_factory:
+                    expected_match = expected_factory.regex.match(line)
+                    for index in range(1, expected_factory.regex.groups + 1):
+                        self.assertEqual(expected_match.group(index), match.group(index))
@@ -0,0 +1,160 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.SchemaTestUtils import CODEC_TYPE_LINES, SHAPE_UNION_LINES
+from test.test_CatsParser import parse_all
+from catcodec.DecodeException import DecodeException
+from catcodec.SchemaDecoder import SchemaDecoder
+from catparser.CatsParseException import CatsParseException
+
+SCHEMA_LINES = CODEC_TYPE_LINES + [
+    'struct Mosaic',
+    '\tamount = Amount',
+    '\tdelta = int16',
+    'struct Header',
+    '\tsize = uint32',
+    '\tsigner = Key',
+    'struct Note',
+    '\tnoteSize = uint8',
+    '\tnote = array(byte, noteSize)',
+    'struct Bundle',
+    '\tconst uint8 version = 1',
+    '\tinline Header'
+] + SHAPE_UNION_LINES + [
+    '\tmessageSize = uint8',
+    '\tmosaicsCount = uint8',
+    '\thash = array(byte, 2)',
+    '\tmessage = array(byte, messageSize)',
+    '\tmosaics = array(Mosaic, mosaicsCount)',
+    '\tamounts = array(Amount, 2)',
+    '\tkeys = array(Key, mosaicsCount)',
+    '\tnotes = array(Note, 2)',
+    '\tprimary = Mosaic',
+    '\tfooter = int16'
+]
+
+
+def create_decoder():
+    return SchemaDecoder(parse_all(SCHEMA_LINES))
+
+
+def serialize_bundle(shape, shape_value_format, shape_value):
+    buffer = struct.pack('<I6sB' + shape_value_format, 0x12345678, b'SIGNER', shape, shape_value)
+    buffer += bytes(4 - struct.calcsize('<' + shape_value_format))
+    buffer += struct.pack('<BB2s', 3, 2, b'HH') + b'abc'
+    buffer += struct.pack('<QhQh', 1000, -1, 2000, 2)
+    buffer += struct.pack('<QQ', 7, 8)
+    buffer += b'KEY001KEY002'
+    buffer += struct.pack('<B', 2) + b'xy' + struct.pack('<B', 0)
+    buffer += struct.pack('<Qhh', 3000, 3, -5)
+    return buffer
+
+
+EXPECTED_BUNDLE_VALUES = {
+    'size': 0x12345678,
+    'signer': b'SIGNER',
+    'messageSize': 3,
+    'mosaicsCount': 2,
+    'hash': b'HH',
+    'message': b'abc',
+    'mosaics': [{'amount': 1000, 'delta': -1}, {'amount': 2000, 'delta': 2}],
+    'amounts': [7, 8],
+    'keys': [b'KEY001', b'KEY002'],
+    'notes': [{'noteSize': 2, 'note': b'xy'}, {'noteSize': 0, 'note': b''}],
+    'primary': {'amount': 3000, 'delta': 3},
+    'footer': -5
+}
+
+
+class SchemaDecoderTest(unittest.TestCase):
+    def test_can_decode_fixed_size_struct(self):
+        # Act:
+        values = create_decoder().decode('Mosaic', struct.pack('<Qh', 12345, -7))
+
+        # Assert:
+        self.assertEqual({'amount': 12345, 'delta': -7}, values)
+
+    def test_can_decode_struct_with_variable_size_array(self):
+        # Act:
+        values = create_decoder().decode('Note', struct.pack('<B', 5) + b'hello')
+
+        # Assert:
+        self.assertEqual({'noteSize': 5, 'note': b'hello'}, values)
+
+    def test_can_decode_struct_with_all_member_kinds(self):
+        # Act:
+        values = create_decoder().decode('Bundle', serialize_bundle(1, 'H', 0xABCD))
+
+        # Assert: inline members are flattened, constants are not serialized and only the circle alternative is present
+        self.assertEqual({**EXPECTED_BUNDLE_VALUES, 'shape': 1, 'radius': 0xABCD}, values)
+        self.assertEqual(
+            ['size', 'signer', 'shape', 'radius', 'messageSize', 'mosaicsCount', 'hash', 'message', 'mosaics', 'amounts', 'keys', 'notes',
+             'primary', 'footer'],
+            list(values.keys()))
+
+    def test_can_decode_struct_with_other_union_alternative(self):
+        # Act:
+        values = create_decoder().decode('Bundle', serialize_bundle(2, 'I', 0xABCDEF01))
+
+        # Assert:
+        self.assertEqual({**EXPECTED_BUNDLE_VALUES, 'shape': 2, 'side': 0xABCDEF01}, values)
+
+    def test_can_decode_struct_with_no_union_alternative(self):
+        # Act:
+        values = create_decoder().decode('Bundle', serialize_bundle(0, 'I', 0))
+
+        # Assert:
+        self.assertEqual({**EXPECTED_BUNDLE_VALUES, 'shape': 0}, values)
+
+    def test_can_decode_struct_at_offset(self):
+        # Act:
+        values, offset = create_decoder().decode_from('Mosaic', b'\xFF' * 3 + struct.pack('<Qh', 12345, -7) + b'\xFF', 3)
+
+        # Assert:
+        self.assertEqual({'amount': 12345, 'delta': -7}, values)
+        self.assertEqual(13, offset)
+
+    def test_can_decode_from_memoryview(self):
+        # Act:
+        values = create_decoder().decode('Note', memoryview(struct.pack('<B', 5) + b'hello'))
+
+        # Assert:
+        self.assertEqual({'noteSize': 5, 'note': b'hello'}, values)
+        self.assertEqual(bytes, type(values['note']))
+
+    def test_cannot_decode_truncated_buffer(self):
+        # Arrange:
+        decoder = create_decoder()
+        buffer = serialize_bundle(1, 'H', 0xABCD)
+
+        # Act + Assert:
+        for size in [0, 5, 30, len(buffer) - 1]:
+            with self.assertRaises(DecodeException):
+                decoder.decode('Bundle', buffer[:size])
+
+    def test_cannot_decode_buffer_with_trailing_bytes(self):
+        # Act + Assert:
+        with self.assertRaises(DecodeException):
+            create_decoder().decode('Mosaic', struct.pack('<Qh', 12345, -7) + b'\x00')
+
+    def test_cannot_decode_array_sized_by_expression(self):
+        # Arrange:
+        type_descriptors = parse_all(['struct Remainder', '\tsize = uint32', '\tpadding = uint8', '\trest = array(byte, size - padding)'])
+        decoder = SchemaDecoder(type_descriptors)
+
+        # Act + Assert:
+        with self.assertRaisesRegex(CatsParseException, 'sized by expression "size - padding"'):
+            decoder.decode('Remainder', struct.pack('<IB', 6, 1) + b'a')
+
+    def test_decode_plans_are_compiled_once(self):
+        # Arrange:
+        decoder = create_decoder()
+
+        # Act:
+        struct_decoder1 = decoder.get_struct_decoder('Bundle')
+        decoder.decode('Bundle', serialize_bundle(1, 'H', 0xABCD))
+        struct_decoder2 = decoder.get_struct_decoder('Bundle')
+
+        # Assert:
+        self.assertIs(struct_decoder1, struct_decoder2)
+        self.assertEqual(['Mosaic', 'Note', 'Bundle'], list(decoder.struct_decoders.keys()))
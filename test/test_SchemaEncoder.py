@@ -0,0 +1,180 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.test_CatsParser import parse_all
+from test.test_SchemaDecoder import EXPECTED_BUNDLE_VALUES, SCHEMA_LINES, create_decoder, serialize_bundle
+from catcodec.EncodeException import EncodeException
+from catcodec.SchemaEncoder import SchemaEncoder
+
+ENTITY_SCHEMA_LINES = [
+    'struct SizePrefixedEntity',
+    '\tsize = uint32',
+    'struct EntityBody',
+    '\tversion = uint8',
+    'struct Transaction',
+    '\tinline SizePrefixedEntity',
+    '\tinline EntityBody',
+    '\tpayloadSize = uint16',
+    '\tpayload = array(byte, payloadSize)',
+    'struct Container',
+    '\ttransactionsCount = uint8',
+    '\ttransactions = array(Transaction, transactionsCount)'
+]
+
+
+def create_encoder(lines=None):
+    return SchemaEncoder(parse_all(lines or SCHEMA_LINES))
+
+
+def create_bundle_values(**kwargs):
+    return {**EXPECTED_BUNDLE_VALUES, **kwargs}
+
+
+class SchemaEncoderTest(unittest.TestCase):
+    def test_can_encode_fixed_size_struct(self):
+        # Act:
+        buffer = create_encoder().encode('Mosaic', {'amount': 12345, 'delta': -7})
+
+        # Assert:
+        self.assertEqual(bytearray, type(buffer))
+        self.assertEqual(struct.pack('<Qh', 12345, -7), buffer)
+
+    def test_can_encode_struct_with_all_member_kinds(self):
+        for shape, shape_format, shape_name, shape_value in [(1, 'H', 'radius', 0xABCD), (2, 'I', 'side', 0xABCDEF01)]:
+            # Act:
+            buffer = create_encoder().encode('Bundle', create_bundle_values(shape=shape, **{shape_name: shape_value}))
+
+            # Assert:
+            self.assertEqual(serialize_bundle(shape, shape_format, shape_value), buffer, shape_name)
+
+    def test_can_encode_struct_with_no_union_alternative(self):
+        # Act:
+        buffer = create_encoder().encode('Bundle', create_bundle_values(shape=0))
+
+        # Assert: unused union bytes are zeroed
+        self.assertEqual(serialize_bundle(0, 'I', 0), buffer)
+
+    def test_encoded_struct_round_trips_through_decoder(self):
+        # Arrange:
+        values = create_bundle_values(shape=1, radius=0xABCD)
+
+        # Act:
+        decoded_values = create_decoder().decode('Bundle', create_encoder().encode('Bundle', values))
+
+        # Assert:
+        self.assertEqual(values, decoded_values)
+
+    def test_count_fields_are_filled_in_from_array_sizes(self):
+        # Arrange: counts are missing or wrong
+        values = create_bundle_values(shape=1, radius=0xABCD, messageSize=99)
+        del values['mosaicsCount']
+        values['notes'] = [{'note': b'xy'}, {'noteSize': 7, 'note': b''}]
+
+        # Act:
+        buffer = create_encoder().encode('Bundle', values)
+
+        # Assert:
+        self.assertEqual(serialize_bundle(1, 'H', 0xABCD), buffer)
+
+    def test_count_fields_between_other_fields_are_filled_in_from_array_sizes(self):
+        # Arrange:
+        lines = ['struct Pair', '\tfirst = uint8', '\tnamesCount = uint8', '\tsecond = uint16', '\tnames = array(byte, namesCount)']
+
+        # Act:
+        buffer = create_encoder(lines).encode('Pair', {'first': 1, 'second': 2, 'names': b'abc'})
+
+        # Assert:
+        self.assertEqual(struct.pack('<BBH', 1, 3, 2) + b'abc', buffer)
+
+    def test_calculate_size_returns_exact_encoded_size(self):
+        # Arrange:
+        encoder = create_encoder()
+        values = create_bundle_values(shape=1, radius=0xABCD, message=b'hello world', notes=[{'note': b'a'}, {'note': b'bcd'}])
+
+        # Act:
+        size = encoder.calculate_size('Bundle', values)
+
+        # Assert:
+        self.assertEqual(len(encoder.encode('Bundle', values)), size)
+        self.assertEqual(len(serialize_bundle(1, 'H', 0)) + 8 + 2, size)
+
+    def test_entity_size_is_filled_in_with_encoded_size(self):
+        # Arrange:
+        values = {'transactions': [{'version': 1, 'payload': b'abc'}, {'version': 2, 'payload': b''}]}
+
+        # Act:
+        buffer = create_encoder(ENTITY_SCHEMA_LINES).encode('Container', values)
+
+        # Assert:
+        self.assertEqual(struct.pack('<BIBH', 2, 10, 1, 3) + b'abc' + struct.pack('<IBH', 7, 2, 0), buffer)
+
+    def test_can_encode_into_existing_buffer_at_offset(self):
+        # Arrange:
+        buffer = bytearray(b'\xFF' * 3 + bytes(10) + b'\xFF')
+
+        # Act:
+        offset = create_encoder().encode_into('Mosaic', buffer, 3, {'amount': 12345, 'delta': -7})
+
+        # Assert:
+        self.assertEqual(13, offset)
+        self.assertEqual(b'\xFF' * 3 + struct.pack('<Qh', 12345, -7) + b'\xFF', buffer)
+
+    def test_cannot_encode_struct_with_missing_value(self):
+        # Arrange:
+        encoder = create_encoder()
+
+        # Act + Assert:
+        with self.assertRaises(EncodeException):
+            encoder.encode('Mosaic', {'amount': 12345})
+
+        with self.assertRaises(EncodeException):
+            encoder.encode('Note', {})
+
+    def test_cannot_encode_value_out_of_range(self):
+        # Arrange:
+        encoder = create_encoder()
+
+        # Act + Assert:
+        with self.assertRaises(EncodeException):
+            encoder.encode('Mosaic', {'amount': 12345, 'delta': 0x8000})
+
+        with self.assertRaises(EncodeException):
+            encoder.encode('Note', {'note': bytes(256)})
+
+    def test_can_encode_into_existing_buffer_that_is_not_zeroed(self):
+        # Arrange:
+        buffer = bytearray(b'\xFF' * len(serialize_bundle(0, 'I', 0)))
+
+        # Act:
+        offset = create_encoder().encode_into('Bundle', buffer, 0, create_bundle_values(shape=0))
+
+        # Assert: unused union bytes are zeroed
+        self.assertEqual(len(buffer), offset)
+        self.assertEqual(serialize_bundle(0, 'I', 0), buffer)
+
+    def test_cannot_encode_into_buffer_too_small(self):
+        # Arrange:
+        buffer = bytearray(4)
+
+        # Act + Assert:
+        with self.assertRaisesRegex(EncodeException, '"Note" ends at offset 6 beyond buffer with size 4'):
+            create_encoder().encode_into('Note', buffer, 0, {'note': b'hello'})
+
+        # - the buffer is not grown
+        self.assertEqual(4, len(buffer))
+
+    def test_cannot_encode_fixed_size_array_with_wrong_number_of_elements(self):
+        # Arrange:
+        values = create_bundle_values(shape=0, amounts=[1, 2, 3])
+
+        # Act + Assert:
+        with self.assertRaisesRegex(EncodeException, '"amounts" must have 2 elements but has 3'):
+            create_encoder().encode('Bundle', values)
+
+    def test_cannot_encode_arrays_sharing_count_with_different_sizes(self):
+        # Arrange:
+        values = create_bundle_values(shape=0, keys=[b'KEY001'])
+
+        # Act + Assert:
+        with self.assertRaisesRegex(EncodeException, 'sized by "mosaicsCount" have different sizes'):
+            create_encoder().encode('Bundle', values)
@@ -0,0 +1,216 @@
+# pylint: disable=invalid-name
+import unittest
+from test.SchemaTestUtils import SHAPE_UNION_LINES
+from test.test_CatsParser import parse_all
+from catparser.CatsParseException import CatsParseException
+from catparser.CatsParser import CatsParser
+from catparser.SchemaLayout import SchemaLayout, SizeExpression
+
+SCHEMA_LINES = [
+    'using Amount = uint64',
+    'using Key = binary_fixed(32)',
+    'enum Shape : uint16',
+    '\tcircle = 1',
+    '\tsquare = 2',
+    'struct Mosaic',
+    '\tamount = Amount',
+    '\tshape = Shape',
+    'struct Header',
+    '\tsize = uint32',
+    '\tsigner = Key',
+    'struct Bundle',
+    '\tconst uint8 version = 1',
+    '\tinline Header',
+    '\tmosaic = Mosaic'
+] + SHAPE_UNION_LINES + [
+    '\tmessageSize = uint8',
+    '\tmosaicsCount = uint8',
+    '\thash = array(byte, 4)',
+    '\tmessage = array(byte, messageSize)',
+    '\tmosaics = array(Mosaic, mosaicsCount)',
+    '\tfooter = uint16',
+    'struct Envelope',
+    '\tpadding = uint8',
+    '\tbundle = Bundle'
+]
+
+
+def link(lines):
+    return SchemaLayout(parse_all(lines))
+
+
+class SchemaLayoutTest(unittest.TestCase):
+    def _assert_fields(self, expected_fields, struct_layout):
+        actual_fields = [(field.name, field.kind, field.size, field.offset, field.base) for field in struct_layout.fields]
+        self.assertEqual(expected_fields, actual_fields)
+
+    def test_can_link_fixed_size_struct(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Mosaic']
+
+        # Assert:
+        self._assert_fields([('amount', 'byte', 8, 0, None), ('shape', 'enum', 2, 8, None)], struct_layout)
+        self.assertTrue(struct_layout.is_fixed)
+        self.assertEqual((10, 10, 10), (struct_layout.size, struct_layout.fixed_size, struct_layout.fixed_prefix_size))
+        self.assertEqual((), struct_layout.variable_fields)
+
+    def test_can_link_variable_size_struct(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Bundle']
+
+        # Assert: inline members are flattened, constants are excluded and conditional fields share bytes
+        self._assert_fields([
+            ('size', 'byte', 4, 0, None),
+            ('signer', 'byte', 32, 4, None),
+            ('mosaic', 'struct', 10, 36, None),
+            ('shape', 'enum', 2, 46, None),
+            ('radius', 'byte', 2, 48, None),
+            ('side', 'byte', 4, 48, None),
+            ('messageSize', 'byte', 1, 52, None),
+            ('mosaicsCount', 'byte', 1, 53, None),
+            ('hash', 'array', 4, 54, None),
+            ('message', 'array', None, 58, None),
+            ('mosaics', 'array', None, 0, 'message'),
+            ('footer', 'byte', 2, 0, 'mosaics')
+        ], struct_layout)
+        self.assertFalse(struct_layout.is_fixed)
+        self.assertEqual((None, 60, 58), (struct_layout.size, struct_layout.fixed_size, struct_layout.fixed_prefix_size))
+        self.assertEqual(['message', 'mosaics'], [field.name for field in struct_layout.variable_fields])
+
+    def test_can_link_struct_containing_variable_size_struct(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Envelope']
+
+        # Assert:
+        self._assert_fields([('padding', 'byte', 1, 0, None), ('bundle', 'struct', None, 1, None)], struct_layout)
+        self.assertEqual('Bundle', struct_layout.get_field('bundle').element.struct_layout.name)
+
+    def test_fields_reference_resolved_types(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Bundle']
+        mosaics = struct_layout.get_field('mosaics')
+        radius = struct_layout.get_field('radius')
+
+        # Assert:
+        self.assertEqual(('Mosaic', 'struct', 10), (mosaics.type_name, mosaics.element.kind, mosaics.element.size))
+        self.assertEqual('mosaicsCount', mosaics.count)
+        self.assertEqual(('byte', 'unsigned'), (radius.type_name, radius.element.signedness))
+        self.assertEqual(('shape', 'circle'), (radius.condition, radius.condition_value))
+        self.assertEqual('Amount', struct_layout.get_field('mosaic').element.struct_layout.get_field('amount').type_name)
+
+    def test_struct_layout_indexes_constants_and_count_fields(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Bundle']
+
+        # Assert:
+        self.assertEqual({'version': 1}, {name: constant['value'] for name, constant in struct_layout.constants.items()})
+        self.assertEqual({'messageSize': ['message'], 'mosaicsCount': ['mosaics']}, struct_layout.count_fields)
+
+    def test_can_link_array_sized_by_expression(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES + [
+            'struct Remainder', '\tinline Header', '\tpadding = uint8', '\trest = array(byte, size - padding)'
+        ])['Remainder']
+        rest = struct_layout.get_field('rest')
+
+        # Assert:
+        self._assert_fields([
+            ('size', 'byte', 4, 0, None),
+            ('signer', 'byte', 32, 4, None),
+            ('padding', 'byte', 1, 36, None),
+            ('rest', 'array', None, 37, None)
+        ], struct_layout)
+        self.assertEqual(SizeExpression('size', 'padding'), rest.count)
+        self.assertEqual({}, struct_layout.count_fields)
+
+    def test_can_lookup_offset_of_fixed_prefix_field(self):
+        # Act:
+        struct_layout = link(SCHEMA_LINES)['Bundle']
+
+        # Assert:
+        self.assertEqual(0, struct_layout.offset_of('size'))
+        self.assertEqual(58, struct_layout.offset_of('message'))
+
+    def test_cannot_lookup_offset_of_field_following_variable_size_field(self):
+        # Arrange:
+        struct_layout = link(SCHEMA_LINES)['Bundle']
+
+        # Act + Assert:
+        for name in ['mosaics', 'footer', 'foo']:
+            with self.assertRaises(CatsParseException):
+                struct_layout.offset_of(name)
+
+    def test_can_resolve_all_struct_layouts(self):
+        # Act:
+        struct_layouts = link(SCHEMA_LINES).resolve_all()
+
+        # Assert:
+        self.assertEqual(['Mosaic', 'Header', 'Bundle', 'Envelope'], list(struct_layouts.keys()))
+
+    def test_struct_layouts_are_memoized(self):
+        # Arrange:
+        schema_layout = link(SCHEMA_LINES)
+
+        # Act:
+        struct_layout1 = schema_layout['Envelope']
+        struct_layout2 = schema_layout['Envelope']
+
+        # Assert:
+        self.assertIs(struct_layout1, struct_layout2)
+        self.assertIs(schema_layout['Bundle'], struct_layout1.get_field('bundle').element.struct_layout)
+
+    def test_cannot_link_non_struct_type(self):
+        # Arrange:
+        schema_layout = link(SCHEMA_LINES)
+
+        # Act + Assert:
+        for type_name in ['Amount', 'Shape', 'Foo']:
+            with self.assertRaises(CatsParseException):
+                schema_layout.get_struct_layout(type_name)
+
+    def test_cannot_link_variable_size_conditional_field(self):
+        # Arrange:
+        schema_layout = link(SCHEMA_LINES + [
+            'struct Holder',
+            '\tshape = Shape',
+            '\tbundle = Bundle if shape equals circle',
+            '\tside = uint32 if shape equals square'
+        ])
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            schema_layout.get_struct_layout('Holder')
+
+
+class CatsParserSchemaLayoutTest(unittest.TestCase):
+    def test_parser_memoizes_schema_layout(self):
+        # Arrange:
+        parser = CatsParser(None)
+        for line in SCHEMA_LINES:
+            parser.process_line(line)
+
+        # Act:
+        schema_layout1 = parser.schema_layout()
+        schema_layout2 = parser.schema_layout()
+
+        # Assert:
+        self.assertIs(schema_layout1, schema_layout2)
+        self.assertEqual(10, schema_layout1['Mosaic'].size)
+
+    def test_parser_relinks_schema_layout_after_type_is_added(self):
+        # Arrange:
+        parser = CatsParser(None)
+        for line in SCHEMA_LINES:
+            parser.process_line(line)
+
+        schema_layout1 = parser.schema_layout()
+
+        # Act:
+        for line in ['struct Pair', '\tfirst = Mosaic', '\tsecond = Mosaic']:
+            parser.process_line(line)
+
+        schema_layout2 = parser.schema_layout()
+
+        # Assert:
+        self.assertIsNot(schema_layout1, schema_layout2)
+        self.assertEqual(20, schema_layout2['Pair'].size)
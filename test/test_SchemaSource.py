@@ -0,0 +1,135 @@
+# pylint: disable=invalid-name
+import io
+import os
+import unittest
+from test.SchemaTestUtils import temporary_schema_files
+from catparser.CatsParseException import CatsParseException
+from catparser.SchemaResolver import FileSystemResolver, MappingResolver
+from catparser.SchemaSource import SchemaSource
+
+SCHEMA_TEXT = 'using Amount = uint64\n\nstruct Mosaic\n\tamount = Amount\n'
+SCHEMA_FILES = {'foo.cats': ['using Amount = uint64', '', 'struct Mosaic', '\tamount = Amount']}
+SCHEMA_LINES = ['using Amount = uint64\n', '\n', 'struct Mosaic\n', '\tamount = Amount\n']
+
+
+class SchemaSourceTest(unittest.TestCase):
+    def _assert_source(self, source, expected_name):
+        self.assertEqual(expected_name, source.name)
+        self.assertEqual(SCHEMA_LINES, list(source.lines()))
+        self.assertEqual(SCHEMA_TEXT, source.text())
+
+    def test_can_create_source_from_file(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            filename = os.path.join(directory, 'foo.cats')
+
+            # Act:
+            source = SchemaSource.from_file(filename)
+
+            # Assert:
+            self._assert_source(source, filename)
+
+    def test_can_create_source_from_string(self):
+        # Act:
+        source = SchemaSource.from_string('foo.cats', SCHEMA_TEXT)
+
+        # Assert:
+        self._assert_source(source, 'foo.cats')
+
+    def test_can_create_source_from_bytes(self):
+        # Act:
+        source = SchemaSource.from_string('foo.cats', SCHEMA_TEXT.encode('utf8'))
+
+        # Assert:
+        self._assert_source(source, 'foo.cats')
+
+    def test_can_iterate_lines_from_text_stream(self):
+        # Act:
+        source = SchemaSource.from_stream('foo.cats', io.StringIO(SCHEMA_TEXT))
+
+        # Assert:
+        self.assertEqual(SCHEMA_LINES, list(source.lines()))
+
+    def test_can_iterate_lines_from_binary_stream(self):
+        # Act:
+        source = SchemaSource.from_stream('foo.cats', io.BytesIO(SCHEMA_TEXT.encode('utf8')))
+
+        # Assert:
+        self.assertEqual(SCHEMA_LINES, list(source.lines()))
+
+    def test_can_iterate_lines_from_stream_after_reading_text(self):
+        # Arrange:
+        source = SchemaSource.from_stream('foo.cats', io.BytesIO(SCHEMA_TEXT.encode('utf8')))
+
+        # Act:
+        text = source.text()
+
+        # Assert:
+        self.assertEqual(SCHEMA_TEXT, text)
+        self._assert_source(source, 'foo.cats')
+
+    def test_lines_are_consumed_lazily(self):
+        # Arrange:
+        stream = io.StringIO(SCHEMA_TEXT)
+        source = SchemaSource.from_stream('foo.cats', stream)
+
+        # Act:
+        line = next(source.lines())
+
+        # Assert:
+        self.assertEqual(SCHEMA_LINES[0], line)
+        self.assertEqual(len(SCHEMA_LINES[0]), stream.tell())
+
+
+class FileSystemResolverTest(unittest.TestCase):
+    def test_can_resolve_file_relative_to_include_path(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            resolver = FileSystemResolver(directory)
+
+            # Act:
+            source = resolver.resolve('foo.cats')
+
+            # Assert:
+            self.assertEqual(os.path.join(directory, 'foo.cats'), source.name)
+            self.assertEqual(SCHEMA_TEXT, source.text())
+
+    def test_text_is_cached_until_invalidated(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            filename = os.path.join(directory, 'foo.cats')
+            resolver = FileSystemResolver(directory)
+            resolver.resolve('foo.cats')
+            with open(filename, 'w') as output_file:
+                output_file.write('using Foo = uint8\n')
+
+            # Act:
+            text1 = resolver.resolve('foo.cats').text()
+            resolver.invalidate(filename)
+            text2 = resolver.resolve('foo.cats').text()
+
+            # Assert:
+            self.assertEqual(SCHEMA_TEXT, text1)
+            self.assertEqual('using Foo = uint8\n', text2)
+
+
+class MappingResolverTest(unittest.TestCase):
+    def test_can_resolve_text_and_bytes(self):
+        # Arrange:
+        resolver = MappingResolver({'foo.cats': SCHEMA_TEXT, 'bar.cats': SCHEMA_TEXT.encode('utf8')})
+
+        for name in ['foo.cats', 'bar.cats']:
+            # Act:
+            source = resolver.resolve(name)
+
+            # Assert:
+            self.assertEqual(name, source.name)
+            self.assertEqual(SCHEMA_LINES, list(source.lines()))
+
+    def test_cannot_resolve_unknown_file(self):
+        # Arrange:
+        resolver = MappingResolver({'foo.cats': SCHEMA_TEXT})
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            resolver.resolve('bar.cats')
@@ -0,0 +1,162 @@
+# pylint: disable=invalid-name
+import struct
+import unittest
+from test.test_CatsParser import parse_all
+from test.test_SchemaDecoder import EXPECTED_BUNDLE_VALUES, SCHEMA_LINES, serialize_bundle
+from catcodec.DecodeException import DecodeException
+from catcodec.SchemaView import ArrayView, SchemaView, StructView
+
+BUNDLE_FIELD_NAMES = [
+    'size', 'signer', 'shape', 'radius', 'side', 'messageSize', 'mosaicsCount', 'hash', 'message', 'mosaics', 'amounts', 'keys', 'notes',
+    'primary', 'footer'
+]
+
+
+def create_schema_view():
+    return SchemaView(parse_all(SCHEMA_LINES))
+
+
+def materialize(value):
+    # converts lazy views into the values produced by SchemaDecoder
+    if isinstance(value, memoryview):
+        return bytes(value)
+
+    if isinstance(value, StructView):
+        return {
+            field.name: materialize(getattr(value, field.name))
+            for field in value.struct_layout.fields if getattr(value, field.name) is not None
+        }
+
+    if isinstance(value, ArrayView):
+        return [materialize(element) for element in value]
+
+    return value
+
+
+class SchemaViewTest(unittest.TestCase):
+    def test_can_view_fixed_size_struct(self):
+        # Act:
+        view = create_schema_view().view('Mosaic', struct.pack('<Qh', 12345, -7))
+
+        # Assert:
+        self.assertEqual('MosaicView', type(view).__name__)
+        self.assertEqual(12345, view.amount)
+        self.assertEqual(-7, view.delta)
+        self.assertEqual(10, view.view_size())
+
+    def test_can_view_struct_with_all_member_kinds(self):
+        # Arrange:
+        schema_view = create_schema_view()
+
+        # Act + Assert:
+        for shape, shape_value_format, shape_value, shape_value_name in [(1, 'H', 0xABCD, 'radius'), (2, 'I', 0xABCDEF01, 'side')]:
+            buffer = serialize_bundle(shape, shape_value_format, shape_value)
+            view = schema_view.view('Bundle', buffer)
+
+            self.assertEqual({**EXPECTED_BUNDLE_VALUES, 'shape': shape, shape_value_name: shape_value}, materialize(view))
+            self.assertEqual(len(buffer), view.view_size())
+
+    def test_absent_conditional_fields_are_none(self):
+        # Act:
+        view = create_schema_view().view('Bundle', serialize_bundle(0, 'I', 0))
+
+        # Assert:
+        self.assertIsNone(view.radius)
+        self.assertIsNone(view.side)
+        self.assertEqual({**EXPECTED_BUNDLE_VALUES, 'shape': 0}, materialize(view))
+
+    def test_byte_fields_are_zero_copy_slices(self):
+        # Arrange:
+        buffer = bytearray(serialize_bundle(1, 'H', 0xABCD))
+        view = create_schema_view().view('Bundle', buffer)
+
+        # Act:
+        signer = view.signer
+        message = view.message
+        buffer[4:6] = b'XX'
+        buffer[20:21] = b'X'
+
+        # Assert:
+        self.assertEqual(memoryview, type(signer))
+        self.assertEqual(memoryview, type(message))
+        self.assertEqual(b'XXGNER', bytes(signer))
+        self.assertEqual(b'aXc', bytes(message))
+
+    def test_can_access_array_elements_by_index(self):
+        # Arrange:
+        view = create_schema_view().view('Bundle', serialize_bundle(1, 'H', 0xABCD))
+
+        # Act + Assert: arrays of fixed and of variable size elements
+        self.assertEqual(2, len(view.mosaics))
+        self.assertEqual(2000, view.mosaics[1].amount)
+        self.assertEqual(1000, view.mosaics[-2].amount)
+        self.assertEqual(b'xy', bytes(view.notes[0].note))
+        self.assertEqual(b'', bytes(view.notes[1].note))
+        with self.assertRaises(IndexError):
+            _ = view.mosaics[2]
+
+    def test_can_view_struct_at_offset(self):
+        # Act:
+        view = create_schema_view().view('Note', b'\xFF' * 3 + struct.pack('<B', 5) + b'hello\xFF', 3)
+
+        # Assert:
+        self.assertEqual(5, view.noteSize)
+        self.assertEqual(b'hello', bytes(view.note))
+        self.assertEqual(6, view.view_size())
+
+    def test_cannot_view_buffer_smaller_than_fixed_prefix(self):
+        # Act + Assert:
+        with self.assertRaises(DecodeException):
+            create_schema_view().view('Mosaic', struct.pack('<Qh', 12345, -7)[:-1])
+
+    def test_cannot_access_fields_beyond_truncated_buffer(self):
+        # Arrange: the fixed prefix is present, but the message is truncated
+        buffer = serialize_bundle(1, 'H', 0xABCD)
+        view = create_schema_view().view('Bundle', buffer[:21])
+
+        # Act + Assert:
+        self.assertEqual(0x12345678, view.size)
+        for name in ['message', 'mosaics', 'footer']:
+            with self.assertRaises(DecodeException):
+                getattr(view, name)
+
+    def test_fields_are_decoded_only_when_accessed(self):
+        # Arrange: the variable size fields describe far more bytes than are available
+        buffer = bytearray(serialize_bundle(1, 'H', 0xABCD))
+        buffer[15] = 0xFF
+        view = create_schema_view().view('Bundle', buffer)
+
+        # Act + Assert: fields preceding the message are still accessible
+        self.assertEqual(0x12345678, view.size)
+        self.assertEqual(0xABCD, view.radius)
+        with self.assertRaises(DecodeException):
+            _ = view.message
+
+    def test_view_classes_are_created_once(self):
+        # Arrange:
+        schema_view = create_schema_view()
+
+        # Act:
+        view_class1 = schema_view.get_view_class('Bundle')
+        _ = schema_view.view('Bundle', serialize_bundle(1, 'H', 0xABCD)).notes[0].note
+        view_class2 = schema_view.get_view_class('Bundle')
+
+        # Assert:
+        self.assertIs(view_class1, view_class2)
+        self.assertEqual(['Bundle', 'Mosaic', 'Note'], sorted(schema_view.view_classes.keys()))
+
+    def test_views_have_no_instance_dict(self):
+        # Act:
+        view = create_schema_view().view('Mosaic', struct.pack('<Qh', 12345, -7))
+
+        # Assert:
+        self.assertFalse(hasattr(view, '__dict__'))
+
+    def test_view_class_has_property_for_each_field(self):
+        # Act:
+        view_class = create_schema_view().get_view_class('Bundle')
+
+        # Assert:
+        self.assertEqual(BUNDLE_FIELD_NAMES, list(view_class.field_accessors.keys()))
+        for name in BUNDLE_FIELD_NAMES:
+            self.assertEqual(property, type(getattr(view_class, name)))
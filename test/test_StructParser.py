@@ -137,6 +137,54 @@ class StructParserTest(unittest.TestCase):
             {'name': 'bar', 'size': 'foo'}
         ]}), result)
 
+    def test_can_append_array_with_size_reference_to_inlined_property(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'disposition': 'inline', 'type': 'Vehicle'})
+        parser.add_inlined_properties([{'name': 'foo', 'type': 'byte'}])
+        parser.append({'name': 'bar', 'size': 'foo'})
+        result = parser.commit()
+
+        # Assert:
+        self.assertEqual(('Car', {'type': 'struct', 'layout': [
+            {'disposition': 'inline', 'type': 'Vehicle'},
+            {'name': 'bar', 'size': 'foo'}
+        ]}), result)
+
+    def test_can_append_array_with_valid_size_expression(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'name': 'foo'})
+        parser.append({'name': 'baz'})
+        parser.append({'name': 'bar', 'size': 'foo - baz'})
+        result = parser.commit()
+
+        # Assert:
+        self.assertEqual(('Car', {'type': 'struct', 'layout': [
+            {'name': 'foo'},
+            {'name': 'baz'},
+            {'name': 'bar', 'size': 'foo - baz'}
+        ]}), result)
+
+    def test_cannot_append_array_with_invalid_size_expression_reference(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+
+        # Act:
+        parser.process_line('struct Car')
+        parser.append({'name': 'foo'})
+
+        # Assert:
+        for size in ['foo - fob', 'fob - foo']:
+            with self.assertRaises(CatsParseException):
+                parser.append({'name': 'bar', 'size': size})
+
     def test_cannot_append_array_with_invalid_size_reference(self):
         # Arrange:
         parser = StructParserFactory().create()
@@ -191,6 +239,30 @@ class StructParserTest(unittest.TestCase):
             {'name': 'foo'}
         ]}), result)
 
+    def test_can_get_property_by_name(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+        parser.process_line('struct Car')
+        parser.append({'disposition': 'inline', 'type': 'Foo'})
+        parser.append({'name': 'foo', 'type': 'Bar'})
+        parser.append({'name': 'foo', 'disposition': 'const', 'value': 7})
+
+        # Act:
+        descriptor = parser.get_property('foo')
+
+        # Assert: first property with matching name is returned
+        self.assertEqual({'name': 'foo', 'type': 'Bar'}, descriptor)
+
+    def test_cannot_get_unknown_property(self):
+        # Arrange:
+        parser = StructParserFactory().create()
+        parser.process_line('struct Car')
+        parser.append({'name': 'foo', 'type': 'Bar'})
+
+        # Act + Assert:
+        with self.assertRaises(CatsParseException):
+            parser.get_property('bar')
+
 # endregion
 
 # region StructConstParserTest
@@ -324,6 +396,19 @@ class StructArrayMemberParserTest(unittest.TestCase):
                     'vehicles = array({0}, {1})'.format(type_name, numeric_str),
                     {'name': 'vehicles', 'type': type_name, 'size': 10})
 
+    def test_can_parse_array_with_size_expression(self):
+        for type_name in ['byte', 'Car']:
+            # Act + Assert:
+            self._assert_parse(
+                'vehicles = array({0}, garageSize - parkingSize)'.format(type_name),
+                {'name': 'vehicles', 'type': type_name, 'size': 'garageSize - parkingSize'})
+
+    def test_cannot_parse_array_with_size_expression_referencing_invalid_property_names(self):
+        # Assert:
+        SingleLineParserTestUtils(StructArrayMemberParserFactory, self).assert_parse_exceptions([
+            'vehicles = array(Car, Garage - parkingSize)', 'vehicles = array(Car, garageSize - 10)'
+        ])
+
     def test_can_parse_array_with_sort_key(self):
         # Act + Assert:
         self._assert_parse(
@@ -0,0 +1,71 @@
+# pylint: disable=invalid-name
+import unittest
+from generators.cpp_builder.Template import Template, get_template
+
+
+class TemplateTest(unittest.TestCase):
+    def test_can_render_static_template(self):
+        # Arrange:
+        template = Template('namespace catapult { namespace builders {\n\nstruct Foo {};')
+
+        # Act:
+        code = template.render(0, {})
+
+        # Assert:
+        self.assertEqual(['namespace catapult { namespace builders {', '', 'struct Foo {};'], code)
+
+    def test_can_render_placeholders(self):
+        # Arrange:
+        template = Template('class {NAME} : public {BASE}_{NAME} {\n{NAME}::{NAME}() {}')
+
+        # Act:
+        code = template.render(0, {'NAME': 'Foo', 'BASE': 'Bar', 'UNUSED': 'Baz'})
+
+        # Assert:
+        self.assertEqual(['class Foo : public Bar_Foo {', 'Foo::Foo() {}'], code)
+
+    def test_braces_not_enclosing_placeholder_names_are_copied_verbatim(self):
+        # Arrange:
+        template = Template('{} {{NAME}} {name} { NAME } {1NAME} 100% {NAME}')
+
+        # Act:
+        code = template.render(0, {'NAME': '%s'})
+
+        # Assert:
+        self.assertEqual(['{} {%s} {name} { NAME } {1NAME} 100% %s'], code)
+
+    def test_non_empty_lines_are_indented(self):
+        # Arrange:
+        template = Template('alpha {NAME}\n\n\tbeta\n')
+
+        # Act:
+        code = template.render(2, {'NAME': 'foo'})
+
+        # Assert:
+        self.assertEqual(['\t\talpha foo', '', '\t\t\tbeta', ''], code)
+
+    def test_lines_of_multiline_values_are_indented_like_line_containing_value(self):
+        # Arrange:
+        template = Template('m_foo = {SETTER};')
+
+        # Act:
+        code = template.render(1, {'SETTER': 'generate(\n\tm_bar,\n\n\tm_baz)'})
+
+        # Assert:
+        self.assertEqual(['\tm_foo = generate(', '\t\tm_bar,', '', '\t\tm_baz);'], code)
+
+    def test_missing_placeholder_value_raises_key_error(self):
+        # Arrange:
+        template = Template('{NAME} {MISSING}')
+
+        # Act + Assert:
+        with self.assertRaises(KeyError):
+            template.render(0, {'NAME': 'foo'})
+
+    def test_templates_are_compiled_once(self):
+        # Act:
+        template1 = get_template('class {NAME} {')
+        template2 = get_template('class {NAME} {')
+
+        # Assert:
+        self.assertIs(template1, template2)
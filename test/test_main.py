@@ -0,0 +1,46 @@
+# pylint: disable=invalid-name
+import argparse
+import contextlib
+import io
+import os
+import unittest
+from test.SchemaTestUtils import SCHEMA_FILES, temporary_schema_files
+from catparser.ParseCache import ParseCache
+from generators.cpp_builder.GenerationCache import GenerationCache
+from main import _watch
+
+
+def watch(directory, should_stop):
+    args = argparse.Namespace(include=directory, generator=None, watch_interval=0)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        _watch(args, [os.path.join(directory, 'transfer.cats')], ParseCache(), GenerationCache(), should_stop)
+
+    return output.getvalue()
+
+
+class WatchTest(unittest.TestCase):
+    def test_can_stop_after_single_iteration(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            num_iterations = []
+
+            # Act:
+            output = watch(directory, lambda: num_iterations.append(1) or True)
+
+            # Assert:
+            self.assertEqual(1, len(num_iterations))
+            self.assertIn('parsed {0}'.format(os.path.join(directory, 'transfer.cats')), output)
+            self.assertTrue(output.endswith('watching {0} for changes\n'.format(directory)))
+
+    def test_keyboard_interrupt_stops_watching_without_raising(self):
+        with temporary_schema_files(SCHEMA_FILES) as directory:
+            # Arrange:
+            def interrupt():
+                raise KeyboardInterrupt()
+
+            # Act:
+            output = watch(directory, interrupt)
+
+            # Assert:
+            self.assertTrue(output.endswith('stopped watching {0}\n'.format(directory)))
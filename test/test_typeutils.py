@@ -0,0 +1,78 @@
+# pylint: disable=invalid-name
+import unittest
+from test.test_CatsParser import parse_all
+from catparser.CompactDescriptor import compact_type_descriptors
+from catparser.typeutils import calculate_closure_hash, find_type_closure
+
+SCHEMA_LINES = [
+    'using Amount = uint64',
+    'using Height = uint64',
+    'enum Shape : uint8',
+    '\tcircle = 1',
+    'struct Mosaic',
+    '\tamount = Amount',
+    'struct Header',
+    '\tshape = Shape',
+    'struct Bundle',
+    '\tinline Header',
+    '\tmosaicsCount = uint8',
+    '\tmosaics = array(Mosaic, mosaicsCount)',
+    '\tsecondary = Mosaic'
+]
+
+
+class FindTypeClosureTest(unittest.TestCase):
+    def test_closure_of_leaf_type_contains_only_type(self):
+        # Act:
+        closure = find_type_closure(parse_all(SCHEMA_LINES), 'Amount')
+
+        # Assert:
+        self.assertEqual(['Amount'], closure)
+
+    def test_closure_contains_all_transitively_referenced_types(self):
+        # Act:
+        closure = find_type_closure(parse_all(SCHEMA_LINES), 'Bundle')
+
+        # Assert:
+        self.assertEqual(['Bundle', 'Header', 'Mosaic', 'Shape', 'Amount'], closure)
+
+    def test_closure_of_unknown_type_is_empty(self):
+        # Act:
+        closure = find_type_closure(parse_all(SCHEMA_LINES), 'Foo')
+
+        # Assert:
+        self.assertEqual([], closure)
+
+
+class CalculateClosureHashTest(unittest.TestCase):
+    def test_hash_is_deterministic(self):
+        # Act:
+        closure_hash1 = calculate_closure_hash(parse_all(SCHEMA_LINES), 'Bundle')
+        closure_hash2 = calculate_closure_hash(parse_all(SCHEMA_LINES), 'Bundle')
+
+        # Assert:
+        self.assertEqual(closure_hash1, closure_hash2)
+
+    def test_hash_changes_when_type_in_closure_changes(self):
+        # Act:
+        closure_hash1 = calculate_closure_hash(parse_all(SCHEMA_LINES), 'Bundle')
+        closure_hash2 = calculate_closure_hash(parse_all(['using Amount = uint32'] + SCHEMA_LINES[1:]), 'Bundle')
+
+        # Assert:
+        self.assertNotEqual(closure_hash1, closure_hash2)
+
+    def test_hash_does_not_change_when_type_outside_closure_changes(self):
+        # Act:
+        closure_hash1 = calculate_closure_hash(parse_all(SCHEMA_LINES), 'Bundle')
+        closure_hash2 = calculate_closure_hash(parse_all([SCHEMA_LINES[0], 'using Height = uint32'] + SCHEMA_LINES[2:]), 'Bundle')
+
+        # Assert:
+        self.assertEqual(closure_hash1, closure_hash2)
+
+    def test_hash_of_compact_descriptors_is_equal_to_hash_of_dict_descriptors(self):
+        # Act:
+        closure_hash1 = calculate_closure_hash(parse_all(SCHEMA_LINES), 'Bundle')
+        closure_hash2 = calculate_closure_hash(compact_type_descriptors(parse_all(SCHEMA_LINES)), 'Bundle')
+
+        # Assert:
+        self.assertEqual(closure_hash1, closure_hash2)